@@ -0,0 +1,6 @@
+"""Allows running the CLI as `python -m autoalgo` from the project root."""
+import sys
+
+from src.cli import main
+
+sys.exit(main())
@@ -8,18 +8,65 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 from src.orchestrator import Orchestrator
+from src.problems.registry import get_problem
+from src.agents.llm_client import FakeLLMClient, LLMClient
 
 def main():
-    """Main entry point to run an AutoAlgo experiment."""
+    """Main entry point to run an AutoAlgo experiment with the settings below."""
     
     # Set a seed for reproducibility
     SEED = 42
 
     problem_name = "shortest_path"
     base_experiment_id = "comparison_001"
+    # Number of candidates evaluated concurrently, each in its own process
+    max_workers = 1
+    # Run the test suite in a warm worker instead of a pytest subprocess per candidate
+    fast_correctness = False
+    # Evaluate candidates in resource-limited worker processes (implied by max_workers > 1)
+    sandbox = False
+    # Benchmark sweep: sizes double up to max_size; a candidate that exhausts its
+    # time budget has its remaining sizes extrapolated from the fitted curve.
+    # profile reports each candidate's hot functions on the largest measured
+    # input; profile_lines adds (slower) per-line timings. fuzz_cases checks
+    # each candidate against the reference solution on random graphs first
+    benchmark_options = {"max_size": 512, "time_budget_s": 20, "profile": True, "profile_lines": False,
+                         "fuzz_cases": 1000}
+    # Skip candidates already checkpointed by an earlier, interrupted run
+    resume = False
+    # Breed improved variants of the best candidates over several generations
+    # until the leader's runtime plateaus or a budget runs out
+    optimize = False
+    optimization_options = {"max_generations": 5, "top_k": 2, "patience": 2, "min_improvement": 0.01,
+                            "max_evaluations": 20, "time_budget_s": 600}
+    # Simulated LLM latency per request in seconds (None: no LLM client). With a
+    # client, candidates are evaluated as soon as the designer returns them
+    llm_latency_s = None
+
+    llm_client = None
+    if llm_latency_s is not None:
+        backend = FakeLLMClient(get_problem(problem_name).simulated_code, latency_s=llm_latency_s, jitter_s=llm_latency_s, seed=SEED)
+        # Responses are cached on disk, so re-running the same experiment issues no requests
+        llm_client = LLMClient(backend, max_concurrency=2, batch_size=2,
+                               cache_dir=os.path.join(PROJECT_ROOT, "experiments", "llm_cache"))
     
-    orchestrator = Orchestrator(problem_name=problem_name)
-    orchestrator.run_comparison_experiment(base_experiment_id=base_experiment_id, seed=SEED)
+    orchestrator = Orchestrator(
+        problem_name=problem_name,
+        max_workers=max_workers,
+        fast_correctness=fast_correctness,
+        sandbox=sandbox,
+        benchmark_options=benchmark_options,
+        llm_client=llm_client,
+        stream_candidates=llm_client is not None
+    )
+    if optimize:
+        orchestrator.run_optimization(base_experiment_id=base_experiment_id, seed=SEED, resume=resume, **optimization_options)
+    else:
+        orchestrator.run_comparison_experiment(base_experiment_id=base_experiment_id, seed=SEED, resume=resume)
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # With arguments, run.py behaves like `python -m autoalgo`
+        from src.cli import main as cli_main
+        sys.exit(cli_main())
     main()
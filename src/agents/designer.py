@@ -1,29 +1,44 @@
 """
 Designer agent.
 """
+import asyncio
+import re
 import textwrap
 
+from src.agents.llm_client import extract_code
+from src.problems.registry import get_problem
+
 class DesignerAgent:
     """
     The Designer agent is responsible for proposing an algorithm design
     based on a given problem specification.
     """
 
-    def __init__(self, llm_client=None):
+    def __init__(self, llm_client=None, variations: list[str] = None, problem: str = "shortest_path"):
         """
         Initializes the DesignerAgent.
 
         Args:
-            llm_client: A client for a large language model API. For the MVP,
-                        this is simulated.
+            llm_client: A client for a large language model API, with an async
+                        `complete(prompt)` method (see `src.agents.llm_client`).
+                        If omitted, responses are simulated.
+            variations: Optional subset of the problem's variations to propose.
+            problem: Name of the registered problem (see `src.problems.registry`)
+                     whose variations and simulated solutions are used.
         """
         self.llm_client = llm_client
+        self.problem = get_problem(problem)
+        unknown = sorted(set(variations or []) - set(self.problem.variations))
+        if unknown:
+            raise ValueError(f"Unknown variations {unknown}; available: {sorted(self.problem.variations)}")
+        self.variations = list(variations) if variations else list(self.problem.variations)
 
-    def _create_prompt(self, problem_spec: str) -> str:
+    def _create_prompt(self, problem_spec: str, variation_id: str = None) -> str:
         """
-        Creates a prompt for the LLM to generate an algorithm.
+        Creates a prompt for the LLM to generate an algorithm, optionally
+        asking for a specific variation.
         """
-        return textwrap.dedent(f"""
+        prompt = textwrap.dedent(f"""
             You are an expert algorithm designer. Based on the following problem
             specification, provide a Python implementation of a suitable algorithm.
 
@@ -39,6 +54,9 @@ class DesignerAgent:
 
             Please provide only the Python code for the function.
         """).strip()
+        if variation_id is not None:
+            prompt += f"\n\nVariation: {variation_id}\nApproach: {self.problem.variations[variation_id]}"
+        return prompt
 
     def propose_algorithms(self, problem_spec: str) -> list[dict]:
         """
@@ -50,235 +68,179 @@ class DesignerAgent:
         Returns:
             A list of dictionaries, where each dict contains a variation_id and the code.
         """
-        prompt = self._create_prompt(problem_spec)
+        if self.llm_client:
+            return asyncio.run(self._collect(self.stream_algorithms(problem_spec)))
+
+        # Without a client, we simulate the LLM call by returning hardcoded solutions.
+        return self._simulate_llm_responses(problem_spec)
+
+    def propose_improvements(self, problem_spec: str, parents: list[dict], generation: int) -> list[dict]:
+        """
+        Proposes an improved variant of each parent candidate.
+
+        Args:
+            problem_spec: The detailed problem specification.
+            parents: The candidates to improve, as dicts with id, code and
+                     optionally avg_runtime_ms, runtime_exponent and hot_spots
+                     (profiled lines/functions, see `_format_hot_spot`).
+            generation: Index of the generation being bred, used in variation ids.
 
+        Returns:
+            A list of dictionaries with the variation_id, parent_id, code and prompt.
+        """
         if self.llm_client:
-            # In a real implementation, you would call the LLM here, perhaps in a loop
-            # or with a more complex prompt asking for multiple variations.
-            pass
+            return asyncio.run(self._collect(self.stream_improvements(problem_spec, parents, generation)))
+        return self._simulate_improvements(problem_spec, parents, generation)
+
+    @staticmethod
+    async def _collect(stream) -> list[dict]:
+        return [candidate async for candidate in stream]
+
+    async def stream_algorithms(self, problem_spec: str, max_in_flight: int = 4):
+        """
+        Asynchronously yields algorithm variations as the LLM returns them.
+
+        One request is sent per variation, at most max_in_flight at a time.
+        A new request is only started once a finished candidate has been
+        consumed, so a slow consumer throttles LLM usage.
 
-        # For the MVP, we simulate the LLM call by returning hardcoded solutions.
-        return self._simulate_llm_responses(prompt)
+        Args:
+            problem_spec: The detailed problem specification.
+            max_in_flight: Maximum number of concurrent LLM requests.
 
-    def _simulate_llm_responses(self, prompt: str) -> list[dict]:
+        Yields:
+            Dicts with the variation_id, code and prompt, in completion order.
         """
-        Simulates a response from an LLM for the shortest path problem,
-        providing multiple variations.
+        if not self.llm_client:
+            for candidate in self._simulate_llm_responses(problem_spec):
+                yield candidate
+            return
+        requests = [
+            {"variation_id": variation_id, "prompt": self._create_prompt(problem_spec, variation_id)}
+            for variation_id in self.variations
+        ]
+        async for candidate in self._stream_requests(requests, max_in_flight):
+            yield candidate
+
+    async def stream_improvements(self, problem_spec: str, parents: list[dict], generation: int,
+                                  max_in_flight: int = 4):
+        """Like `stream_algorithms`, but yields the improved variants of `propose_improvements`."""
+        if not self.llm_client:
+            for candidate in self._simulate_improvements(problem_spec, parents, generation):
+                yield candidate
+            return
+        requests = self._improvement_requests(problem_spec, parents, generation)
+        async for candidate in self._stream_requests(requests, max_in_flight):
+            yield candidate
+
+    async def _stream_requests(self, requests: list[dict], max_in_flight: int):
+        """Sends request prompts to the LLM, at most max_in_flight at a time, yielding results as they finish."""
+        async def generate(request):
+            response = await self.llm_client.complete(request["prompt"])
+            return {**request, "code": extract_code(response)}
+
+        requests = iter(requests)
+        pending = set()
+
+        def start_next():
+            request = next(requests, None)
+            if request is not None:
+                pending.add(asyncio.ensure_future(generate(request)))
+
+        for _ in range(max(1, max_in_flight)):
+            start_next()
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    start_next()
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _improvement_requests(self, problem_spec: str, parents: list[dict], generation: int) -> list[dict]:
+        """
+        Builds one improvement request per parent. Children are named after
+        their lineage's root variation and generation, e.g. dijkstra_optimal_g2,
+        with a numeric suffix when several parents share a root.
         """
-        
-        optimal_code = textwrap.dedent('''
-            import heapq
-
-            def find_shortest_path(graph, start_node, end_node):
-                all_nodes = set(graph.keys())
-                for node in graph:
-                    all_nodes.update(graph[node].keys())
-
-                distances = {node: float('inf') for node in all_nodes}
-                if start_node not in distances:
-                    return float('inf'), []
-                distances[start_node] = 0
-                
-                previous_nodes = {node: None for node in all_nodes}
-                priority_queue = [(0, start_node)]
-                
-                while priority_queue:
-                    current_distance, current_node = heapq.heappop(priority_queue)
-                    
-                    if current_distance > distances[current_node]:
-                        continue
-                    
-                    if current_node == end_node:
-                        break
-                        
-                    for neighbor, weight in graph.get(current_node, {}).items():
-                        distance = current_distance + weight
-                        
-                        if distance < distances.get(neighbor, float('inf')):
-                            distances[neighbor] = distance
-                            previous_nodes[neighbor] = current_node
-                            heapq.heappush(priority_queue, (distance, neighbor))
-                
-                path = []
-                current = end_node
-                if current not in previous_nodes:
-                    return float('inf'), []
-
-                while current is not None:
-                    path.insert(0, current)
-                    current = previous_nodes[current]
-                
-                if distances.get(end_node, float('inf')) == float('inf'):
-                    return float('inf'), []
-                
-                if start_node == end_node:
-                    return 0, [start_node]
-
-                if path and path[0] == start_node:
-                    return distances[end_node], path
-                else:
-                    return float('inf'), []
-        ''')
-
-        inefficient_code = textwrap.dedent('''
-            # Inefficient version using a list instead of a priority queue
-            def find_shortest_path(graph, start_node, end_node):
-                all_nodes = set(graph.keys())
-                for node in graph:
-                    all_nodes.update(graph[node].keys())
-
-                distances = {node: float('inf') for node in all_nodes}
-                if start_node not in distances:
-                    return float('inf'), []
-                distances[start_node] = 0
-                
-                previous_nodes = {node: None for node in all_nodes}
-                nodes_to_visit = list(all_nodes)
-
-                while nodes_to_visit:
-                    # Find node with smallest distance
-                    current_node = min(nodes_to_visit, key=lambda node: distances[node])
-                    nodes_to_visit.remove(current_node)
-
-                    if distances[current_node] == float('inf') or current_node == end_node:
-                        break
-
-                    for neighbor, weight in graph.get(current_node, {}).items():
-                        distance = distances[current_node] + weight
-                        if distance < distances.get(neighbor, float('inf')):
-                            distances[neighbor] = distance
-                            previous_nodes[neighbor] = current_node
-
-                path = []
-                current = end_node
-                if current not in previous_nodes:
-                    return float('inf'), []
-                while current is not None:
-                    path.insert(0, current)
-                    current = previous_nodes[current]
-
-                if distances.get(end_node, float('inf')) == float('inf'):
-                    return float('inf'), []
-                if start_node == end_node:
-                    return 0, [start_node]
-                if path and path[0] == start_node:
-                    return distances[end_node], path
-                else:
-                    return float('inf'), []
-        ''')
-
-        buggy_code = textwrap.dedent('''
-            import heapq
-
-            # Buggy version: Fails the start_node == end_node test
-            def find_shortest_path(graph, start_node, end_node):
-                if start_node == end_node:
-                    # Incorrectly returns an empty path
-                    return 0, [] 
-
-                all_nodes = set(graph.keys())
-                for node in graph:
-                    all_nodes.update(graph[node].keys())
-
-                distances = {node: float('inf') for node in all_nodes}
-                if start_node not in distances:
-                    return float('inf'), []
-                distances[start_node] = 0
-                
-                previous_nodes = {node: None for node in all_nodes}
-                priority_queue = [(0, start_node)]
-                
-                while priority_queue:
-                    current_distance, current_node = heapq.heappop(priority_queue)
-                    
-                    if current_distance > distances[current_node]:
-                        continue
-                    
-                    if current_node == end_node:
-                        break
-                        
-                    for neighbor, weight in graph.get(current_node, {}).items():
-                        distance = current_distance + weight
-                        
-                        if distance < distances.get(neighbor, float('inf')):
-                            distances[neighbor] = distance
-                            previous_nodes[neighbor] = current_node
-                            heapq.heappush(priority_queue, (distance, neighbor))
-                
-                path = []
-                current = end_node
-                if current not in previous_nodes:
-                    return float('inf'), []
-
-                while current is not None:
-                    path.insert(0, current)
-                    current = previous_nodes[current]
-                
-                if distances.get(end_node, float('inf')) == float('inf'):
-                    return float('inf'), []
-
-                if path and path[0] == start_node:
-                    return distances[end_node], path
-                else:
-                    return float('inf'), []
-        ''')
-
-        bellman_ford_code = textwrap.dedent('''
-            # Bellman-Ford algorithm, capable of handling negative weights.
-            def find_shortest_path(graph, start_node, end_node):
-                all_nodes = set(graph.keys())
-                for node in graph:
-                    all_nodes.update(graph[node].keys())
-
-                distances = {node: float('inf') for node in all_nodes}
-                if start_node not in distances:
-                    return float('inf'), []
-                distances[start_node] = 0
-                
-                previous_nodes = {node: None for node in all_nodes}
-
-                for _ in range(len(all_nodes) - 1):
-                    for node in all_nodes:
-                        for neighbor, weight in graph.get(node, {}).items():
-                            if distances[node] != float('inf') and distances[node] + weight < distances[neighbor]:
-                                distances[neighbor] = distances[node] + weight
-                                previous_nodes[neighbor] = node
-
-                # Check for negative weight cycles (optional for this problem spec)
-                # but good practice.
-                for node in all_nodes:
-                    for neighbor, weight in graph.get(node, {}).items():
-                        if distances[node] != float('inf') and distances[node] + weight < distances[neighbor]:
-                            # Negative cycle detected
-                            return float('-inf'), []
-
-                path = []
-                current = end_node
-                if current not in previous_nodes and start_node != end_node:
-                     # Handle unreachable nodes when start/end are different
-                    if distances[end_node] == float('inf'):
-                         return float('inf'), []
-                
-                while current is not None:
-                    path.insert(0, current)
-                    current = previous_nodes[current]
-
-                if distances.get(end_node, float('inf')) == float('inf'):
-                    return float('inf'), []
-                
-                if start_node == end_node:
-                    return 0, [start_node]
-
-                if path and path[0] == start_node:
-                    return distances[end_node], path
-                else:
-                    return float('inf'), []
-        ''')
+        requests = []
+        taken = set()
+        for parent in parents:
+            base_id = f"{re.sub(r'_g[0-9]+(_[0-9]+)?$', '', parent['id'])}_g{generation}"
+            variation_id, suffix = base_id, 1
+            while variation_id in taken:
+                variation_id, suffix = f"{base_id}_{suffix}", suffix + 1
+            taken.add(variation_id)
+            requests.append(self._improvement_request(problem_spec, parent, variation_id))
+        return requests
+
+    def _improvement_request(self, problem_spec: str, parent: dict, variation_id: str) -> dict:
+        """Builds the prompt asking the LLM to speed up a parent candidate."""
+        measurements = []
+        if parent.get("avg_runtime_ms") is not None:
+            measurements.append(f"Average runtime: {parent['avg_runtime_ms']:.3f} ms")
+        if parent.get("runtime_exponent") not in (None, float("inf")):
+            measurements.append(f"Empirical runtime growth: n^{parent['runtime_exponent']:.2f}")
+        hot_spots = [self._format_hot_spot(h) for h in parent.get("hot_spots") or []]
+        prompt = textwrap.dedent(f"""
+            You are an expert algorithm designer. The following Python implementation
+            is correct for the problem specification below. Rewrite it to run faster
+            while keeping the same function signature and output format.
+
+            Problem Specification:
+            ---
+            {{problem_spec}}
+            ---
+
+            Current implementation ({parent["id"]}):
+            ---
+            {{code}}
+            ---
+
+            Measurements:
+            {{measurements}}
 
+            Profiling hot spots:
+            {{hot_spots}}
+
+            Please provide only the Python code for the function.
+        """).strip().format(
+            problem_spec=problem_spec,
+            code=parent["code"].strip(),
+            measurements="\n".join(measurements) or "n/a",
+            hot_spots="\n".join(hot_spots) or "n/a",
+        )
+        prompt += f"\n\nVariation: {variation_id}\nParent: {parent['id']}"
+        return {"variation_id": variation_id, "parent_id": parent["id"], "prompt": prompt}
+
+    @staticmethod
+    def _format_hot_spot(hot_spot: dict) -> str:
+        """Renders a profiled hot spot (function, line, share of runtime and source) for a prompt."""
+        location = hot_spot.get("function", "?")
+        if hot_spot.get("line"):
+            location += f" (line {hot_spot['line']})"
+        text = f"- {location}: {hot_spot.get('percent', 0.0):.1f}% of runtime"
+        if hot_spot.get("source"):
+            text += f": {hot_spot['source']}"
+        return text
+
+    def _simulate_llm_responses(self, problem_spec: str) -> list[dict]:
+        """
+        Simulates a response from an LLM by returning the problem's hardcoded
+        solution of each variation.
+        """
+        code = self.problem.simulated_code
         return [
-            {"variation_id": "dijkstra_optimal", "code": optimal_code, "prompt": prompt},
-            {"variation_id": "dijkstra_inefficient_list", "code": inefficient_code, "prompt": prompt},
-            {"variation_id": "dijkstra_buggy_edge_case", "code": buggy_code, "prompt": prompt},
-            {"variation_id": "bellman_ford_correct", "code": bellman_ford_code, "prompt": prompt},
+            {"variation_id": variation_id, "code": code[variation_id], "prompt": self._create_prompt(problem_spec, variation_id)}
+            for variation_id in self.variations
         ]
 
+    def _simulate_improvements(self, problem_spec: str, parents: list[dict], generation: int) -> list[dict]:
+        """
+        Simulates improvement responses. The simulated designer cannot rewrite
+        code, so every parent is returned unchanged.
+        """
+        requests = self._improvement_requests(problem_spec, parents, generation)
+        return [{**request, "code": parent["code"]} for request, parent in zip(requests, parents)]
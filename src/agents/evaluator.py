@@ -1,27 +1,128 @@
 """
 Evaluator agent.
 """
-import timeit
-import tracemalloc
+import time
+import traceback
 from importlib import import_module
 import os
 
 from src.utils import run_shell_command
-from src.problems.shortest_path.input_generators import generate_shortest_path_inputs
+from src.test_runner import SOLUTION_MODULE_ENV_VAR
+from src.benchmarking.corpus import CorpusStore, build_corpus
+from src.benchmarking.timing import DEFAULT_TIMING_OPTIONS, measure
+from src.benchmarking.complexity import fit_complexity, geometric_sizes, predict
+from src.benchmarking.profiling import profile_candidate
+from src.benchmarking.memory import measure_rss, measure_traced_memory
+from src.benchmarking.batch import batch_api, check_batch, measure_batch
+from src.fuzzing import format_counterexample, fuzz
+from src.problems.registry import get_problem
 
 class EvaluatorAgent:
     """
     The Evaluator agent runs correctness tests and performance benchmarks.
     """
 
-    def __init__(self, solution_module_path: str, test_path: str):
+    def __init__(self, solution_module_path: str, test_path: str = None, test_runner=None, seed: int = None,
+                 corpus_dir: str = None, timing_options: dict = None, sizes: list[int] = None,
+                 max_size: int = None, time_budget_s: float = None, edge_density: float = None,
+                 inputs_per_size: int = 5, profile: bool = False, profile_lines: bool = False, rss: bool = True,
+                 topologies: list[str] = None, avg_degree: float = None, batch_queries: int = 0,
+                 fuzz_cases: int = 0, fuzz_max_size: int = 32, smoke_cases: int = 0, quick_size: int = None,
+                 problem: str = "shortest_path"):
         """
         Args:
             solution_module_path: The import path for the solution to be tested.
-            test_path: The file path to the pytest test suite.
+            test_path: The file path to the pytest test suite; defaults to the
+                       problem's.
+            test_runner: Optional runner from `src.test_runner` that executes the
+                         suite in a warm process. If omitted, pytest is spawned
+                         as a subprocess.
+            seed: Seed for the benchmark input corpus. Candidates evaluated with
+                  the same seed are timed on identical inputs.
+            corpus_dir: Optional directory of a persistent `CorpusStore`. Benchmark
+                        graphs are then generated once and memory-mapped on later runs.
+            timing_options: Overrides for `src.benchmarking.timing.measure`
+                            (warmup, min_repeats, max_repeats, target_rel_error, ...).
+            sizes: Benchmark input sizes (number of nodes for graphs). Defaults to
+                   a geometric series so that growth rates can be fitted.
+            max_size: Extends the default geometric series (the problem's
+                      size_start and size_factor) up to this size. Ignored if
+                      sizes is given.
+            time_budget_s: Per-candidate benchmark budget in seconds. Sizes are
+                           measured in increasing order until the budget would be
+                           exceeded; the remaining sizes are extrapolated from the
+                           fitted curve instead. The two smallest sizes are always
+                           measured.
+            edge_density: Edge probability of the benchmark graphs (graph
+                          problems only); defaults to the problem's
+                          default_input_options, like avg_degree.
+            inputs_per_size: Number of distinct benchmark inputs generated per size.
+            profile: After benchmarking, profile one call on the largest measured
+                     input with cProfile and report its hot functions.
+            profile_lines: Also time individual source lines of the solution
+                           (slow; implies profile).
+            rss: Also measure each size's RSS growth in a fresh interpreter
+                 (requires psutil).
+            topologies: Input families to benchmark on, among the problem's
+                        input_families (graph topologies for shortest_path).
+                        Defaults to the problem's first family.
+            avg_degree: Expected out-degree of the sparse, power-law and DAG
+                        topologies (graph problems only).
+            batch_queries: If set, also time batches of this many queries
+                           against one prebuilt graph per size, using the
+                           solution's optional build_index/query API (see
+                           `src.benchmarking.batch`). The batch sweep has its
+                           own time_budget_s. Requires a problem with a
+                           query_batch hook.
+            fuzz_cases: If set, candidates passing the test suite are also
+                        compared with the reference solution on this many
+                        random inputs (see `src.fuzzing`) before benchmarking;
+                        a counterexample fails the candidate.
+            fuzz_max_size: Largest input generated by the fuzzer.
+            smoke_cases: If set, a smoke test compares the solution with the
+                         reference on this many tiny inputs before the test
+                         suite runs.
+            quick_size: If set, `evaluate_quick` ends with a quick benchmark at
+                        this size, which the orchestrator uses to prune
+                        hopeless candidates before the full sweep.
+            problem: Name of the registered problem (see `src.problems.registry`)
+                     that supplies the entry point, inputs, reference oracle
+                     and complexity models.
         """
+        self.problem = get_problem(problem)
+        self.entry_point = self.problem.entry_point
         self.solution_module_path = solution_module_path
-        self.test_path = test_path
+        self.test_path = test_path or str(self.problem.test_path)
+        self.test_runner = test_runner
+        self.seed = 0 if seed is None else seed
+        self.corpus_store = CorpusStore(corpus_dir) if corpus_dir else None
+        self.timing_options = {**DEFAULT_TIMING_OPTIONS, **(timing_options or {})}
+        if sizes:
+            self.sizes = sorted(sizes)
+        elif max_size:
+            self.sizes = [n for n in geometric_sizes(self.problem.size_start, self.problem.size_factor, count=32)
+                          if n <= max_size]
+        else:
+            self.sizes = geometric_sizes(self.problem.size_start, self.problem.size_factor, count=5)
+        self.time_budget_s = time_budget_s
+        self.edge_density = edge_density
+        self.inputs_per_size = inputs_per_size
+        self.profile = profile or profile_lines
+        self.profile_lines = profile_lines
+        self.rss = rss
+        self.topologies = list(topologies or self.problem.input_families[:1])
+        unknown = [t for t in self.topologies if t not in self.problem.input_families]
+        if unknown:
+            raise ValueError(f"Unknown topologies {unknown}; choose from {list(self.problem.input_families)}")
+        self.avg_degree = avg_degree
+        self.input_options = self.problem.input_options(edge_density=edge_density, avg_degree=avg_degree)
+        if batch_queries and self.problem.query_batch is None:
+            raise ValueError(f"Problem {self.problem.name!r} has no batch query mode")
+        self.batch_queries = batch_queries
+        self.fuzz_cases = fuzz_cases
+        self.fuzz_max_size = fuzz_max_size
+        self.smoke_cases = smoke_cases
+        self.quick_size = quick_size
         self.solution_func = None
 
     def _load_solution(self):
@@ -30,15 +131,20 @@ class EvaluatorAgent:
             return
         try:
             module = import_module(self.solution_module_path)
-            self.solution_func = module.find_shortest_path
+            self.solution_func = getattr(module, self.entry_point)
         except (ImportError, AttributeError) as e:
             raise RuntimeError(f"Could not load solution function from {self.solution_module_path}") from e
 
     def run_correctness_tests(self) -> dict:
         """Runs the pytest suite for correctness checking."""
         print("   - Running correctness tests with a 60-second timeout...")
+        if self.test_runner is not None:
+            result = self.test_runner.run(self.test_path, self.solution_module_path, timeout=60)
+            print(f"     - {result['num_passed']}/{result['num_tests']} tests passed")
+            return result
+
         command = f"py -m pytest {self.test_path}"
-        result = run_shell_command(command, timeout=60)
+        result = run_shell_command(command, timeout=60, env={SOLUTION_MODULE_ENV_VAR: self.solution_module_path})
         
         # Check for timeout or other errors
         if result["returncode"] != 0:
@@ -47,59 +153,367 @@ class EvaluatorAgent:
             # A bit simplistic: we assume any failed test means 0% pass rate for the MVP
             passed = "failed" not in result['stdout'] and "error" not in result['stdout']
         
-        return {"passed": passed, "details": result['stdout'] + "\n" + result['stderr']}
+        return {
+            "passed": passed,
+            "pass_rate": 1.0 if passed else 0.0,
+            "tests": [],
+            "details": result['stdout'] + "\n" + result['stderr']
+        }
+
+    def run_fuzzing(self) -> dict:
+        """Differentially tests the solution against the reference, see `src.fuzzing.fuzz`."""
+        self._load_solution()
+        print(f"   - Fuzzing against the reference solution ({self.fuzz_cases} random inputs)...")
+        result = fuzz(self.problem, self.solution_func, self.fuzz_cases, max_size=self.fuzz_max_size, seed=self.seed)
+        if result["passed"]:
+            print(f"     - {result['num_cases']} cases passed in {result['elapsed_s']:.2f}s")
+        else:
+            print(f"     - Counterexample after {result['num_cases']} cases: {result['counterexample']['reason']}")
+        return result
+
+    def run_performance_benchmarks(self, num_runs: int = None) -> dict:
+        """
+        Runs runtime and memory benchmarks.
 
-    def run_performance_benchmarks(self, num_runs=5) -> dict:
-        """Runs runtime and memory benchmarks."""
+        Inputs are generated up front from the evaluator's seed, so only the
+        solution call is timed and traced; the generation cost is reported
+        separately as gen_ms. Each scale is timed with warmup and adaptive
+        repeats; runtime_ms holds the mean and runtime_stats the full summary
+        (min/median/p95/stddev and a bootstrap CI of the median). mem_kb is the
+        traced heap peak of one call above the heap in use before it, and
+        rss_kb the peak RSS growth of one call in a fresh interpreter (see
+        `src.benchmarking.memory`). The top allocation sites are captured at
+        the largest measured size. Runtime and memory are then fitted against
+        the complexity models across sizes.
+
+        The sweep is repeated for every benchmark topology, each with its own
+        time budget. The top-level results belong to the first (primary)
+        topology; with several topologies, "topologies" maps each of them to
+        its own sweep results.
+
+        Args:
+            num_runs: Number of distinct inputs generated per scale; defaults to
+                      inputs_per_size.
+        """
+        num_runs = num_runs or self.inputs_per_size
         self._load_solution()
         print("   - Running performance benchmarks...")
-        
+
+        sweeps = {}
+        corpora = {}
+        for topology in self.topologies:
+            if len(self.topologies) > 1:
+                print(f"     - Input family {topology}:")
+            sweeps[topology], corpora[topology] = self._benchmark_sweep(topology, num_runs)
+
+        primary = self.topologies[0]
+        results = dict(sweeps[primary])
+        runtime_stats, corpus = results["runtime_stats"], corpora[primary]
+        results["allocations"] = []
+        if runtime_stats:
+            largest = corpus[list(runtime_stats)[-1]]["inputs"][0]
+            results["allocations"] = measure_traced_memory(self.solution_func, largest, top_n=10)["allocations"]
+        if len(self.topologies) > 1:
+            results["topologies"] = sweeps
+        if self.batch_queries and runtime_stats:
+            results["batch"] = self.run_batch_benchmarks(corpus, runtime_stats)
+        if self.profile and runtime_stats:
+            results["profile"] = self.run_profiling(corpus[list(runtime_stats)[-1]]["inputs"][0])
+        return results
+
+    def _benchmark_sweep(self, topology: str, num_runs: int) -> tuple[dict, dict]:
+        """
+        Benchmarks every size on inputs of one family (graph topology).
+
+        Returns:
+            The sweep results (runtime_ms, runtime_stats, mem_kb, rss_kb, gen_ms,
+            complexity and the extrapolated sizes) and the corpus it used.
+        """
         runtime_results = {}
+        runtime_stats = {}
         memory_results = {}
-        test_scales = {"10": 10, "50": 50, "100": 100} # Use size as string key
+        rss_results = {}
+        generation_results = {}
+        test_scales = {str(n): n for n in self.sizes} # Use size as string key
+        corpus = {}
+        fits = {}
+        started = time.perf_counter()
+        # Calls made per size: warmup, the minimum timed repeats and the memory runs
+        min_calls = self.timing_options["warmup"] + self.timing_options["min_repeats"] + 1 + (1 if self.rss else 0)
+
+        models = self.problem.complexity_models
+
+        def work_size(size):
+            if self.problem.expected_work_size is None:
+                return 0
+            return self.problem.expected_work_size(size, topology, **self.input_options)
+
+        for scale_key, size in test_scales.items():
+            # At least two sizes are measured so that a fit exists for the skipped ones
+            if self.time_budget_s is not None and len(runtime_stats) >= 2:
+                spent = time.perf_counter() - started
+                projected = spent
+                if fits.get("runtime"):
+                    projected += predict(fits["runtime"], size, work_size(size), models) / 1000 * min_calls
+                if projected > self.time_budget_s:
+                    print(f"     - Time budget of {self.time_budget_s}s reached after {spent:.1f}s; "
+                          f"extrapolating sizes >= {size}")
+                    break
+
+            corpus.update(build_corpus(self.problem, {scale_key: size}, inputs_per_scale=num_runs, seed=self.seed,
+                                       store=self.corpus_store, family=topology, **self.input_options))
+            inputs = corpus[scale_key]["inputs"]
+            generation_results[scale_key] = corpus[scale_key]["gen_ms"]
 
-        for scale_key, num_nodes in test_scales.items():
             # Runtime benchmark
-            total_time = timeit.timeit(
-                lambda: self.solution_func(*generate_shortest_path_inputs(num_nodes, 0.5)),
-                number=num_runs
-            )
-            avg_time = total_time / num_runs
-            runtime_results[scale_key] = avg_time * 1000 # ms
+            stats = measure(self.solution_func, inputs, seed=self.seed, **self.timing_options)
+            runtime_stats[scale_key] = stats
+            runtime_results[scale_key] = stats["mean"] # ms
 
             # Memory benchmark
-            tracemalloc.start()
-            self.solution_func(*generate_shortest_path_inputs(num_nodes, 0.5))
-            current, peak = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
-            memory_results[scale_key] = peak / 1024 # KB
+            memory_results[scale_key] = measure_traced_memory(self.solution_func, inputs[0])["peak_kb"]
+            rss = measure_rss(self.solution_module_path, self.entry_point, inputs[0]) if self.rss else None
+            if rss is not None:
+                rss_results[scale_key] = rss["peak_delta_kb"]
 
-            print(f"     - Size {num_nodes}: {runtime_results[scale_key]:.2f}ms, {memory_results[scale_key]:.2f}KB peak memory")
+            print(f"     - Size {size}: median {stats['median']:.2f}ms "
+                  f"[{stats['ci_low']:.2f}, {stats['ci_high']:.2f}] p95 {stats['p95']:.2f}ms over {stats['n']} runs, "
+                  f"{memory_results[scale_key]:.2f}KB peak heap"
+                  + (f", {rss_results[scale_key]:.0f}KB peak RSS growth" if scale_key in rss_results else "")
+                  + f" (input preparation {generation_results[scale_key]:.2f}ms, not timed)")
 
-        return {"runtime_ms": runtime_results, "mem_kb": memory_results}
+            fits = self._fit_complexity(test_scales, corpus, runtime_stats, memory_results)
 
-    def evaluate(self) -> dict:
-        """Runs a full evaluation and returns a dictionary of raw results."""
+        complexity = fits
+        for metric, fit in complexity.items():
+            if fit:
+                print(f"     - Fitted {metric}: ~O({fit['model']}), empirical exponent {fit['exponent']:.2f}")
+
+        # Sizes skipped because of the time budget are extrapolated from the fits
+        extrapolated_sizes = [n for k, n in test_scales.items() if k not in runtime_stats]
+        runtime_extrapolated = {}
+        memory_extrapolated = {}
+        for size in extrapolated_sizes:
+            if complexity.get("runtime"):
+                runtime_extrapolated[str(size)] = predict(complexity["runtime"], size, work_size(size), models)
+            if complexity.get("memory"):
+                memory_extrapolated[str(size)] = predict(complexity["memory"], size, work_size(size), models)
+
+        results = {
+            "runtime_ms": runtime_results,
+            "runtime_stats": runtime_stats,
+            "mem_kb": memory_results,
+            "rss_kb": rss_results,
+            "gen_ms": generation_results,
+            "complexity": complexity,
+            "extrapolated_sizes": extrapolated_sizes,
+            "runtime_ms_extrapolated": runtime_extrapolated,
+            "mem_kb_extrapolated": memory_extrapolated
+        }
+        return results, corpus
+
+    def run_batch_benchmarks(self, corpus: dict, runtime_stats: dict) -> dict:
+        """
+        Times batches of queries against one prebuilt graph per measured size.
+
+        Preprocessing (build_index) and the queries are timed separately. The
+        answers to a sample of the queries are checked against the solution's
+        single-query function. Sizes are measured in increasing order until a
+        batch, projected from the previous size (or from the single-query
+        runtime), would exceed time_budget_s; the amortized runtime of the
+        remaining sizes is extrapolated from the single-query runtime growth.
+
+        Args:
+            corpus: The primary topology's benchmark corpus.
+            runtime_stats: Its single-query timing summaries by size.
+
+        Returns:
+            A dict with "native" (whether the solution implements the batch
+            API), "num_queries", per-size results in "sizes" (see
+            `measure_batch`), the "skipped_sizes" with their extrapolated
+            "amortized_ms_extrapolated" and any answer "mismatches".
+        """
+        module = import_module(self.solution_module_path)
+        build_index, query, native = batch_api(module, self.entry_point)
+        print(f"   - Running batch benchmarks ({self.batch_queries} queries per graph, "
+              f"{'build_index/query' if native else 'single-query fallback'})...")
+
+        sizes, mismatches, skipped = {}, [], []
+        started = time.perf_counter()
+        calls = self.timing_options["warmup"] + self.timing_options["min_repeats"]
+        previous = None
+        for scale_key in runtime_stats:
+            num_nodes = int(scale_key)
+            if previous is not None:
+                growth = runtime_stats[scale_key]["median"] / max(runtime_stats[previous]["median"], 1e-9)
+                batch_ms = sizes[previous]["batch"]["mean"] * growth
+            else:
+                batch_ms = runtime_stats[scale_key]["median"] * self.batch_queries
+            spent = time.perf_counter() - started
+            if self.time_budget_s is not None and spent + batch_ms / 1000 * calls > self.time_budget_s:
+                skipped = [int(k) for k in list(runtime_stats)[list(runtime_stats).index(scale_key):]]
+                print(f"     - Time budget of {self.time_budget_s}s reached after {spent:.1f}s; skipping sizes {skipped}")
+                break
+
+            graph = corpus[scale_key]["inputs"][0][0]
+            queries = self.problem.query_batch(num_nodes, self.batch_queries, (self.seed, num_nodes, 0, 1))
+            mismatches += check_batch(build_index, query, graph, queries[:10], self.problem.oracle,
+                                      self.problem.check_answer)
+            sizes[scale_key] = measure_batch(build_index, query, graph, queries, self.timing_options, seed=self.seed)
+            previous = scale_key
+            print(f"     - Size {num_nodes}: preprocessing {sizes[scale_key]['preprocess_ms']:.2f}ms, "
+                  f"{sizes[scale_key]['per_query_ms']:.3f}ms per query, "
+                  f"{sizes[scale_key]['amortized_ms']:.3f}ms per query amortized")
+
+        # Skipped sizes are extrapolated with the growth of the single-query runtime
+        extrapolated = {}
+        if previous is not None:
+            for num_nodes in skipped:
+                growth = runtime_stats[str(num_nodes)]["median"] / max(runtime_stats[previous]["median"], 1e-9)
+                extrapolated[str(num_nodes)] = sizes[previous]["amortized_ms"] * growth
+
+        if mismatches:
+            print(f"     - {len(mismatches)} batch answers differ from the reference solution")
+        return {"native": native, "num_queries": self.batch_queries, "sizes": sizes, "skipped_sizes": skipped,
+                "amortized_ms_extrapolated": extrapolated, "mismatches": mismatches}
+
+    def run_profiling(self, args: tuple) -> dict:
+        """Profiles one solution call, see `src.benchmarking.profiling.profile_candidate`."""
+        self._load_solution()
+        print(f"   - Profiling one call{' with line timings' if self.profile_lines else ''}...")
+        profile = profile_candidate(self.solution_func, args, lines=self.profile_lines)
+        for hot_spot in profile["hot_spots"][:3]:
+            print(f"     - {hot_spot['percent']:.1f}% in {hot_spot['function']} (line {hot_spot['line']})")
+        return profile
+
+    def _fit_complexity(self, test_scales: dict, corpus: dict, runtime_stats: dict, memory_results: dict) -> dict:
+        """Fits median runtime and peak memory against the problem's complexity models."""
+        scale_keys = list(runtime_stats)
+        sizes = [test_scales[k] for k in scale_keys]
+        edges = None
+        if self.problem.work_size is not None:
+            edges = [corpus[k]["work_size"] for k in scale_keys]
+        models = self.problem.complexity_models
+        return {
+            "runtime": fit_complexity(sizes, [runtime_stats[k]["median"] for k in scale_keys], edges, models),
+            "memory": fit_complexity(sizes, [memory_results[k] for k in scale_keys], edges, models),
+        }
+
+    def check_import(self) -> str:
+        """Imports the solution; returns None or the error (e.g. a syntax error) that prevented it."""
+        try:
+            self._load_solution()
+        except RuntimeError as e:
+            cause = e.__cause__ or e
+            return f"{e}\n" + "".join(traceback.format_exception_only(type(cause), cause))
+        except Exception as e:
+            return "".join(traceback.format_exception_only(type(e), e))
+        return None
+
+    def run_smoke_test(self) -> dict:
+        """Compares the solution with the reference on smoke_cases tiny inputs."""
+        self._load_solution()
+        print(f"   - Smoke test on {self.smoke_cases} tiny inputs...")
+        return fuzz(self.problem, self.solution_func, self.smoke_cases, max_size=6, seed=self.seed)
+
+    def run_quick_benchmark(self) -> dict:
+        """Times the solution at quick_size with a few repeats, for pruning hopeless candidates."""
+        self._load_solution()
+        corpus = build_corpus(self.problem, {str(self.quick_size): self.quick_size},
+                              inputs_per_scale=min(3, self.inputs_per_size), seed=self.seed, store=self.corpus_store,
+                              family=self.topologies[0], **self.input_options)
+        timing = {**self.timing_options, "warmup": 1, "min_repeats": 3, "max_repeats": 10, "max_time_s": 0.5,
+                  "n_bootstrap": 200}
+        stats = measure(self.solution_func, corpus[str(self.quick_size)]["inputs"], seed=self.seed, **timing)
+        print(f"   - Quick benchmark at size {self.quick_size}: median {stats['median']:.2f}ms over {stats['n']} runs")
+        return {"size": self.quick_size, "median_ms": stats["median"], "stats": stats}
+
+    def evaluate_quick(self) -> dict:
+        """
+        Runs the cheap stages of the evaluation pipeline, stopping at the first failure:
+        the import check, the smoke test, the test suite (plus fuzzing) and the
+        quick benchmark. Each enabled stage is recorded in "stages"; the
+        stage a candidate failed at is "failed_stage". A candidate failing
+        before the test suite gets correctness 0.
+
+        Returns:
+            The results so far; `evaluate_full` adds the benchmark sweep.
+        """
         print("4. Evaluating solution with EvaluatorAgent...")
+        stages = []
+
+        def stage(name, passed, started):
+            stages.append({"name": name, "passed": passed, "elapsed_s": time.perf_counter() - started})
+            return passed
+
+        def failed(name, output, tests=None, correctness=0.0, **extra):
+            print(f"   - Failed at the {name} stage. Skipping performance benchmarks.")
+            return {"correctness": correctness, "pytest_output": output, "tests": tests or [],
+                    "runtime_ms": {}, "mem_kb": {}, "stages": stages, "failed_stage": name, **extra}
+
+        started = time.perf_counter()
+        error = self.check_import()
+        if not stage("import", error is None, started):
+            return failed("import", error, [{"name": "import", "outcome": "failed", "duration_s": 0.0, "message": error}])
+
+        if self.smoke_cases:
+            started = time.perf_counter()
+            smoke = self.run_smoke_test()
+            if not stage("smoke", smoke["passed"], started):
+                report = format_counterexample(smoke["counterexample"])
+                return failed("smoke", report, [{"name": "smoke_test", "outcome": "failed",
+                                                 "duration_s": smoke["elapsed_s"], "message": report}], smoke=smoke)
+
+        started = time.perf_counter()
         correctness_results = self.run_correctness_tests()
-        
-        correctness_score = 1.0 if correctness_results["passed"] else 0.0
-        
-        if correctness_score == 0.0:
-            print("   - Correctness tests failed. Skipping performance benchmarks.")
-            return {
-                "correctness": correctness_score,
-                "pytest_output": correctness_results['details'],
-                "runtime_ms": {},
-                "mem_kb": {}
-            }
-        
-        performance_results = self.run_performance_benchmarks()
+        correctness_score = correctness_results["pass_rate"]
+        fuzzing = None
+        if correctness_results["passed"] and self.fuzz_cases:
+            fuzzing = self.run_fuzzing()
+            if not fuzzing["passed"]:
+                report = format_counterexample(fuzzing["counterexample"])
+                tests = correctness_results["tests"]
+                correctness_score = sum(t["outcome"] == "passed" for t in tests) / (len(tests) + 1)
+                correctness_results = {
+                    **correctness_results,
+                    "passed": False,
+                    "details": correctness_results["details"] + "\n" + report,
+                    "tests": tests + [{"name": "differential_fuzzing", "outcome": "failed",
+                                       "duration_s": fuzzing["elapsed_s"], "message": report}],
+                }
+        fuzz_results = {"fuzzing": fuzzing} if fuzzing is not None else {}
+        if not stage("correctness", correctness_results["passed"], started):
+            return failed("correctness", correctness_results['details'], correctness_results['tests'],
+                          correctness_score, **fuzz_results)
 
-        return {
+        results = {
             "correctness": correctness_score,
             "pytest_output": correctness_results['details'],
-            "runtime_ms": performance_results["runtime_ms"],
-            "mem_kb": performance_results["mem_kb"]
+            "tests": correctness_results['tests'],
+            "runtime_ms": {},
+            "mem_kb": {},
+            "stages": stages,
+            "failed_stage": None,
+            **fuzz_results
         }
+        if self.quick_size:
+            started = time.perf_counter()
+            results["quick"] = self.run_quick_benchmark()
+            stage("quick", True, started)
+        return results
 
+    def evaluate_full(self, results: dict) -> dict:
+        """Adds the full benchmark sweep to the results of a candidate that passed `evaluate_quick`."""
+        started = time.perf_counter()
+        performance_results = self.run_performance_benchmarks()
+        stages = results.get("stages", []) + [
+            {"name": "full", "passed": True, "elapsed_s": time.perf_counter() - started}
+        ]
+        return {**results, **performance_results, "stages": stages}
+
+    def evaluate(self) -> dict:
+        """Runs a full evaluation and returns a dictionary of raw results."""
+        results = self.evaluate_quick()
+        if results["failed_stage"] is not None:
+            return results
+        return self.evaluate_full(results)
@@ -0,0 +1,211 @@
+"""
+LLM client interface used by the DesignerAgent.
+
+A client exposes a single coroutine, `complete(prompt) -> str`. Backends may
+also implement `complete_batch(prompts) -> list[str]` to answer several prompts
+in one request. `LLMClient` wraps a backend with a concurrency limit, request
+batching, retries with exponential backoff and an on-disk response cache. The
+fake backend below answers from a fixed table after a configurable delay, so the
+designer pipeline can be exercised offline with realistic latencies.
+"""
+import asyncio
+import hashlib
+import json
+import random
+import re
+
+from src.cache import EvaluationCache
+
+_CODE_BLOCK = re.compile(r"```(?:python|py)?[ \t]*\n(.*?)```", re.DOTALL)
+
+
+def extract_code(response: str) -> str:
+    """Returns the first fenced code block of an LLM response, or the whole response."""
+    match = _CODE_BLOCK.search(response)
+    return match.group(1) if match else response
+
+
+class LLMRequestError(RuntimeError):
+    """Raised when an LLM request still fails after all retries."""
+
+
+class TransientLLMError(RuntimeError):
+    """A retryable backend failure, e.g. rate limiting or an overloaded server."""
+
+
+class LLMClient:
+    """
+    Wraps an LLM backend with a concurrency limit, request batching, retries
+    and a persistent prompt -> response cache.
+
+    Concurrent `complete` calls are collected for up to batch_window_s and sent
+    as a single `complete_batch` request if the backend supports it. Cached
+    prompts never reach the backend, so repeating an experiment with the same
+    spec does not re-issue identical requests.
+    """
+
+    def __init__(self, backend, max_concurrency: int = 4, batch_size: int = 4, batch_window_s: float = 0.05,
+                 max_retries: int = 3, backoff_s: float = 1.0, max_backoff_s: float = 30.0,
+                 timeout_s: float = None, cache_dir=None, cache_max_entries: int = 1024):
+        """
+        Args:
+            backend: Object with an async `complete(prompt)` and optionally an
+                     async `complete_batch(prompts)`. Its `model` attribute, if
+                     any, is part of the cache key.
+            max_concurrency: Maximum number of backend requests in flight.
+            batch_size: Maximum prompts per batched request; 1 disables batching.
+            batch_window_s: How long a prompt waits for others to share its batch.
+            max_retries: Retries after a transient failure or timeout.
+            backoff_s: Delay before the first retry; doubled on every retry,
+                       with random jitter, up to max_backoff_s.
+            max_backoff_s: Upper bound of the retry delay.
+            timeout_s: Optional timeout of a single backend request.
+            cache_dir: Directory of the on-disk response cache; None disables it.
+            cache_max_entries: Size bound of the response cache (LRU eviction).
+        """
+        self.backend = backend
+        self.model = getattr(backend, "model", type(backend).__name__)
+        self.max_concurrency = max(1, max_concurrency)
+        self.batch_size = batch_size if hasattr(backend, "complete_batch") else 1
+        self.batch_window_s = batch_window_s
+        self.max_retries = max_retries
+        self.backoff_s = backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.timeout_s = timeout_s
+        self.cache = EvaluationCache(cache_dir, cache_max_entries) if cache_dir else None
+        self.num_requests = 0
+        self.num_retries = 0
+        self.cache_hits = 0
+        self._loop = None
+
+    def _bind_loop(self):
+        # asyncio primitives belong to one event loop; the client may be reused
+        # across several asyncio.run calls.
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._batch = []
+            self._flush_handle = None
+            self._batch_tasks = set()
+        return loop
+
+    def _cache_key(self, prompt: str) -> str:
+        payload = json.dumps({"model": self.model, "prompt": prompt}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf8")).hexdigest()
+
+    async def complete(self, prompt: str) -> str:
+        """Returns the backend's response to prompt, from the cache if possible."""
+        loop = self._bind_loop()
+        key = self._cache_key(prompt)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache_hits += 1
+                return cached["response"]
+
+        if self.batch_size > 1:
+            future = loop.create_future()
+            self._batch.append((prompt, future))
+            if len(self._batch) >= self.batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.batch_window_s, self._flush)
+            response = await future
+        else:
+            response = await self._request(self.backend.complete, prompt)
+
+        if self.cache is not None:
+            self.cache.put(key, {"model": self.model, "prompt": prompt, "response": response})
+        return response
+
+    async def complete_batch(self, prompts: list[str]) -> list[str]:
+        """Completes several prompts concurrently, batching them where possible."""
+        return list(await asyncio.gather(*(self.complete(prompt) for prompt in prompts)))
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._batch = self._batch, []
+        if batch:
+            task = asyncio.ensure_future(self._send_batch(batch))
+            self._batch_tasks.add(task)  # keep a reference until it finishes
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _send_batch(self, batch: list):
+        prompts = [prompt for prompt, _ in batch]
+        try:
+            responses = await self._request(self.backend.complete_batch, prompts)
+            if len(responses) != len(prompts):
+                raise LLMRequestError(f"Backend returned {len(responses)} responses for {len(prompts)} prompts")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), response in zip(batch, responses):
+            if not future.done():
+                future.set_result(response)
+
+    async def _request(self, call, payload):
+        """Sends one backend request under the concurrency limit, retrying transient failures."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self._semaphore:
+                    self.num_requests += 1
+                    if self.timeout_s is None:
+                        return await call(payload)
+                    return await asyncio.wait_for(call(payload), self.timeout_s)
+            except (TransientLLMError, ConnectionError, TimeoutError) as e:
+                if attempt == self.max_retries:
+                    raise LLMRequestError(f"LLM request failed after {attempt + 1} attempts: {e!r}") from e
+                self.num_retries += 1
+                delay = min(self.max_backoff_s, self.backoff_s * 2 ** attempt)
+                await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+
+
+class FakeLLMClient:
+    """An offline stand-in for an LLM backend with simulated latency."""
+
+    model = "fake"
+
+    def __init__(self, responses: dict, latency_s: float = 1.0, jitter_s: float = 0.0, failure_rate: float = 0.0,
+                 seed: int = None):
+        """
+        Args:
+            responses: Mapping of a key to the code returned for prompts that
+                       contain it (e.g. a variation id). The longest matching key
+                       wins.
+            latency_s: Delay before each response, in seconds.
+            jitter_s: Maximum random delay added to latency_s, so responses
+                      complete out of request order.
+            failure_rate: Probability that a request raises TransientLLMError,
+                          to exercise retries.
+            seed: Seed of the jitter and failures.
+        """
+        self.responses = responses
+        self.latency_s = latency_s
+        self.jitter_s = jitter_s
+        self.failure_rate = failure_rate
+        self._rng = random.Random(seed)
+        self.num_requests = 0
+
+    async def complete(self, prompt: str) -> str:
+        """Returns the canned response for prompt, wrapped in a code fence."""
+        return (await self.complete_batch([prompt]))[0]
+
+    async def complete_batch(self, prompts: list[str]) -> list[str]:
+        """Answers several prompts in one simulated request."""
+        self.num_requests += 1
+        await asyncio.sleep(self.latency_s + self._rng.uniform(0, self.jitter_s))
+        if self._rng.random() < self.failure_rate:
+            raise TransientLLMError("simulated backend overload")
+        return [self._respond(prompt) for prompt in prompts]
+
+    def _respond(self, prompt: str) -> str:
+        matches = [key for key in self.responses if key in prompt]
+        if not matches:
+            raise KeyError("FakeLLMClient has no response for this prompt")
+        code = self.responses[max(matches, key=len)]
+        return f"Here is the implementation:\n\n```python\n{code}```\n"
@@ -0,0 +1,108 @@
+"""
+Batch query benchmarks: many queries against one prebuilt input.
+
+A query is the tuple of entry-point arguments after the first (for shortest
+paths, a (start, end) pair against a graph). A candidate may implement the
+optional batch API of the problem spec,
+
+    build_index(graph) -> index
+    query(index, start_node, end_node) -> (cost, path)
+
+to amortize preprocessing (cached shortest-path trees, landmarks, ...) over a
+batch of queries. Candidates without it are adapted: the "index" is the input
+itself and every query calls the single-query entry point. Preprocessing and
+query latency are timed separately; every timed batch runs against a freshly
+built index, so answers cached by one repeat cannot speed up the next.
+"""
+from src.benchmarking.timing import measure
+
+
+def batch_api(module, entry_point: str):
+    """
+    Returns the batch API of a solution module.
+
+    Args:
+        module: The imported solution module.
+        entry_point: Name of its single-query function, used by the fallback.
+
+    Returns:
+        A tuple (build_index, query, native) where native tells whether the
+        module implements the batch API itself.
+    """
+    build_index = getattr(module, "build_index", None)
+    query = getattr(module, "query", None)
+    if callable(build_index) and callable(query):
+        return build_index, query, True
+
+    solve = getattr(module, entry_point)
+
+    def fallback_index(structure):
+        return structure
+
+    def fallback_query(index, *query_args):
+        return solve(index, *query_args)
+
+    return fallback_index, fallback_query, False
+
+
+def run_queries(query, index, queries: list) -> list:
+    """Answers every query against index."""
+    return [query(index, *query_args) for query_args in queries]
+
+
+def measure_batch(build_index, query, graph: dict, queries: list, timing_options: dict = None,
+                  seed: int = 0) -> dict:
+    """
+    Times preprocessing and a batch of queries on one graph.
+
+    Args:
+        build_index: Preprocessing function of the batch API.
+        query: Query function of the batch API.
+        graph: The benchmark graph.
+        queries: List of query argument tuples, e.g. (start_node, end_node).
+        timing_options: Keyword arguments of `src.benchmarking.timing.measure`.
+        seed: Seed of the bootstrap confidence intervals.
+
+    Returns:
+        A dict with the timing summaries of "preprocess" (one build_index call)
+        and "batch" (all queries, excluding preprocessing), plus
+        "preprocess_ms" and "per_query_ms" (mean batch time per query) and
+        "amortized_ms": preprocessing plus queries, per query.
+    """
+    timing_options = timing_options or {}
+    preprocess = measure(build_index, [(graph,)], seed=seed, **timing_options)
+    batch = measure(lambda index: run_queries(query, index, queries), [(graph,)],
+                    setup=lambda g: (build_index(g),), seed=seed, **timing_options)
+    num_queries = max(1, len(queries))
+    return {
+        "num_queries": len(queries),
+        "preprocess": preprocess,
+        "batch": batch,
+        "preprocess_ms": preprocess["mean"],
+        "per_query_ms": batch["mean"] / num_queries,
+        "amortized_ms": (preprocess["mean"] + batch["mean"]) / num_queries,
+    }
+
+
+def check_batch(build_index, query, graph: dict, queries: list, solve, check_answer) -> list[dict]:
+    """
+    Validates the batch API's answers against a trusted solution.
+
+    Args:
+        solve: The problem's reference solution, f(graph, *query); not the
+               candidate's own entry point, which the fallback API wraps.
+        check_answer: The problem's answer check, f(args, answer, expected).
+
+    Returns:
+        One dict (query, answer, expected, reason) per query whose batch
+        answer fails the check against solve(graph, *query).
+    """
+    index = build_index(graph)
+    mismatches = []
+    for query_args in queries:
+        answer = query(index, *query_args)
+        expected = solve(graph, *query_args)
+        reason = check_answer((graph, *query_args), answer, expected)
+        if reason is not None:
+            mismatches.append({"query": list(query_args), "answer": answer, "expected": expected, "reason": reason})
+    return mismatches
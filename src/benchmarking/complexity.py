@@ -0,0 +1,90 @@
+"""
+Empirical complexity fitting.
+
+Given measurements of a candidate at several input sizes, estimates the growth
+exponent with a log-log regression and picks the best-fitting model among a
+set of candidate complexity classes.
+"""
+import math
+
+# Each model maps (n, m) to its growth term, where n is the input size (number
+# of nodes for graphs) and m the number of edges (0 when not applicable).
+COMPLEXITY_MODELS = {
+    "n": lambda n, m: n,
+    "n log n": lambda n, m: n * math.log2(max(n, 2)),
+    "n^2": lambda n, m: n ** 2,
+    "n^3": lambda n, m: n ** 3,
+    "E log V": lambda n, m: max(m, 1) * math.log2(max(n, 2)),
+}
+
+
+def geometric_sizes(start: int = 8, factor: float = 2, count: int = 5) -> list[int]:
+    """Returns a geometric series of input sizes, e.g. 8, 16, 32, 64, 128."""
+    return [int(round(start * factor ** i)) for i in range(count)]
+
+
+def fit_exponent(sizes: list, values: list) -> float:
+    """Slope of the least-squares line through (log n, log value)."""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(v) for v in values]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    if var_x == 0:
+        return float("nan")
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x
+
+
+def fit_model(sizes: list, edges: list, values: list, model) -> tuple:
+    """
+    Fits value ~= c * model(n, m) in log space.
+
+    Returns:
+        (c, residual) where residual is the RMS of the log-space error, i.e. a
+        scale-free measure of how well the model's shape matches the data.
+    """
+    logs = [math.log(v) - math.log(model(n, m)) for n, m, v in zip(sizes, edges, values)]
+    log_c = sum(logs) / len(logs)
+    residual = math.sqrt(sum((l - log_c) ** 2 for l in logs) / len(logs))
+    return math.exp(log_c), residual
+
+
+def fit_complexity(sizes: list, values: list, edges: list = None, models: dict = None) -> dict:
+    """
+    Fits measurements against every complexity model.
+
+    Args:
+        sizes: Input sizes n.
+        values: Measurement (runtime or memory) at each size.
+        edges: Optional number of edges at each size, for graph models.
+        models: Mapping of model name to f(n, m); defaults to COMPLEXITY_MODELS.
+
+    Returns:
+        A dict with the best "model", its "coefficient", the fitted log-log
+        "exponent" and the per-model "residuals"; None if fewer than two
+        usable (positive) points were measured.
+    """
+    models = models or COMPLEXITY_MODELS
+    edges = edges or [0] * len(sizes)
+    points = [(n, m, v) for n, m, v in zip(sizes, edges, values) if n > 0 and v and v > 0]
+    if len(points) < 2:
+        return None
+    sizes, edges, values = (list(col) for col in zip(*points))
+
+    residuals = {}
+    coefficients = {}
+    for name, model in models.items():
+        coefficients[name], residuals[name] = fit_model(sizes, edges, values, model)
+    best = min(residuals, key=residuals.get)
+    return {
+        "model": best,
+        "coefficient": coefficients[best],
+        "exponent": fit_exponent(sizes, values),
+        "residuals": residuals,
+    }
+
+
+def predict(fit: dict, n: int, m: int = 0, models: dict = None) -> float:
+    """Evaluates a fitted model at size n (and m edges)."""
+    models = models or COMPLEXITY_MODELS
+    return fit["coefficient"] * models[fit["model"]](n, m)
@@ -0,0 +1,156 @@
+"""
+Benchmark input corpora.
+
+Inputs are generated ahead of timing from a fixed seed, so the measured time
+covers only the solution call and every candidate sees identical inputs.
+Inputs made of numpy arrays (e.g. CSR graphs) can additionally be persisted in
+a content-addressed `CorpusStore`, so later runs memory-map them instead of
+regenerating them.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Bump when the generator changes in a way that alters its output for a given seed.
+CORPUS_FORMAT_VERSION = 2
+
+
+class CorpusStore:
+    """
+    On-disk store of benchmark inputs keyed by their generator parameters.
+
+    Each entry is a directory named after a hash of the parameters, holding the
+    input's numpy arrays as .npy files plus a meta.json with the parameters,
+    the problem's metadata (e.g. the start/end query) and the original
+    generation cost. Entries are written once, atomically, and loaded with
+    memory mapping. Problems decide what an entry holds, see `get`.
+    """
+
+    def __init__(self, root):
+        """
+        Args:
+            root: Directory holding the entries, e.g. experiments/corpus.
+        """
+        self.root = Path(root)
+
+    @staticmethod
+    def key(params: dict) -> str:
+        """Content address of an entry: a hash of its canonical parameters."""
+        canonical = json.dumps({"version": CORPUS_FORMAT_VERSION, **params}, sort_keys=True)
+        return hashlib.sha256(canonical.encode("utf8")).hexdigest()[:24]
+
+    def _load(self, entry_dir: Path):
+        meta = json.loads((entry_dir / "meta.json").read_text(encoding="utf8"))
+        arrays = {name: np.load(entry_dir / f"{name}.npy", mmap_mode="r") for name in meta["arrays"]}
+        return arrays, meta
+
+    def _write(self, entry_dir: Path, arrays: dict, meta: dict):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(prefix=".tmp-", dir=self.root))
+        for name, array in arrays.items():
+            np.save(tmp_dir / f"{name}.npy", array)
+        (tmp_dir / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf8")
+        try:
+            os.rename(tmp_dir, entry_dir)
+        except OSError:
+            # Another process stored the same entry first; keep theirs.
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def get(self, params: dict, generate):
+        """
+        Returns a stored entry, generating and storing it on first use.
+
+        Args:
+            params: JSON-serializable generator parameters identifying the
+                    entry, including its seed.
+            generate: f() -> (arrays, meta): a dict of named numpy arrays and
+                      JSON-serializable metadata of a freshly generated input.
+
+        Returns:
+            A tuple (arrays, meta) where the arrays are memory-mapped and meta
+            also holds the params and the generation cost ("gen_ms").
+        """
+        entry_dir = self.root / self.key(params)
+        if not (entry_dir / "meta.json").exists():
+            start = time.perf_counter()
+            arrays, meta = generate()
+            meta = {
+                **params,
+                **meta,
+                "arrays": list(arrays),
+                "gen_ms": (time.perf_counter() - start) * 1000,
+            }
+            self._write(entry_dir, arrays, meta)
+        return self._load(entry_dir)
+
+
+def get_input(problem, size: int, seed: tuple, family: str = None, store: CorpusStore = None,
+              **input_options) -> tuple:
+    """
+    Generates one benchmark input of a problem, or loads it from the store.
+
+    Args:
+        problem: The `src.problems.registry.Problem` whose input is generated.
+        size: Input size.
+        seed: Seed tuple of the input.
+        family: Input family among the problem's input_families; defaults to its first.
+        store: Optional CorpusStore the problem may persist the input in.
+        input_options: Generator options overriding the problem's
+                       default_input_options; None values are ignored.
+
+    Returns:
+        The argument tuple of one call of the problem's entry point.
+    """
+    return problem.generate_input(size, seed, family or problem.input_families[0], store=store,
+                                  **problem.input_options(**input_options))
+
+
+def build_corpus(problem, test_scales: dict, inputs_per_scale: int, seed: int, store: CorpusStore = None,
+                 family: str = None, **input_options) -> dict:
+    """
+    Pre-generates seeded benchmark inputs for every scale.
+
+    Args:
+        problem: The `src.problems.registry.Problem` whose inputs are generated.
+        test_scales: Mapping of scale key to input size, e.g. {"10": 10}.
+        inputs_per_scale: Number of distinct inputs generated per scale.
+        seed: Base seed; input k of a scale of size n uses seed (seed, n, k).
+        store: Optional CorpusStore. Problems that support it then load their
+               inputs from (or save them to) disk instead of regenerating them
+               on every run.
+        family: Input family (e.g. graph topology) among the problem's
+                input_families; defaults to its first.
+        input_options: Generator options such as edge_density, see `get_input`;
+                       options a problem does not use are ignored.
+
+    Returns:
+        A dict keyed by scale with the list of argument tuples ("inputs"), the
+        average secondary size of the inputs ("work_size", e.g. the number of
+        edges; None if the problem has none) and the average cost per input,
+        in milliseconds, of preparing it in this run ("gen_ms"): generation,
+        or loading from the store.
+    """
+    family = family or problem.input_families[0]
+    corpus = {}
+    for scale_key, size in test_scales.items():
+        start = time.perf_counter()
+        inputs = [
+            get_input(problem, size, (seed, size, k), family, store=store, **input_options)
+            for k in range(inputs_per_scale)
+        ]
+        elapsed = time.perf_counter() - start
+        work_size = None
+        if problem.work_size is not None:
+            work_size = sum(problem.work_size(args) for args in inputs) / inputs_per_scale
+        corpus[scale_key] = {
+            "inputs": inputs,
+            "work_size": work_size,
+            "gen_ms": elapsed / inputs_per_scale * 1000,
+        }
+    return corpus
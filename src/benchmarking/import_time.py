@@ -0,0 +1,70 @@
+"""
+Import-time guard.
+
+Startup cost is paid by every CLI invocation and every spawned worker process,
+so heavy optional dependencies (charting, dataframes, templating) are only
+imported by the reporting stage that needs them. This module measures the
+import of an entry module in fresh interpreters with `python -X importtime`
+and checks that it stays under a time budget without loading any of those
+dependencies; `python -m autoalgo import-time` runs the check.
+"""
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# Top-level packages that must only be imported when a report is rendered
+HEAVY_MODULES = ("matplotlib", "pandas", "jinja2", "plotly")
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def measure_import_time(module: str = "src.cli", repeats: int = 5) -> dict:
+    """
+    Imports module in repeats fresh interpreters and summarizes the cost.
+
+    Returns:
+        A dict with the "module", the median cumulative import time in
+        milliseconds ("import_ms"), every run's time ("runs_ms"), the
+        "slowest" direct and indirect imports of the last run as (name, ms)
+        pairs and the loaded "heavy_modules" among HEAVY_MODULES.
+    """
+    runs = []
+    timings = {}
+    for _ in range(max(1, repeats)):
+        completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                                   cwd=PROJECT_ROOT, capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{completed.stderr[-2000:]}")
+        timings = {}
+        for line in completed.stderr.splitlines():
+            match = _IMPORTTIME_LINE.match(line)
+            if match:
+                timings[match.group(4)] = int(match.group(2)) / 1000
+        runs.append(timings.get(module, 0.0))
+
+    heavy = sorted({name.split(".")[0] for name in timings} & set(HEAVY_MODULES))
+    slowest = sorted(((name, ms) for name, ms in timings.items() if name != module), key=lambda t: -t[1])[:10]
+    return {
+        "module": module,
+        "import_ms": statistics.median(runs),
+        "runs_ms": runs,
+        "slowest": slowest,
+        "heavy_modules": heavy,
+    }
+
+
+def check_import_time(result: dict, max_ms: float = None) -> list[str]:
+    """
+    Returns the regressions found in a `measure_import_time` result: heavy
+    modules that were imported, and an import time above max_ms.
+    """
+    problems = []
+    if result["heavy_modules"]:
+        problems.append(f"importing {result['module']} loads {', '.join(result['heavy_modules'])}")
+    if max_ms is not None and result["import_ms"] > max_ms:
+        problems.append(f"importing {result['module']} took {result['import_ms']:.0f}ms (budget {max_ms:.0f}ms)")
+    return problems
@@ -0,0 +1,183 @@
+"""
+Memory measurement of a single candidate call.
+
+Two complementary numbers are reported:
+
+- The traced Python heap peak (tracemalloc), relative to the heap in use right
+  before the call, so only the solution's own allocations count. The largest
+  allocation sites are captured by comparing a snapshot taken as the call
+  returns (while its locals are still alive) against one taken before it.
+- The process RSS delta, measured in a fresh interpreter that only imports the
+  solution and unpickles its input, so earlier benchmarks, the test suite and
+  the harness itself do not pollute it. RSS is sampled by psutil while the call
+  runs; it includes native allocations tracemalloc cannot see.
+"""
+import gc
+import json
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import threading
+import tracemalloc
+from importlib import import_module
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def measure_traced_memory(func, args: tuple, top_n: int = 0) -> dict:
+    """
+    Measures the Python heap used by func(*args) with tracemalloc.
+
+    Args:
+        func: The solution function.
+        args: Arguments of the measured call.
+        top_n: Number of allocation sites to capture; 0 skips the snapshots.
+
+    Returns:
+        A dict with "peak_kb" (peak heap growth during the call) and, if top_n
+        is set, "allocations": the top_n source lines by memory still held as
+        the call returns, each with file, line, size_kb and count.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot() if top_n else None
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        entered, at_return = [], []
+        if top_n:
+            def on_call(frame, event, arg):
+                if frame.f_code is func.__code__ and not entered:
+                    entered.append(frame)
+                    frame.f_trace_lines = False  # only the return event is needed
+                    return on_return
+                return None
+
+            def on_return(frame, event, arg):
+                # Snapshot the outermost solution frame before its locals are freed
+                if event == "return":
+                    at_return.append(tracemalloc.take_snapshot())
+                return on_return
+
+            previous_trace = sys.gettrace()
+            sys.settrace(on_call)
+        try:
+            func(*args)
+        finally:
+            if top_n:
+                sys.settrace(previous_trace)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    result = {"peak_kb": max(0, peak - baseline) / 1024}
+    if top_n:
+        result["allocations"] = _top_allocations(at_return[0], before, top_n) if at_return else []
+    return result
+
+
+def _top_allocations(snapshot, before, top_n: int) -> list[dict]:
+    exclude = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    diff = snapshot.filter_traces(exclude).compare_to(before.filter_traces(exclude), "lineno")
+    sites = []
+    for stat in diff:
+        if stat.size_diff <= 0:
+            continue
+        frame = stat.traceback[0]
+        sites.append({
+            "file": os.path.basename(frame.filename),
+            "line": frame.lineno,
+            "size_kb": stat.size_diff / 1024,
+            "count": stat.count_diff,
+        })
+        if len(sites) == top_n:
+            break
+    return sites
+
+
+def measure_rss(module_path: str, entry_point: str, args: tuple, timeout: float = 120,
+                sample_interval_s: float = 0.001):
+    """
+    Measures the RSS growth of one call in a fresh interpreter.
+
+    Args:
+        module_path: Import path of the solution module.
+        entry_point: Name of the solution function in that module.
+        args: Arguments of the measured call; must be picklable.
+        timeout: Seconds before the measurement is abandoned.
+        sample_interval_s: RSS sampling period during the call.
+
+    Returns:
+        A dict with "baseline_kb" (RSS before the call), "peak_delta_kb" and
+        "retained_delta_kb" (RSS growth at the sampled peak and after the
+        call), or None if psutil is unavailable or the measurement failed.
+    """
+    fd, input_path = tempfile.mkstemp(suffix=".pkl")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(args, f, protocol=pickle.HIGHEST_PROTOCOL)
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [PROJECT_ROOT, os.environ.get("PYTHONPATH")]))}
+        completed = subprocess.run(
+            [sys.executable, "-m", "src.benchmarking.memory", module_path, entry_point, input_path,
+             str(sample_interval_s)],
+            cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=timeout,
+        )
+    except (subprocess.TimeoutExpired, OSError, pickle.PicklingError) as e:
+        print(f"     - RSS measurement failed: {e}")
+        return None
+    finally:
+        os.unlink(input_path)
+
+    lines = completed.stdout.strip().splitlines()
+    result = json.loads(lines[-1]) if completed.returncode == 0 and lines else {"error": completed.stderr.strip()}
+    if "error" in result:
+        print(f"     - RSS measurement failed: {result['error'].splitlines()[-1] if result['error'] else 'no output'}")
+        return None
+    return result
+
+
+def _rss_probe(module_path: str, entry_point: str, input_path: str, sample_interval_s: float) -> dict:
+    """Runs inside the fresh interpreter started by `measure_rss`."""
+    try:
+        import psutil
+    except ImportError:
+        return {"error": "psutil is not installed"}
+
+    with open(input_path, "rb") as f:
+        args = pickle.load(f)
+    func = getattr(import_module(module_path), entry_point)
+    process = psutil.Process()
+    peak = 0
+    done = threading.Event()
+
+    def sample():
+        nonlocal peak
+        while not done.wait(sample_interval_s):
+            peak = max(peak, process.memory_info().rss)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    # The baseline is taken once the sampler thread (and its stack) exists
+    gc.collect()
+    baseline = process.memory_info().rss
+    peak = max(peak, baseline)
+    try:
+        func(*args)
+    finally:
+        done.set()
+        sampler.join()
+    after = process.memory_info().rss
+    peak = max(peak, after)
+    return {
+        "baseline_kb": baseline / 1024,
+        "peak_delta_kb": (peak - baseline) / 1024,
+        "retained_delta_kb": (after - baseline) / 1024,
+    }
+
+
+if __name__ == "__main__":
+    module_path, entry_point, input_path, interval = sys.argv[1:5]
+    print(json.dumps(_rss_probe(module_path, entry_point, input_path, float(interval))))
@@ -0,0 +1,133 @@
+"""
+Profiling of a single candidate call.
+
+Runs the solution once under cProfile to find the functions it spends its time
+in and, optionally, under a line tracer restricted to the solution's own source
+file. The tracer attributes the time between consecutive line events to the
+earlier line (including time spent in callees), which pinpoints hot loops at
+the cost of a much slower call.
+"""
+import cProfile
+import linecache
+import os
+import pstats
+import sys
+import time
+
+
+def profile_functions(func, args: tuple, top_n: int = 10) -> list[dict]:
+    """
+    Profiles func(*args) with cProfile.
+
+    Returns:
+        The top_n functions by self time, each with its function name, file,
+        line, number of calls, self_ms, cumulative_ms and percent of the
+        total self time.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        func(*args)
+    finally:
+        profiler.disable()
+
+    entries = pstats.Stats(profiler).stats
+    total = sum(tottime for _, _, tottime, _, _ in entries.values()) or 1e-12
+    functions = []
+    for (filename, line, name), (_, calls, tottime, cumtime, _) in entries.items():
+        if name == "<method 'disable' of '_lsprof.Profiler' objects>":
+            continue
+        functions.append({
+            "function": name,
+            "file": os.path.basename(filename) if filename != "~" else "",
+            "line": line,
+            "calls": calls,
+            "self_ms": tottime * 1000,
+            "cumulative_ms": cumtime * 1000,
+            "percent": tottime / total * 100,
+        })
+    functions.sort(key=lambda f: f["self_ms"], reverse=True)
+    return functions[:top_n]
+
+
+def profile_lines(func, args: tuple, top_n: int = 10) -> list[dict]:
+    """
+    Times every line of func's source file executed by func(*args).
+
+    Returns:
+        The top_n lines by time, each with its function name, line number,
+        hits, time_ms, percent of the traced call's duration and the source
+        text. Line times include callees, so percents may overlap.
+    """
+    filename = func.__code__.co_filename
+    timings = {}
+    last = {}  # frame -> (line number, timestamp of its last line event)
+
+    def record(frame, now):
+        previous = last.get(frame)
+        if previous is not None:
+            key = (frame.f_code.co_name, previous[0])
+            hits, spent = timings.get(key, (0, 0.0))
+            timings[key] = (hits + 1, spent + now - previous[1])
+
+    def trace_lines(frame, event, arg):
+        now = time.perf_counter()
+        if event == "line":
+            record(frame, now)
+            last[frame] = (frame.f_lineno, now)
+        elif event == "return":
+            record(frame, now)
+            last.pop(frame, None)
+        return trace_lines
+
+    def trace_calls(frame, event, arg):
+        if frame.f_code.co_filename == filename:
+            return trace_lines
+        return None
+
+    previous_trace = sys.gettrace()
+    sys.settrace(trace_calls)
+    started = time.perf_counter()
+    try:
+        func(*args)
+    finally:
+        total = time.perf_counter() - started or 1e-12
+        sys.settrace(previous_trace)
+
+    lines = [
+        {
+            "function": name,
+            "line": line,
+            "hits": hits,
+            "time_ms": spent * 1000,
+            "percent": spent / total * 100,
+            "source": linecache.getline(filename, line).strip(),
+        }
+        for (name, line), (hits, spent) in timings.items()
+    ]
+    lines.sort(key=lambda l: l["time_ms"], reverse=True)
+    return lines[:top_n]
+
+
+def profile_candidate(func, args: tuple, lines: bool = False, top_n: int = 10) -> dict:
+    """
+    Profiles one call of a candidate.
+
+    Args:
+        func: The solution function.
+        args: Arguments of the profiled call, typically the largest benchmark input.
+        lines: Also run the (slow) line tracer.
+        top_n: Number of functions and lines kept.
+
+    Returns:
+        A dict with the top "functions", the top "lines" (empty unless lines
+        is set) and the five "hot_spots" handed to the designer: the hottest
+        lines if traced, otherwise the hottest functions.
+    """
+    functions = profile_functions(func, args, top_n)
+    line_timings = profile_lines(func, args, top_n) if lines else []
+    hot_spots = [
+        {"function": h["function"], "line": h["line"], "percent": h["percent"], "source": h.get("source", "")}
+        for h in (line_timings or functions)[:5]
+    ]
+    return {"functions": functions, "lines": line_timings, "hot_spots": hot_spots}
@@ -0,0 +1,41 @@
+import sys
+import os
+
+# Add the project root to the Python path to allow for absolute imports
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.benchmarking.batch import check_batch
+from src.problems.registry import get_problem
+
+GRAPH = {
+    'A': {'B': 1, 'C': 4},
+    'B': {'C': 2, 'D': 5},
+    'C': {'D': 1},
+    'D': {}
+}
+QUERIES = [('A', 'D'), ('B', 'D'), ('A', 'A'), ('D', 'A')]
+
+
+def test_correct_queries_pass():
+    """Tests that answers of the reference itself are accepted."""
+    problem = get_problem("shortest_path")
+    mismatches = check_batch(lambda graph: graph, problem.oracle, GRAPH, QUERIES, problem.oracle,
+                             problem.check_answer)
+    assert mismatches == []
+
+
+def test_wrong_query_is_reported():
+    """Tests that a query answering with the direct edge is checked against the reference, not itself."""
+    problem = get_problem("shortest_path")
+
+    def wrong_query(index, start_node, end_node):
+        if end_node in index[start_node]:
+            return index[start_node][end_node], [start_node, end_node]
+        return problem.oracle(index, start_node, end_node)
+
+    mismatches = check_batch(lambda graph: graph, wrong_query, GRAPH, QUERIES, problem.oracle,
+                             problem.check_answer)
+    assert [m["query"] for m in mismatches] == [['B', 'D']]
+    assert mismatches[0]["expected"] == (3, ['B', 'C', 'D'])
@@ -0,0 +1,126 @@
+"""
+Timing engine for candidate benchmarks.
+
+Runs warmup calls, then repeats timed calls until the standard error of the
+mean falls below a target relative error (or a repeat/time cap is hit), and
+summarizes the samples with robust statistics and a bootstrap confidence
+interval for the median.
+"""
+import math
+import random
+import statistics
+import time
+
+DEFAULT_TIMING_OPTIONS = {
+    "warmup": 2,
+    "min_repeats": 5,
+    "max_repeats": 100,
+    "target_rel_error": 0.02,
+    "max_time_s": 2.0,
+    "confidence": 0.95,
+    "n_bootstrap": 1000,
+}
+
+
+def percentile(sorted_values: list, q: float) -> float:
+    """Linear-interpolated percentile (q in 0..100) of an already sorted list."""
+    if not sorted_values:
+        return float("nan")
+    pos = (len(sorted_values) - 1) * q / 100
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def bootstrap_median_ci(samples: list, confidence: float = 0.95, n_bootstrap: int = 1000, seed: int = 0):
+    """Percentile-bootstrap confidence interval for the median of samples."""
+    if len(samples) < 2:
+        value = samples[0] if samples else float("nan")
+        return value, value
+    rng = random.Random(seed)
+    n = len(samples)
+    medians = sorted(
+        statistics.median(rng.choices(samples, k=n))
+        for _ in range(n_bootstrap)
+    )
+    tail = (1 - confidence) / 2 * 100
+    return percentile(medians, tail), percentile(medians, 100 - tail)
+
+
+def summarize(samples_ms: list, confidence: float = 0.95, n_bootstrap: int = 1000, seed: int = 0) -> dict:
+    """
+    Summarizes timing samples (in milliseconds).
+
+    Returns:
+        A dict with n, min, median, mean, p95, stddev, the bootstrap CI of the
+        median (ci_low, ci_high) and the raw samples.
+    """
+    ordered = sorted(samples_ms)
+    ci_low, ci_high = bootstrap_median_ci(samples_ms, confidence, n_bootstrap, seed)
+    return {
+        "n": len(samples_ms),
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "mean": statistics.fmean(ordered),
+        "p95": percentile(ordered, 95),
+        "stddev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        "ci_low": ci_low,
+        "ci_high": ci_high,
+        "samples_ms": samples_ms,
+    }
+
+
+def _relative_error(samples: list) -> float:
+    mean = statistics.fmean(samples)
+    if mean <= 0:
+        return 0.0
+    return statistics.stdev(samples) / math.sqrt(len(samples)) / mean
+
+
+def measure(func, inputs: list, warmup: int = 2, min_repeats: int = 5, max_repeats: int = 100,
+            target_rel_error: float = 0.02, max_time_s: float = 2.0, confidence: float = 0.95,
+            n_bootstrap: int = 1000, seed: int = 0, setup=None) -> dict:
+    """
+    Times func over a list of pre-generated argument tuples.
+
+    Calls cycle through the inputs. After `warmup` untimed calls, timed calls
+    are repeated until at least `min_repeats` samples exist and the relative
+    standard error of the mean is at most `target_rel_error`, or until
+    `max_repeats` samples or `max_time_s` seconds of timed calls are reached.
+    If setup is given, it is called (untimed) with each input before every
+    call and func receives the argument tuple it returns instead.
+
+    Returns:
+        The `summarize` statistics in milliseconds, plus whether the target
+        relative error was reached ("converged") and the achieved "rel_error".
+    """
+    def prepare(args):
+        return setup(*args) if setup is not None else args
+
+    for i in range(warmup):
+        func(*prepare(inputs[i % len(inputs)]))
+
+    samples = []
+    spent = 0.0
+    rel_error = float("inf")
+    while len(samples) < max_repeats:
+        args = prepare(inputs[len(samples) % len(inputs)])
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        samples.append(elapsed * 1000)
+        spent += elapsed
+        if len(samples) >= max(2, min_repeats):
+            rel_error = _relative_error(samples)
+            if rel_error <= target_rel_error or spent >= max_time_s:
+                break
+
+    stats = summarize(samples, confidence, n_bootstrap, seed)
+    stats["converged"] = rel_error <= target_rel_error
+    stats["rel_error"] = rel_error
+    return stats
+
+
+def intervals_overlap(a: dict, b: dict) -> bool:
+    """True if the median confidence intervals of two summaries overlap."""
+    return a["ci_low"] <= b["ci_high"] and b["ci_low"] <= a["ci_high"]
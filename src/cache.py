@@ -0,0 +1,97 @@
+"""
+Persistent cache of candidate evaluation results.
+
+Results are keyed by a hash of everything that can change them: the
+normalized solution source, the test-suite contents, the benchmark
+configuration and the interpreter version. Entries are JSON files whose
+modification time records their last use, and the least recently used ones
+are evicted once the cache holds more than `max_entries`.
+"""
+import ast
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+from src.utils import write_json_atomic
+
+
+def normalize_source(code: str) -> str:
+    """
+    Normalizes solution source so that formatting and comments do not affect
+    its cache key. Falls back to the stripped text if the code does not parse.
+    """
+    try:
+        return ast.dump(ast.parse(code))
+    except SyntaxError:
+        return "\n".join(line.rstrip() for line in code.strip().splitlines())
+
+
+def evaluation_key(code: str, test_path, config: dict) -> str:
+    """
+    Hashes everything that determines an evaluation's results.
+
+    Args:
+        code: The candidate's solution source.
+        test_path: The test suite the candidate is checked against.
+        config: Evaluation settings that affect the results (seed, benchmark
+                sizes, timing options, ...).
+    """
+    digest = hashlib.sha256()
+    digest.update(normalize_source(code).encode("utf8"))
+    digest.update(Path(test_path).read_bytes())
+    digest.update(json.dumps(config, sort_keys=True, default=str).encode("utf8"))
+    digest.update(sys.version.encode("utf8"))
+    return digest.hexdigest()
+
+
+class EvaluationCache:
+    """A size-bounded, LRU-evicted on-disk cache of evaluation results."""
+
+    def __init__(self, cache_dir, max_entries: int = 512):
+        """
+        Args:
+            cache_dir: Directory holding the cache entries.
+            max_entries: Maximum number of entries kept before evicting the
+                         least recently used ones.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str):
+        """Returns the cached results for key, or None on a miss."""
+        path = self._path(key)
+        try:
+            results = json.loads(path.read_text(encoding="utf8"))
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        return results
+
+    def put(self, key: str, results: dict):
+        """Stores results under key, then evicts entries beyond max_entries."""
+        write_json_atomic(self._path(key), results)
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for path in self.cache_dir.glob("[!.]*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                pass
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort()
+        for _, path in entries[:len(entries) - self.max_entries]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
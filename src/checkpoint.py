@@ -0,0 +1,32 @@
+"""
+Per-candidate checkpoints for resumable experiments.
+
+As soon as a candidate's evaluation finishes, its results are written to
+experiments/<experiment_id>/<variation_id>/result.json together with the
+evaluation key they were produced under. A resumed run reuses a checkpoint
+only if that key still matches, i.e. the code, test suite and evaluation
+settings are unchanged.
+"""
+import json
+from pathlib import Path
+
+from src.utils import write_json_atomic
+
+CHECKPOINT_FILENAME = "result.json"
+
+
+def save_checkpoint(solution_dir, key: str, results: dict):
+    """Atomically records a finished evaluation in the candidate's directory."""
+    write_json_atomic(Path(solution_dir) / CHECKPOINT_FILENAME, {"key": key, "results": results}, indent=2)
+
+
+def load_checkpoint(solution_dir, key: str):
+    """Returns the checkpointed results if they were produced under key, else None."""
+    path = Path(solution_dir) / CHECKPOINT_FILENAME
+    try:
+        checkpoint = json.loads(path.read_text(encoding="utf8"))
+    except (OSError, ValueError):
+        return None
+    if checkpoint.get("key") != key:
+        return None
+    return checkpoint.get("results")
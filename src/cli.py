@@ -0,0 +1,252 @@
+"""
+Command-line interface.
+
+    python -m autoalgo bench [--quick | --full] [options]
+    python -m autoalgo optimize [--quick | --full] [options]
+    python -m autoalgo import-time [--max-ms MS]
+
+`bench` runs a single comparison experiment; `optimize` runs the evolutionary
+search of `Orchestrator.run_optimization`. A profile sets the benchmark sweep,
+timing and evaluation defaults; any explicit option overrides it.
+`import-time` checks that the CLI starts quickly and without loading the
+reporting dependencies (see `src.benchmarking.import_time`).
+"""
+import argparse
+import os
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.benchmarking.import_time import check_import_time, measure_import_time
+from src.orchestrator import Orchestrator
+from src.problems.registry import available_problems, get_problem
+
+# Each profile holds Orchestrator keyword arguments; "benchmark" and "timing"
+# are merged into benchmark_options and timing_options. Topologies "all" stands
+# for every input family of the problem; batch queries only apply to problems
+# with a batch query mode. "num_sizes" sets max_size to the num_sizes-th size of
+# the problem's geometric series, so every problem gets as many sweep points.
+PROFILES = {
+    # Fast iteration: small sizes, few repeats, warm in-process test runs
+    "quick": {
+        "benchmark": {"num_sizes": 5, "time_budget_s": 5, "inputs_per_size": 3, "profile": False, "rss": False,
+                      "fuzz_cases": 200},
+        "timing": {"warmup": 1, "min_repeats": 3, "max_repeats": 20, "max_time_s": 0.5, "n_bootstrap": 200},
+        "fast_correctness": True,
+    },
+    # The settings of run.py
+    "default": {
+        "benchmark": {"max_size": 512, "time_budget_s": 20, "profile": True, "fuzz_cases": 1000},
+        "timing": {},
+        "fast_correctness": False,
+    },
+    # Nightly large-scale runs: large sizes, tight confidence intervals, line profiles
+    "full": {
+        "benchmark": {"max_size": 4096, "time_budget_s": 300, "inputs_per_size": 10, "profile": True,
+                      "profile_lines": True, "topologies": "all", "batch_queries": 1000,
+                      "fuzz_cases": 5000},
+        "timing": {"warmup": 3, "min_repeats": 10, "max_repeats": 200, "target_rel_error": 0.01,
+                   "max_time_s": 5.0, "n_bootstrap": 2000},
+        "fast_correctness": False,
+    },
+}
+
+
+def _int_list(text: str) -> list[int]:
+    return [int(v) for v in text.split(",") if v.strip()]
+
+
+def _float_list(text: str) -> list[float]:
+    return [float(v) for v in text.split(",") if v.strip()]
+
+
+def _str_list(text: str) -> list[str]:
+    return [v.strip() for v in text.split(",") if v.strip()]
+
+
+def _add_common_arguments(parser: argparse.ArgumentParser):
+    profile = parser.add_mutually_exclusive_group()
+    profile.add_argument("--quick", dest="profile", action="store_const", const="quick",
+                         help="small sizes and few repeats, for fast iteration")
+    profile.add_argument("--full", dest="profile", action="store_const", const="full",
+                         help="large sizes, many repeats and line profiles, for nightly runs")
+    parser.set_defaults(profile="default")
+
+    parser.add_argument("--problem", default="shortest_path", choices=available_problems(),
+                        help="registered problem (package under src/problems)")
+    parser.add_argument("--experiment-id", default="comparison_001", help="experiment (output directory) name")
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed of the benchmark inputs")
+    parser.add_argument("--candidates", type=_str_list, help="comma-separated subset of variations to evaluate")
+
+    sweep = parser.add_argument_group("benchmark sweep")
+    sweep.add_argument("--sizes", type=_int_list, help="comma-separated input sizes, e.g. 8,64,512")
+    sweep.add_argument("--max-size", type=int, help="largest size of the default doubling series")
+    sweep.add_argument("--densities", type=_float_list, default=[0.5],
+                       help="comma-separated edge densities; one experiment per density")
+    sweep.add_argument("--topologies", type=_str_list,
+                       help="comma-separated input families (graph topologies for shortest_path), ranked "
+                            "separately")
+    sweep.add_argument("--avg-degree", type=float, help="expected out-degree of the sparse, power_law and dag graphs")
+    sweep.add_argument("--inputs-per-size", type=int, help="distinct inputs generated per size")
+    sweep.add_argument("--repeats", type=int, help="minimum timed repeats per size")
+    sweep.add_argument("--max-repeats", type=int, help="maximum timed repeats per size")
+    sweep.add_argument("--time-budget", type=float, help="per-candidate benchmark budget in seconds")
+    sweep.add_argument("--batch-queries", type=int,
+                       help="also time batches of this many queries against one prebuilt graph per size")
+    sweep.add_argument("--workload", choices=["single", "batch"], default="single",
+                       help="rank on single-query runtimes or on amortized batch query runtimes")
+    sweep.add_argument("--profile-lines", action="store_true", default=None, help="also time individual lines")
+
+    evaluation = parser.add_argument_group("evaluation")
+    evaluation.add_argument("--workers", type=int, default=1, help="candidates evaluated concurrently (sandboxed)")
+    evaluation.add_argument("--sandbox", action="store_true", help="evaluate in resource-limited worker processes")
+    evaluation.add_argument("--fast-correctness", action="store_true", default=None,
+                            help="run the test suite in a warm worker process")
+    evaluation.add_argument("--fuzz-cases", type=int,
+                            help="random inputs each candidate is checked on against the reference (0 disables)")
+    evaluation.add_argument("--smoke-cases", type=int, help="tiny random inputs of the smoke test (0 disables)")
+    evaluation.add_argument("--quick-size", type=int, help="input size of the quick benchmark used for pruning")
+    evaluation.add_argument("--prune-ratio", type=float,
+                            help="skip the full sweep for candidates this many times slower than the quick-tier "
+                                 "leader (0 disables)")
+    evaluation.add_argument("--no-cache", action="store_true", help="ignore and do not fill the evaluation cache")
+    evaluation.add_argument("--resume", action="store_true", help="skip candidates checkpointed by an earlier run")
+    evaluation.add_argument("--output-dir", help="directory receiving the reports (default: reports/)")
+    report = evaluation.add_mutually_exclusive_group()
+    report.add_argument("--json-only", dest="report", action="store_const", const="json",
+                        help="write results.json and results.csv only, without charts or HTML")
+    report.add_argument("--no-report", dest="report", action="store_const", const="none",
+                        help="write no report files")
+    parser.set_defaults(report="html")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="autoalgo", description="Benchmark and optimize algorithm candidates.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bench = commands.add_parser("bench", help="compare the designer's candidates")
+    _add_common_arguments(bench)
+
+    optimize = commands.add_parser("optimize", help="breed faster candidates over several generations")
+    _add_common_arguments(optimize)
+    optimize.add_argument("--generations", type=int, default=5, help="maximum number of generations")
+    optimize.add_argument("--top-k", type=int, default=2, help="parents improved per generation")
+    optimize.add_argument("--patience", type=int, default=2, help="generations without improvement before stopping")
+    optimize.add_argument("--min-improvement", type=float, default=0.01, help="relative runtime gain that counts")
+    optimize.add_argument("--max-evaluations", type=int, help="cap on evaluated candidates")
+    optimize.add_argument("--search-budget", type=float, help="wall-clock budget of the search in seconds")
+
+    import_time = commands.add_parser("import-time", help="guard the CLI's import time against regressions")
+    import_time.add_argument("--module", action="append", dest="modules",
+                             help="module to import (repeatable; default: src.cli)")
+    import_time.add_argument("--max-ms", type=float, default=1000.0, help="import time budget per module")
+    import_time.add_argument("--repeats", type=int, default=5, help="fresh interpreters per module (median)")
+    return parser
+
+
+def orchestrator_options(args: argparse.Namespace, edge_density: float) -> dict:
+    """Merges the selected profile with the explicit command-line options."""
+    profile = PROFILES[args.profile]
+    problem = get_problem(args.problem)
+    benchmark = {**profile["benchmark"], "edge_density": edge_density}
+    num_sizes = benchmark.pop("num_sizes", None)
+    if num_sizes:
+        benchmark["max_size"] = problem.size_start * problem.size_factor ** (num_sizes - 1)
+    if benchmark.get("topologies") == "all":
+        benchmark["topologies"] = list(problem.input_families)
+    if problem.query_batch is None:
+        benchmark.pop("batch_queries", None)
+    overrides = {
+        "sizes": args.sizes,
+        "max_size": args.max_size,
+        "inputs_per_size": args.inputs_per_size,
+        "topologies": args.topologies,
+        "avg_degree": args.avg_degree,
+        "batch_queries": args.batch_queries,
+        "fuzz_cases": args.fuzz_cases,
+        "time_budget_s": args.time_budget,
+        "profile_lines": args.profile_lines,
+    }
+    benchmark.update({k: v for k, v in overrides.items() if v is not None})
+
+    timing = dict(profile["timing"])
+    if args.repeats is not None:
+        timing["min_repeats"] = args.repeats
+        timing["max_repeats"] = max(args.repeats, timing.get("max_repeats", args.repeats))
+    if args.max_repeats is not None:
+        timing["max_repeats"] = args.max_repeats
+
+    fast_correctness = profile["fast_correctness"] if args.fast_correctness is None else args.fast_correctness
+    pipeline = {
+        "smoke_cases": args.smoke_cases,
+        "quick_size": args.quick_size,
+        "prune_ratio": args.prune_ratio,
+    }
+    return {
+        "problem_name": args.problem,
+        "max_workers": args.workers,
+        "fast_correctness": fast_correctness,
+        "sandbox": args.sandbox,
+        "timing_options": timing or None,
+        "scoring_options": {"workload": args.workload},
+        "benchmark_options": benchmark,
+        "use_cache": not args.no_cache,
+        "candidates": args.candidates,
+        "reports_dir": args.output_dir,
+        "pipeline_options": {k: v for k, v in pipeline.items() if v is not None},
+        "report": args.report,
+    }
+
+
+def import_time(args: argparse.Namespace) -> int:
+    """Runs the import-time guard; returns 1 if any module regressed."""
+    failed = False
+    for module in args.modules or ["src.cli"]:
+        result = measure_import_time(module, repeats=args.repeats)
+        print(f"{module}: {result['import_ms']:.0f}ms (median of {len(result['runs_ms'])})")
+        for name, ms in result["slowest"][:5]:
+            print(f"   - {name}: {ms:.0f}ms")
+        for problem in check_import_time(result, args.max_ms):
+            print(f"   - REGRESSION: {problem}")
+            failed = True
+    return 1 if failed else 0
+
+
+def main(argv: list[str] = None) -> int:
+    """Entry point of `python -m autoalgo`."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "import-time":
+        return import_time(args)
+    problem = get_problem(args.problem)
+    if args.batch_queries and problem.query_batch is None:
+        parser.error(f"problem {args.problem} has no batch query mode")
+    batch_queries = args.batch_queries or PROFILES[args.profile]["benchmark"].get("batch_queries")
+    if args.workload == "batch" and not (batch_queries and problem.query_batch is not None):
+        parser.error("--workload batch requires --batch-queries")
+    unknown = [t for t in args.topologies or [] if t not in problem.input_families]
+    if unknown:
+        parser.error(f"unknown topologies {unknown}; choose from {', '.join(problem.input_families)}")
+    for density in args.densities:
+        experiment_id = args.experiment_id
+        if len(args.densities) > 1:
+            # Experiment ids are package names, so "0.5" becomes "0p5"
+            experiment_id = f"{experiment_id}_d{density:g}".replace(".", "p")
+        try:
+            orchestrator = Orchestrator(**orchestrator_options(args, density))
+        except ValueError as e:
+            parser.error(str(e))
+        if args.command == "optimize":
+            orchestrator.run_optimization(experiment_id, seed=args.seed, resume=args.resume,
+                                          max_generations=args.generations, top_k=args.top_k,
+                                          patience=args.patience, min_improvement=args.min_improvement,
+                                          max_evaluations=args.max_evaluations, time_budget_s=args.search_budget)
+        else:
+            orchestrator.run_comparison_experiment(experiment_id, seed=args.seed, resume=args.resume)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
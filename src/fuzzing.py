@@ -0,0 +1,133 @@
+"""
+Differential correctness fuzzing.
+
+Runs a candidate on thousands of small seeded random inputs and compares every
+answer with the problem's trusted reference solution, using the problem's own
+answer check (for shortest paths, costs must match the reference and returned
+paths are validated independently); candidates must also leave their input
+unchanged. The run stops at the first counterexample, which is then minimized
+with the problem's shrink hook for as long as the candidate still fails. See
+`src.problems.registry.Problem`.
+"""
+import copy
+import time
+
+import numpy as np
+
+
+def check_case(problem, func, args: tuple, oracle=None) -> str:
+    """Runs func on one input and validates it against the oracle; returns None or the failure."""
+    expected = (oracle or problem.oracle)(*args)
+    trial = copy.deepcopy(args)
+    try:
+        answer = func(*trial)
+    except Exception as e:
+        return f"raised {type(e).__name__}: {e}"
+    if trial != args:
+        return "modified its input"
+    return problem.check_answer(args, answer, expected)
+
+
+def minimize_counterexample(problem, func, args: tuple, oracle=None, max_trials: int = 2000) -> tuple:
+    """
+    Shrinks a failing input while func keeps failing on it.
+
+    The first failing variant yielded by problem.shrink replaces the input and
+    shrinking restarts from it, until no variant fails or max_trials variants
+    have been tried.
+
+    Returns:
+        The smallest failing input found.
+    """
+    if problem.shrink is None:
+        return args
+    trials = 0
+    shrunk = True
+    while shrunk and trials < max_trials:
+        shrunk = False
+        for candidate in problem.shrink(args):
+            if trials >= max_trials:
+                break
+            trials += 1
+            if check_case(problem, func, candidate, oracle) is not None:
+                args, shrunk = candidate, True
+                break
+    return args
+
+
+def fuzz(problem, func, num_cases: int = 1000, max_size: int = 32, seed: int = 0, time_budget_s: float = None,
+         oracle=None, minimize: bool = True) -> dict:
+    """
+    Differentially tests func against the oracle on seeded random inputs.
+
+    Case k draws its input size (1..max_size, biased towards small inputs) and
+    the input itself (see the problem's fuzz_input) from the seed (seed, k),
+    so a failure is reproducible from its case number alone.
+
+    Args:
+        problem: The `Problem` being solved.
+        func: The candidate function.
+        num_cases: Number of random inputs to try.
+        max_size: Largest generated input.
+        seed: Base seed of the inputs.
+        time_budget_s: Optional wall-clock cap; fewer cases are run if reached.
+        oracle: The trusted reference solution; defaults to the problem's.
+        minimize: Shrink the first counterexample before reporting it.
+
+    Returns:
+        A dict with "passed", the number of cases run ("num_cases"),
+        "elapsed_s" and, on failure, the "counterexample": its case number,
+        the failing "call" and its "args", the candidate's answer, the expected
+        answer, the failure "reason" and the input size before and after
+        minimizing ("original_size", "size").
+    """
+    oracle = oracle or problem.oracle
+    started = time.perf_counter()
+    ran = 0
+    for case in range(num_cases):
+        if time_budget_s is not None and time.perf_counter() - started > time_budget_s:
+            break
+        ran += 1
+        rng = np.random.default_rng((seed, case))
+        size = int(min(max_size, 1 + rng.geometric(min(1.0, 4 / max_size))))
+        args = problem.fuzz_input(rng, size)
+
+        reason = check_case(problem, func, args, oracle)
+        if reason is None:
+            continue
+
+        original_size = problem.input_size(args)
+        if minimize:
+            args = minimize_counterexample(problem, func, args, oracle)
+            reason = check_case(problem, func, args, oracle)
+        try:
+            answer = func(*copy.deepcopy(args))
+        except Exception as e:
+            answer = f"{type(e).__name__}: {e}"
+        return {
+            "passed": False,
+            "num_cases": ran,
+            "elapsed_s": time.perf_counter() - started,
+            "counterexample": {
+                "case": case,
+                "call": problem.format_call(args),
+                "args": args,
+                "answer": answer,
+                "expected": oracle(*args),
+                "reason": reason,
+                "original_size": original_size,
+                "size": problem.input_size(args),
+            },
+        }
+    return {"passed": True, "num_cases": ran, "elapsed_s": time.perf_counter() - started}
+
+
+def format_counterexample(counterexample: dict) -> str:
+    """Renders a counterexample as a short, reproducible bug report."""
+    return (
+        f"Differential fuzzing counterexample (case {counterexample['case']}, minimized from size "
+        f"{counterexample['original_size']} to {counterexample['size']}):\n"
+        f"  {counterexample['call']}\n"
+        f"  returned {counterexample['answer']!r}, expected {counterexample['expected']!r}\n"
+        f"  {counterexample['reason']}"
+    )
@@ -2,11 +2,14 @@
 import os
 import sys
 import json
+import asyncio
 import random
 import platform
 import datetime
+import time
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
 
 # Add the project root to the Python path to allow for absolute imports
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -16,19 +19,136 @@ if PROJECT_ROOT not in sys.path:
 from src.agents.designer import DesignerAgent
 from src.agents.implementer import ImplementerAgent
 from src.agents.evaluator import EvaluatorAgent
-from src.reporting import scoring, export_results, chart_generator
+from src.test_runner import InProcessTestRunner, WarmTestRunner, preload_pytest
+from src.sandbox import SandboxPool, SandboxError
+from src.cache import EvaluationCache, evaluation_key, normalize_source
+from src.checkpoint import load_checkpoint, save_checkpoint
+from src.problems.registry import get_problem
+from src.reporting import scoring, export_results
+from src.reporting.results_log import ResultsLog, ScoredRecords, summarize
+
+# Staged evaluation defaults: smoke test size, quick benchmark size, and the
+# pruning thresholds applied to the quick benchmark before the full sweep
+DEFAULT_PIPELINE_OPTIONS = {
+    "smoke_cases": 20,
+    "quick_size": 64,
+    "prune_ratio": 10.0,
+    "prune_min_ms": 1.0,
+}
+
+# Report outputs: "html" writes JSON, CSV, charts and the HTML report; "json"
+# only results.json and results.csv; "none" no report at all. Only "html"
+# imports the charting and templating dependencies.
+REPORT_FORMATS = ("html", "json", "none")
+
+def _evaluate_candidate(solution_module_path: str, test_path: str, fast_correctness: bool,
+                        evaluator_options: dict, quick_results: dict = None) -> dict:
+    """
+    Evaluates a single candidate inside a sandbox worker: the cheap tiers
+    (`EvaluatorAgent.evaluate_quick`), or, given their results, the full
+    benchmark sweep. Sandbox workers are reused across candidates, so with
+    fast_correctness the suite runs in the already-warm worker instead of a
+    fresh pytest subprocess.
+    """
+    test_runner = InProcessTestRunner() if fast_correctness else None
+    evaluator = EvaluatorAgent(solution_module_path=solution_module_path, test_path=test_path,
+                               test_runner=test_runner, **evaluator_options)
+    if quick_results is None:
+        return evaluator.evaluate_quick()
+    return evaluator.evaluate_full(quick_results)
 
 class Orchestrator:
     """Main orchestrator for the AutoAlgo system."""
 
-    def __init__(self, problem_name: str):
+    def __init__(self, problem_name: str, max_workers: int = 1, fast_correctness: bool = False,
+                 sandbox: bool = False, sandbox_options: dict = None, persist_corpus: bool = True,
+                 timing_options: dict = None, scoring_options: dict = None, benchmark_options: dict = None,
+                 use_cache: bool = True, cache_max_entries: int = 512, llm_client=None,
+                 stream_candidates: bool = False, queue_size: int = 2, candidates: list[str] = None,
+                 reports_dir: str = None, pipeline_options: dict = None, report: str = "html"):
+        """
+        Args:
+            problem_name: Name of a registered problem (a package under
+                          src/problems, see `src.problems.registry`).
+            max_workers: Number of sandbox workers used to evaluate candidates
+                         concurrently. More than 1 implies sandbox.
+            fast_correctness: Run the test suite in a warm, reusable worker process
+                              with per-test results instead of spawning pytest for
+                              every candidate. Correctness becomes the fraction of
+                              tests passed.
+            sandbox: Evaluate candidates in pre-forked, resource-limited worker
+                     processes (see `src.sandbox.SandboxPool`) instead of importing
+                     them into this process.
+            sandbox_options: Keyword arguments forwarded to `SandboxPool`, e.g.
+                             timeout_s, cpu_time_limit_s, memory_limit_mb,
+                             max_tasks_per_worker and max_rss_mb.
+            persist_corpus: Store benchmark graphs under experiments/corpus and
+                            memory-map them on later runs instead of regenerating.
+            timing_options: Overrides for the benchmark timing engine, see
+                            `src.benchmarking.timing.measure`.
+            scoring_options: Keyword arguments for `scoring.compute_scores`. By
+                             default candidates are ranked on median runtimes and
+                             statistically indistinguishable ones are tied. Pass
+                             weights with a "complexity" key to also score the
+                             fitted runtime growth exponent, and memory_metric="rss"
+                             to score memory on RSS growth instead of the traced heap.
+                             workload="batch" ranks on the amortized per-query
+                             runtime of the batch benchmarks instead.
+            benchmark_options: Benchmark sweep settings forwarded to EvaluatorAgent:
+                               sizes, max_size, time_budget_s, edge_density,
+                               inputs_per_size, profile, profile_lines, rss,
+                               topologies, avg_degree, batch_queries, fuzz_cases and
+                               fuzz_max_size. With several topologies the report
+                               also ranks the candidates per topology.
+            use_cache: Serve candidates whose code, test suite and evaluation
+                       settings are unchanged from experiments/cache instead of
+                       re-testing and re-benchmarking them.
+            cache_max_entries: Size bound of the evaluation cache (LRU eviction).
+            llm_client: Client the DesignerAgent generates candidates with, see
+                        `src.agents.llm_client`. Responses are simulated if omitted.
+            stream_candidates: Evaluate each candidate as soon as the designer
+                               returns it instead of waiting for all of them.
+            queue_size: Bound on designed candidates waiting for evaluation when
+                        streaming; also caps concurrent LLM requests.
+            candidates: Optional subset of the designer's variations to evaluate.
+            reports_dir: Directory receiving the per-experiment reports;
+                         defaults to reports/ in the project root.
+            pipeline_options: Overrides for DEFAULT_PIPELINE_OPTIONS. Every
+                              candidate first runs the cheap tiers: an import
+                              check, a smoke test on smoke_cases tiny inputs,
+                              the test suite and a quick benchmark at quick_size.
+                              A candidate whose quick median is more than
+                              prune_ratio times the leader's (and above
+                              prune_min_ms) skips the full sweep. A quick_size or
+                              prune_ratio of None disables pruning.
+            report: Report outputs, one of REPORT_FORMATS. "json" and "none"
+                    never import matplotlib, pandas or jinja2.
+        """
+        if report not in REPORT_FORMATS:
+            raise ValueError(f"Unknown report format {report!r}; choose from {list(REPORT_FORMATS)}")
         self.problem_name = problem_name
+        self.problem = get_problem(problem_name)
+        self.max_workers = max(1, max_workers)
+        self.fast_correctness = fast_correctness
+        self.sandbox = sandbox or self.max_workers > 1
+        self.sandbox_options = sandbox_options or {}
         self.project_root = Path(PROJECT_ROOT)
-        self.problem_spec_path = self.project_root / "src" / "problems" / self.problem_name / "spec.md"
-        self.test_file_path = self.project_root / "src" / "problems" / self.problem_name / "tests" / "test_shortest_path.py"
+        self.reports_dir = Path(reports_dir) if reports_dir else self.project_root / "reports"
+        self.report = report
+        self.results_log = None
+        self.corpus_dir = str(self.project_root / "experiments" / "corpus") if persist_corpus else None
+        self.timing_options = timing_options
+        self.benchmark_options = benchmark_options or {}
+        self.pipeline_options = {**DEFAULT_PIPELINE_OPTIONS, **(pipeline_options or {})}
+        self.scoring_options = {"runtime_statistic": "median", "ties": True, **(scoring_options or {})}
+        self.stream_candidates = stream_candidates
+        self.queue_size = max(1, queue_size)
+        self.cache = EvaluationCache(self.project_root / "experiments" / "cache", cache_max_entries) if use_cache else None
+        self.problem_spec_path = self.problem.spec_path
+        self.test_file_path = self.problem.test_path
         
         # Agents
-        self.designer = DesignerAgent()
+        self.designer = DesignerAgent(llm_client=llm_client, variations=candidates, problem=problem_name)
         self.implementer = ImplementerAgent()
 
     def _collect_and_save_metadata(self, base_experiment_id: str, seed: int) -> dict:
@@ -49,29 +169,63 @@ class Orchestrator:
         print(f"   - Metadata saved to {metadata_path}")
         return metadata
 
+    def _start_results_log(self, base_experiment_id: str):
+        """Starts an empty results log for the run, see `src.reporting.results_log`."""
+        self.results_log = ResultsLog(self.project_root / "experiments" / base_experiment_id / "results.jsonl")
+        self.results_log.reset()
+        print(f"   - Streaming candidate results to {self.results_log.path}")
+
+    def _log_result(self, job: dict, results: dict) -> dict:
+        """
+        Appends a candidate's final results to the results log.
+
+        Returns:
+            The summary of the results kept in memory for scoring.
+        """
+        record = self._candidate_data(job, results)
+        self.results_log.append(record)
+        return summarize(results)
+
     def _read_problem_spec(self) -> str:
         """Reads the problem specification file."""
         with open(self.problem_spec_path, 'r', encoding='utf-8') as f:
             return f.read()
 
     def _generate_report(self, base_experiment_id: str, scored_candidates: list[dict], metadata: dict):
-        """Generates a full report with JSON, CSV, charts, and HTML."""
+        """Generates the report selected by self.report: JSON and CSV, plus charts and HTML."""
+        if self.report == "none":
+            if scored_candidates:
+                print(f"5. Report disabled; winner: {scored_candidates[0]['id']} "
+                      f"(score {scored_candidates[0]['final_score']})")
+            return
         print("5. Generating final report...")
-        report_dir = self.project_root / "reports" / base_experiment_id
+        report_dir = self.reports_dir / base_experiment_id
         report_dir.mkdir(parents=True, exist_ok=True)
 
-        # 1. Save raw + scored data
+        # 1. Save raw + scored data; full records are streamed from the results log in score order
         json_path = report_dir / "results.json"
         csv_path = report_dir / "results.csv"
         report_data = {
             "experiment_id": base_experiment_id,
             "metadata": metadata,
-            "candidates": scored_candidates,
-            "winner": scored_candidates[0]["id"] if scored_candidates else None
+            "winner": scored_candidates[0]["id"] if scored_candidates else None,
+            "topology_rankings": scoring.rank_by_topology(
+                scored_candidates,
+                runtime_statistic=self.scoring_options.get("runtime_statistic", "mean"),
+                ties=self.scoring_options.get("ties", False),
+            ),
         }
-        export_results.save_json(report_data, json_path)
+        records = ScoredRecords(self.results_log, scored_candidates)
+        export_results.save_json_stream(report_data, records, json_path)
         export_results.candidates_to_csv(scored_candidates, csv_path)
         print(f"   - Saved JSON and CSV results to {report_dir}")
+        if self.report == "json":
+            return
+
+        # Charting and templating pull in matplotlib, pandas and jinja2, so they
+        # are imported only here
+        from jinja2 import Environment, FileSystemLoader
+        from src.reporting import chart_generator
 
         # 2. Generate charts
         chart_generator.runtime_chart(scored_candidates, report_dir / "runtime_chart.png")
@@ -82,13 +236,27 @@ class Orchestrator:
         # 3. Render HTML report
         env = Environment(loader=FileSystemLoader(self.project_root / "src" / "templates"))
         tpl = env.get_template("report_template.html")
-        html = tpl.render(report_data)
         html_path = report_dir / "index.html"
-        html_path.write_text(html, encoding="utf8")
+        tpl.stream(report_data, candidates=records,
+                   has_batch=any(c.get("batch") for c in scored_candidates)).dump(str(html_path), encoding="utf8")
         print(f"   - Saved final HTML report to {html_path}")
 
-    def run_comparison_experiment(self, base_experiment_id: str, seed: int = None):
-        """Runs a full comparison experiment across multiple candidates."""
+    def run_comparison_experiment(self, base_experiment_id: str, seed: int = None, resume: bool = False):
+        """
+        Runs a full comparison experiment across multiple candidates.
+
+        Each candidate's results are checkpointed to
+        experiments/<base_experiment_id>/<variation_id>/result.json and
+        appended to the JSON Lines log experiments/<base_experiment_id>/results.jsonl
+        as soon as its evaluation finishes. Only a summary of each candidate
+        stays in memory; the report streams the full records back from the log.
+
+        Args:
+            base_experiment_id: Identifier of the experiment (output directory name).
+            seed: Optional RNG seed for reproducibility.
+            resume: Skip candidates whose checkpoint matches their current code
+                    and evaluation settings, e.g. after an interrupted run.
+        """
         if seed is not None:
             random.seed(seed)
             print(f"--- Seeding RNG with {seed} for reproducibility ---")
@@ -97,74 +265,491 @@ class Orchestrator:
 
         # 0. Collect and save metadata
         metadata = self._collect_and_save_metadata(base_experiment_id, seed)
+        self._start_results_log(base_experiment_id)
 
         # 1. Read Problem Spec
         print("1. Reading problem specification...")
         problem_spec = self._read_problem_spec()
 
-        # 2. Design Algorithm Variations
-        print("2. Designing algorithm variations with DesignerAgent...")
-        candidates = self.designer.propose_algorithms(problem_spec)
-        print(f"   - {len(candidates)} candidates proposed.")
-
-        candidates_data = []
-        for i, candidate in enumerate(candidates):
-            variation_id = candidate['variation_id']
-            print(f"\n--- Evaluating Candidate {i+1}/{len(candidates)}: {variation_id} ---")
-
-            # 3. Implement Algorithm & Save Artifacts
-            solution_dir = self.project_root / "experiments" / base_experiment_id / variation_id
-            solution_dir.mkdir(parents=True, exist_ok=True)
-            
-            (solution_dir / "prompt.txt").write_text(candidate['prompt'])
-            (solution_dir / "llm_output.txt").write_text(candidate['code'])
-
-            solution_file_path = solution_dir / "solution.py"
-            solution_module_path = f"experiments.{base_experiment_id}.{variation_id}.solution"
-            
-            (self.project_root / "experiments" / base_experiment_id / "__init__.py").touch()
-            (solution_dir / "__init__.py").touch()
-
-            self.implementer.save_code(candidate['code'], str(solution_file_path))
-
-            # 4. Evaluate Algorithm
-            self._update_test_path(solution_module_path)
-            evaluator = EvaluatorAgent(solution_module_path=solution_module_path, test_path=str(self.test_file_path))
-            results = evaluator.evaluate()
-            
-            # Append data for scoring
-            candidate_result = {
-                "id": variation_id,
-                "name": variation_id,
-                **results
-            }
-            candidates_data.append(candidate_result)
-
-            # Save logs
-            (solution_dir / "run.log").write_text(results['pytest_output'])
-            if results['correctness'] == 0.0:
-                (solution_dir / "error.log").write_text(results['pytest_output'])
+        # 2-4. Design, implement and evaluate algorithm variations
+        jobs, results_list = self._run_generation(base_experiment_id, problem_spec, seed, resume)
+        candidates_data = [self._candidate_data(job, results) for job, results in zip(jobs, results_list)]
 
         # 5. Score candidates and generate final report
-        scored_candidates = scoring.compute_scores(candidates_data)
+        scored_candidates = scoring.compute_scores(candidates_data, **self.scoring_options)
         self._generate_report(base_experiment_id, scored_candidates, metadata)
 
         print(f"\n--- Comparison Experiment {base_experiment_id} Finished ---")
 
-    def _update_test_path(self, solution_module_path: str):
-        """Updates the test file to point to the correct solution module."""
-        with open(self.test_file_path, 'r') as f:
-            content = f.read()
-        
-        new_content = []
-        for line in content.splitlines():
-            if line.strip().startswith("SOLUTION_MODULE_PATH"):
-                new_content.append(f"SOLUTION_MODULE_PATH = \"{solution_module_path}\"")
+    def run_optimization(self, base_experiment_id: str, seed: int = None, resume: bool = False,
+                         max_generations: int = 5, top_k: int = 2, patience: int = 2,
+                         min_improvement: float = 0.01, max_evaluations: int = None, time_budget_s: float = None):
+        """
+        Runs an evolutionary optimization: after an initial comparison, the top_k
+        correct candidates by final_score (with their measurements and profiling
+        hot spots) are repeatedly handed back to the designer to breed faster
+        variants, and the whole population is re-ranked after every generation.
+
+        The search stops after max_generations, once the fastest correct
+        candidate's average runtime has improved by less than min_improvement
+        (relative) for `patience` consecutive generations, or when the
+        evaluation or time budget runs out. Improvements within timing noise
+        (overlapping median confidence intervals) do not count.
+
+        Args:
+            base_experiment_id: Identifier of the experiment (output directory name).
+            seed: Optional RNG seed for reproducibility.
+            resume: Reuse checkpointed candidates, see run_comparison_experiment.
+            max_generations: Maximum number of generations after the initial one.
+            top_k: Number of parents improved per generation.
+            patience: Generations without sufficient improvement before stopping.
+            min_improvement: Relative runtime improvement of the leader that
+                             counts as progress, e.g. 0.01 for 1%.
+            max_evaluations: Optional cap on the number of candidates evaluated.
+            time_budget_s: Optional wall-clock budget for the whole search.
+        """
+        if seed is not None:
+            random.seed(seed)
+            print(f"--- Seeding RNG with {seed} for reproducibility ---")
+        print(f"--- Starting Optimization {base_experiment_id} for Problem: {self.problem_name} ---")
+        started = time.perf_counter()
+        metadata = self._collect_and_save_metadata(base_experiment_id, seed)
+        self._start_results_log(base_experiment_id)
+        print("1. Reading problem specification...")
+        problem_spec = self._read_problem_spec()
+
+        print("\n=== Generation 0 ===")
+        jobs, results_list = self._run_generation(base_experiment_id, problem_spec, seed, resume)
+        population = {job["variation_id"]: (job, results) for job, results in zip(jobs, results_list)}
+        evaluations = len(jobs)
+        scored = self._score_population(population)
+        best = self._fastest_correct(scored)
+        best_runtime = best["avg_runtime_ms"] if best else float("inf")
+        history = [{"generation": 0, "new_candidates": len(jobs), "leader": best["id"] if best else None,
+                    "leader_runtime_ms": best_runtime, "improvement": None}]
+        stale = 0
+        stop_reason = "max_generations"
+
+        for generation in range(1, max_generations + 1):
+            if time_budget_s is not None and time.perf_counter() - started >= time_budget_s:
+                stop_reason = "time_budget"
+                break
+            remaining = None if max_evaluations is None else max_evaluations - evaluations
+            if remaining is not None and remaining <= 0:
+                stop_reason = "evaluation_budget"
+                break
+            parents = [self._parent_data(population, c) for c in scored if c["correctness"] >= 1.0][:top_k]
+            if remaining is not None:
+                parents = parents[:remaining]
+            if not parents:
+                stop_reason = "no_correct_candidates"
+                break
+
+            print(f"\n=== Generation {generation}: improving {', '.join(p['id'] for p in parents)} ===")
+            known_sources = {normalize_source(job["code"]) for job, _ in population.values()}
+            jobs, results_list = self._run_generation(base_experiment_id, problem_spec, seed, resume, parents=parents,
+                                                      generation=generation, known_sources=known_sources)
+            for job, results in zip(jobs, results_list):
+                population[job["variation_id"]] = (job, results)
+            evaluations += len(jobs)
+
+            scored = self._score_population(population)
+            fastest = self._fastest_correct(scored)
+            leader_runtime = fastest["avg_runtime_ms"] if fastest else float("inf")
+            improvement = 0.0
+            # Only a new candidate that is measurably faster than the previous best counts as progress
+            if fastest and fastest["id"] != (best or {}).get("id") and leader_runtime < best_runtime \
+                    and not (best and scoring.runtimes_indistinguishable(fastest, best)):
+                improvement = 1.0 if best is None else (best_runtime - leader_runtime) / best_runtime
+                best, best_runtime = fastest, leader_runtime
+            leader = fastest["id"] if fastest else None
+            history.append({"generation": generation, "new_candidates": len(jobs), "leader": leader,
+                            "leader_runtime_ms": leader_runtime, "improvement": improvement})
+            print(f"   - Generation {generation}: {len(jobs)} new candidates, fastest {leader} "
+                  f"({leader_runtime:.3f}ms, {improvement:.1%} faster)")
+            stale = 0 if improvement >= min_improvement else stale + 1
+            if stale >= patience:
+                stop_reason = "plateau"
+                break
+
+        print(f"\n--- Optimization stopped ({stop_reason}) after {len(history) - 1} generations "
+              f"and {evaluations} evaluations ---")
+        optimization = {"stop_reason": stop_reason, "evaluations": evaluations, "history": history}
+        self._generate_report(base_experiment_id, scored, {**metadata, "optimization": optimization})
+        print(f"\n--- Optimization {base_experiment_id} Finished ---")
+        return optimization
+
+    def _score_population(self, population: dict) -> list[dict]:
+        """Ranks every candidate evaluated so far."""
+        candidates_data = [self._candidate_data(job, results) for job, results in population.values()]
+        return scoring.compute_scores(candidates_data, **self.scoring_options)
+
+    @staticmethod
+    def _fastest_correct(scored: list[dict]):
+        """The fully correct candidate with the lowest average runtime, or None."""
+        return min((c for c in scored if c["correctness"] >= 1.0 and not c.get("pruned")),
+                   key=lambda c: c["avg_runtime_ms"], default=None)
+
+    @staticmethod
+    def _candidate_data(job: dict, results: dict) -> dict:
+        """Builds the scoring/report entry of an evaluated candidate."""
+        candidate = {"id": job["variation_id"], "name": job["variation_id"], **results}
+        if job.get("parent_id"):
+            candidate["parent_id"] = job["parent_id"]
+            candidate["generation"] = job["generation"]
+        return candidate
+
+    @staticmethod
+    def _parent_data(population: dict, scored_candidate: dict) -> dict:
+        """What the designer is told about a parent: its code, measurements and hot spots."""
+        job, _ = population[scored_candidate["id"]]
+        return {
+            "id": scored_candidate["id"],
+            "code": job["code"],
+            "avg_runtime_ms": scored_candidate["avg_runtime_ms"],
+            "runtime_exponent": scored_candidate["runtime_exponent"],
+            "hot_spots": (scored_candidate.get("profile") or {}).get("hot_spots", []),
+        }
+
+    def _run_generation(self, base_experiment_id: str, problem_spec: str, seed: int, resume: bool,
+                        parents: list[dict] = None, generation: int = 0, known_sources: set = None):
+        """
+        Designs and evaluates one round of candidates: the initial variations,
+        or improved variants of parents. Candidates whose normalized source is
+        in known_sources were already evaluated and are dropped.
+
+        Returns:
+            The jobs and the summaries of their results, see `_log_result`.
+        """
+        if self.stream_candidates:
+            print("2. Streaming algorithm variations from DesignerAgent into evaluation...")
+            if parents:
+                stream = self.designer.stream_improvements(problem_spec, parents, generation, max_in_flight=self.queue_size)
             else:
-                new_content.append(line)
-        
-        with open(self.test_file_path, 'w') as f:
-            f.write("\n".join(new_content))
+                stream = self.designer.stream_algorithms(problem_spec, max_in_flight=self.queue_size)
+            return asyncio.run(self._stream_and_evaluate(base_experiment_id, stream, seed, resume,
+                                                          known_sources, generation))
+
+        print("2. Designing algorithm variations with DesignerAgent...")
+        if parents:
+            candidates = self.designer.propose_improvements(problem_spec, parents, generation)
+        else:
+            candidates = self.designer.propose_algorithms(problem_spec)
+        print(f"   - {len(candidates)} candidates proposed.")
+        candidates = [c for c in candidates if not self._is_known(c, known_sources)]
+        return self._design_and_evaluate(base_experiment_id, candidates, seed, resume, generation)
+
+    @staticmethod
+    def _is_known(candidate: dict, known_sources: set) -> bool:
+        if known_sources and normalize_source(candidate["code"]) in known_sources:
+            print(f"   - {candidate['variation_id']}: identical to an evaluated candidate, skipped")
+            return True
+        return False
+
+    def _design_and_evaluate(self, base_experiment_id: str, candidates: list[dict], seed: int, resume: bool,
+                             generation: int = 0):
+        """Evaluates designed candidates that are not already checkpointed or cached."""
+
+        # 3. Implement Algorithms & Save Artifacts
+        cache_config = self._cache_config(seed)
+        jobs = [self._prepare_job(base_experiment_id, candidate, cache_config, generation) for candidate in candidates]
+
+        # 4. Evaluate Algorithms, reusing checkpoints and cached results where possible
+        results_list = [self._reuse_result(job, resume) for job in jobs]
+        pending = [i for i, results in enumerate(results_list) if results is None]
+        # Reused candidates compete for the quick-tier lead like in _stream_and_evaluate
+        leader = min((r["quick"]["median_ms"] for r in results_list
+                      if r is not None and r.get("quick") and not r.get("pruned")), default=None)
+        results_list = [None if results is None else self._log_result(job, results)
+                        for job, results in zip(jobs, results_list)]
+
+        def on_result(index, results):
+            i = pending[index]
+            self._store_result(jobs[i], results)
+            results_list[i] = self._log_result(jobs[i], results)
+
+        self._evaluate_jobs([jobs[i] for i in pending], seed, on_result, leader_ms=leader)
+        return jobs, results_list
+
+    async def _stream_and_evaluate(self, base_experiment_id: str, stream, seed: int, resume: bool,
+                                   known_sources: set = None, generation: int = 0):
+        """
+        Evaluates candidates while the designer is still generating the others.
+
+        The designer's stream (see `DesignerAgent.stream_algorithms`) feeds a bounded queue drained by max_workers
+        consumers; when evaluation falls behind, the queue fills up and the
+        designer stops issuing new LLM requests until a slot frees up.
+
+        Returns:
+            The jobs and the summaries of their results, in the order
+            evaluations finished.
+        """
+        cache_config = self._cache_config(seed)
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        jobs, results_list = [], []
+        loop = asyncio.get_running_loop()
+
+        async def produce():
+            async for candidate in stream:
+                print(f"   - {candidate['variation_id']}: received from designer")
+                if not self._is_known(candidate, known_sources):
+                    await queue.put(self._prepare_job(base_experiment_id, candidate, cache_config, generation))
+            for _ in range(self.max_workers):
+                await queue.put(None)
+
+        leader = []  # quick-tier medians seen so far
+
+        async def consume(evaluate, executor):
+            while (job := await queue.get()) is not None:
+                results = self._reuse_result(job, resume)
+                if results is None:
+                    results = await loop.run_in_executor(executor, evaluate, job, None)
+                    if results.get("failed_stage") is None:
+                        if results.get("quick"):
+                            leader.append(results["quick"]["median_ms"])
+                        pruned = self._pruning(job, results, min(leader, default=None))
+                        if pruned is not None:
+                            results = {**results, "pruned": pruned}
+                        else:
+                            results = await loop.run_in_executor(executor, evaluate, job, results)
+                    self._store_result(job, results)
+                elif results.get("quick") and not results.get("pruned"):
+                    leader.append(results["quick"]["median_ms"])
+                jobs.append(job)
+                results_list.append(self._log_result(job, results))
+
+        with self._job_evaluator(seed) as evaluate, ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            await asyncio.gather(produce(), *(consume(evaluate, executor) for _ in range(self.max_workers)))
+        print(f"   - {len(jobs)} candidates designed and evaluated.")
+        return jobs, results_list
+
+    def _prepare_job(self, base_experiment_id: str, candidate: dict, cache_config: dict, generation: int = 0) -> dict:
+        """Saves a candidate's artifacts and solution module and computes its evaluation key."""
+        variation_id = candidate['variation_id']
+        solution_dir = self.project_root / "experiments" / base_experiment_id / variation_id
+        solution_dir.mkdir(parents=True, exist_ok=True)
+
+        (solution_dir / "prompt.txt").write_text(candidate['prompt'])
+        (solution_dir / "llm_output.txt").write_text(candidate['code'])
+
+        solution_file_path = solution_dir / "solution.py"
+        solution_module_path = f"experiments.{base_experiment_id}.{variation_id}.solution"
+
+        (self.project_root / "experiments" / base_experiment_id / "__init__.py").touch()
+        (solution_dir / "__init__.py").touch()
+
+        self.implementer.save_code(candidate['code'], str(solution_file_path))
+        return {
+            "variation_id": variation_id,
+            "module_path": solution_module_path,
+            "solution_dir": solution_dir,
+            "code": candidate['code'],
+            "key": evaluation_key(candidate['code'], self.test_file_path, cache_config),
+            "parent_id": candidate.get('parent_id'),
+            "generation": generation
+        }
+
+    def _reuse_result(self, job: dict, resume: bool):
+        """
+        Returns the checkpointed (if resuming) or cached results of job, or None.
+        A pruned checkpoint is not reused: whether to prune depends on the
+        current run's quick-tier leader, so the candidate is evaluated again.
+        """
+        if resume:
+            checkpointed = load_checkpoint(job["solution_dir"], job["key"])
+            if checkpointed is not None and checkpointed.get("pruned"):
+                print(f"   - {job['variation_id']}: pruned in the checkpointed run, re-evaluating")
+            elif checkpointed is not None:
+                print(f"   - {job['variation_id']}: resumed from checkpoint")
+                return checkpointed
+        if self.cache is not None:
+            cached = self.cache.get(job["key"])
+            if cached is not None:
+                print(f"   - {job['variation_id']}: served from evaluation cache")
+                results = {**cached, "cached": True}
+                self._record_result(job, results)
+                return results
+        return None
+
+    def _store_result(self, job: dict, results: dict):
+        """
+        Caches and checkpoints the results of a fresh evaluation. Pruned results
+        depend on the other candidates of the run, so they are not cached.
+        """
+        results["cached"] = False
+        if self.cache is not None and not results.get("sandbox_error") and not results.get("pruned"):
+            self.cache.put(job["key"], results)
+        self._record_result(job, results)
+
+    def _evaluator_options(self, seed: int) -> dict:
+        """Keyword arguments shared by every EvaluatorAgent of a run."""
+        return {
+            "problem": self.problem_name,
+            "seed": seed,
+            "corpus_dir": self.corpus_dir,
+            "timing_options": self.timing_options,
+            "smoke_cases": self.pipeline_options["smoke_cases"],
+            "quick_size": self.pipeline_options["quick_size"],
+            **self.benchmark_options
+        }
+
+    def _cache_config(self, seed: int) -> dict:
+        """Evaluation settings that affect results, hashed into cache keys."""
+        options = self._evaluator_options(seed)
+        options.pop("corpus_dir")
+        return {"fast_correctness": self.fast_correctness, **options}
+
+    def _record_result(self, job: dict, results: dict):
+        """Checkpoints a candidate's results and writes its logs."""
+        solution_dir = job["solution_dir"]
+        save_checkpoint(solution_dir, job["key"], results)
+        (solution_dir / "run.log").write_text(results['pytest_output'])
+        if results['correctness'] < 1.0:
+            (solution_dir / "error.log").write_text(results['pytest_output'])
+
+    def _evaluate_jobs(self, jobs: list[dict], seed: int = None, on_result=None, leader_ms: float = None) -> list[dict]:
+        """
+        Evaluates candidates in sandbox workers or in this process.
+
+        Every candidate runs the cheap tiers first (see `EvaluatorAgent.evaluate_quick`),
+        so the leader of the quick benchmark is known before any full sweep;
+        candidates far behind it are pruned (see `_pruning`), the others are
+        fully benchmarked.
+
+        Args:
+            jobs: The candidates to evaluate.
+            seed: Seed forwarded to the evaluators.
+            on_result: Optional callback(index, results), called in this thread
+                       as soon as the final results of jobs[index] are known.
+            leader_ms: Best quick-tier median of candidates evaluated before,
+                       e.g. served from the cache; the leader is the fastest
+                       of it and the quick medians of jobs.
+
+        Returns:
+            The evaluation results, in the same order as `jobs`.
+        """
+        if not jobs:
+            return []
+        results_list = [None] * len(jobs)
+
+        def finish(i, results):
+            results_list[i] = results
+            if on_result is not None:
+                on_result(i, results)
+
+        with self._job_evaluator(seed) as evaluate:
+            quick_list = self._run_tier(evaluate, jobs)
+            quick_ms = [r["quick"]["median_ms"] for r in quick_list if r.get("failed_stage") is None and r.get("quick")]
+            leader = min(quick_ms + ([] if leader_ms is None else [leader_ms]), default=None)
+            survivors = []
+            for i, results in enumerate(quick_list):
+                if results.get("failed_stage") is not None:
+                    finish(i, results)
+                elif (pruned := self._pruning(jobs[i], results, leader)) is not None:
+                    finish(i, {**results, "pruned": pruned})
+                else:
+                    survivors.append(i)
+            self._run_tier(evaluate, [jobs[i] for i in survivors], [quick_list[i] for i in survivors],
+                           on_result=lambda k, results: finish(survivors[k], results))
+        return results_list
+
+    def _run_tier(self, evaluate, jobs: list[dict], quick_results: list[dict] = None, on_result=None) -> list[dict]:
+        """
+        Runs one tier for every job: the cheap tiers, or, given their results,
+        the full benchmarks. Jobs run one after another in this process, or
+        concurrently in the sandbox workers.
+        """
+        tier = "Quick tier" if quick_results is None else "Full benchmarks"
+        previous = quick_results or [None] * len(jobs)
+        results_list = [None] * len(jobs)
+        if not jobs:
+            return results_list
+        if not self.sandbox:
+            for i, job in enumerate(jobs):
+                print(f"\n--- {tier}: Candidate {i+1}/{len(jobs)}: {job['variation_id']} ---")
+                results_list[i] = evaluate(job, previous[i])
+                if on_result is not None:
+                    on_result(i, results_list[i])
+            return results_list
+
+        print(f"\n--- {tier}: {len(jobs)} candidates with {self.max_workers} sandbox workers ---")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(evaluate, job, previous[i]): i for i, job in enumerate(jobs)}
+            for future in as_completed(futures):
+                i = futures[future]
+                results_list[i] = future.result()
+                if on_result is not None:
+                    on_result(i, results_list[i])
+        return results_list
+
+    def _pruning(self, job: dict, results: dict, leader_ms: float):
+        """
+        Decides whether a candidate that passed the cheap tiers skips the full sweep.
+
+        Returns:
+            None to benchmark it fully, or the reason it was pruned: its quick
+            median, the leader's and the slowdown factor.
+        """
+        ratio = self.pipeline_options["prune_ratio"]
+        quick = results.get("quick")
+        if not ratio or not quick or leader_ms is None:
+            return None
+        quick_ms = quick["median_ms"]
+        if quick_ms < self.pipeline_options["prune_min_ms"] or quick_ms <= leader_ms * ratio:
+            return None
+        slowdown = quick_ms / max(leader_ms, 1e-9)
+        print(f"   - {job['variation_id']}: pruned, {slowdown:.1f}x slower than the leader at size {quick['size']} "
+              f"({quick_ms:.2f}ms vs {leader_ms:.2f}ms)")
+        return {"quick_ms": quick_ms, "leader_quick_ms": leader_ms, "slowdown": slowdown}
+
+    @contextmanager
+    def _job_evaluator(self, seed: int = None):
+        """
+        Yields a function evaluate(job, quick_results=None) that runs the
+        cheap tiers of one job or, given their results, its full benchmarks,
+        backed by a bounded pool of sandbox worker processes or by this
+        process. In sandbox mode the function is thread-safe, so up to
+        max_workers jobs can run at once.
+        """
+        if self.sandbox:
+            initializer = preload_pytest if self.fast_correctness else None
+            with SandboxPool(size=self.max_workers, initializer=initializer, **self.sandbox_options) as pool:
+                yield lambda job, quick_results=None: self._evaluate_sandboxed(pool, job, seed, quick_results)
+            return
+
+        test_runner = WarmTestRunner() if self.fast_correctness else None
+        try:
+            def evaluate(job, quick_results=None):
+                evaluator = EvaluatorAgent(solution_module_path=job["module_path"], test_path=str(self.test_file_path),
+                                           test_runner=test_runner, **self._evaluator_options(seed))
+                if quick_results is None:
+                    return evaluator.evaluate_quick()
+                return evaluator.evaluate_full(quick_results)
+            yield evaluate
+        finally:
+            if test_runner is not None:
+                test_runner.close()
+
+    def _evaluate_sandboxed(self, pool: SandboxPool, job: dict, seed: int = None, quick_results: dict = None) -> dict:
+        """
+        Evaluates a candidate in a sandbox worker. A candidate that times out,
+        exceeds its resource limits or crashes its worker gets a failed result
+        instead of aborting the run.
+        """
+        try:
+            return pool.run(_evaluate_candidate, job["module_path"], str(self.test_file_path),
+                            self.fast_correctness, self._evaluator_options(seed), quick_results)
+        except SandboxError as e:
+            print(f"   - {job['variation_id']}: sandboxed evaluation failed: {str(e).splitlines()[0]}")
+            return {
+                "correctness": 0.0,
+                "pytest_output": str(e),
+                "tests": [],
+                "runtime_ms": {},
+                "mem_kb": {},
+                "failed_stage": "sandbox",
+                "sandbox_error": True
+            }
 
 if __name__ == "__main__":
     print("This is a class file. Please use run.py to execute an experiment.")
@@ -0,0 +1,121 @@
+"""
+Problem registry.
+
+Every problem lives in its own package under src/problems/<name>/ with a
+spec.md, a pytest suite in tests/ and a problem.py defining PROBLEM, a
+`Problem` describing everything the pipeline needs to know about it: the
+solution's entry point, how to generate benchmark and fuzzing inputs, the
+reference oracle, how to validate an answer and which complexity models to
+fit. Problems are looked up by package name, so adding a problem does not
+require changes anywhere else.
+"""
+from importlib import import_module
+from pathlib import Path
+
+from src.benchmarking.complexity import COMPLEXITY_MODELS
+
+PROBLEMS_DIR = Path(__file__).resolve().parent
+
+
+class Problem:
+    """A benchmark problem and the hooks the evaluation pipeline calls for it."""
+
+    def __init__(self, name: str, entry_point: str, generate_input, oracle, check_answer, fuzz_input,
+                 shrink=None, input_families: tuple = ("random",), input_size=None, work_size=None,
+                 expected_work_size=None,
+                 complexity_models: dict = None, size_start: int = 8, size_factor: float = 2,
+                 variations: dict = None, simulated_code: dict = None, query_batch=None, test_path: str = None,
+                 default_input_options: dict = None):
+        """
+        Args:
+            name: Package name under src/problems.
+            entry_point: Name of the function every candidate defines.
+            generate_input: f(size, seed, family, store=None, **options) ->
+                            argument tuple of one benchmark call. seed is a
+                            tuple; family is one of input_families; options are
+                            the benchmark's input options (e.g. edge_density),
+                            unknown ones must be ignored. store is an optional
+                            `CorpusStore` the problem may persist inputs in.
+                            Called through `src.benchmarking.corpus.get_input`.
+            oracle: Trusted reference solution with the entry point's signature.
+            check_answer: f(args, answer, expected) -> None if the candidate's
+                          answer to args is correct given the oracle's expected
+                          answer, otherwise a description of the problem.
+            fuzz_input: f(rng, size) -> a random argument tuple of about that
+                        size for differential fuzzing, drawn from a numpy
+                        Generator.
+            shrink: Optional f(args) yielding smaller variants of args, used
+                    to minimize fuzzing counterexamples.
+            input_families: Named input distributions (e.g. graph topologies);
+                            the first is the default.
+            input_size: Optional f(args) -> size n of an input; defaults to the
+                        length of its first argument.
+            work_size: Optional f(args) -> secondary size m of an input (e.g.
+                       the number of edges) for the complexity models.
+            expected_work_size: Optional f(size, family, **options) -> expected
+                                m of a generated input, for extrapolation.
+            complexity_models: Models fitted to the measurements, see
+                               `src.benchmarking.complexity`.
+            size_start: First size of the default geometric size series.
+            size_factor: Growth factor of the default size series.
+            variations: Algorithm variations the designer asks for, mapping an
+                        id to an approach hint.
+            simulated_code: Hardcoded solution per variation, used when no LLM
+                            client is configured.
+            query_batch: Optional f(size, num_queries, seed) -> list of queries
+                         against one generated input of that size, for batch
+                         query benchmarks (see `src.benchmarking.batch`). A
+                         query is the tuple of entry-point arguments after
+                         the first; problems without it have no batch mode.
+            test_path: Test suite, relative to the problem directory; defaults
+                       to tests/test_<name>.py.
+            default_input_options: Defaults of the generator options passed
+                                   to generate_input and expected_work_size,
+                                   e.g. {"edge_density": 0.5}.
+        """
+        self.name = name
+        self.entry_point = entry_point
+        self.generate_input = generate_input
+        self.oracle = oracle
+        self.check_answer = check_answer
+        self.fuzz_input = fuzz_input
+        self.shrink = shrink
+        self.input_families = tuple(input_families)
+        self.input_size = input_size or (lambda args: len(args[0]))
+        self.work_size = work_size
+        self.expected_work_size = expected_work_size
+        self.complexity_models = complexity_models or COMPLEXITY_MODELS
+        self.size_start = size_start
+        self.size_factor = size_factor
+        self.variations = variations or {}
+        self.simulated_code = simulated_code or {}
+        self.query_batch = query_batch
+        self.default_input_options = dict(default_input_options or {})
+        self.directory = PROBLEMS_DIR / name
+        self.spec_path = self.directory / "spec.md"
+        self.test_path = self.directory / (test_path or f"tests/test_{name}.py")
+
+    def input_options(self, **options) -> dict:
+        """The default input options, overridden by the given ones that are not None."""
+        return {**self.default_input_options, **{k: v for k, v in options.items() if v is not None}}
+
+    def format_call(self, args: tuple) -> str:
+        """Renders a call of the entry point, for counterexample reports."""
+        return f"{self.entry_point}({', '.join(repr(a) for a in args)})"
+
+
+def available_problems() -> list[str]:
+    """Names of the problem packages that define a problem.py."""
+    return sorted(p.parent.name for p in PROBLEMS_DIR.glob("*/problem.py"))
+
+
+def get_problem(name: str) -> Problem:
+    """
+    Returns the registered problem of a package under src/problems.
+
+    Raises:
+        ValueError: If there is no such problem.
+    """
+    if name not in available_problems():
+        raise ValueError(f"Unknown problem {name!r}; available: {available_problems()}")
+    return import_module(f"src.problems.{name}.problem").PROBLEM
@@ -0,0 +1,286 @@
+"""
+Candidate algorithm variations for the shortest path problem.
+"""
+import textwrap
+
+# Algorithm variations requested from the LLM, one prompt each
+VARIATIONS = {
+    "dijkstra_optimal": "Dijkstra's algorithm with a binary-heap (heapq) priority queue.",
+    "dijkstra_inefficient_list": "Dijkstra's algorithm that scans a plain list for the closest unvisited node.",
+    "dijkstra_buggy_edge_case": "A minimal Dijkstra variant that keeps edge-case handling short.",
+    "bellman_ford_correct": "The Bellman-Ford algorithm, which also supports negative edge weights.",
+    "bellman_ford_sssp_cache": "Bellman-Ford implementing the optional build_index/query API, caching the "
+                               "shortest-path tree of every queried source for later queries.",
+}
+
+_OPTIMAL_CODE = textwrap.dedent('''
+    import heapq
+
+    def find_shortest_path(graph, start_node, end_node):
+        all_nodes = set(graph.keys())
+        for node in graph:
+            all_nodes.update(graph[node].keys())
+
+        distances = {node: float('inf') for node in all_nodes}
+        if start_node not in distances:
+            return float('inf'), []
+        distances[start_node] = 0
+
+        previous_nodes = {node: None for node in all_nodes}
+        priority_queue = [(0, start_node)]
+
+        while priority_queue:
+            current_distance, current_node = heapq.heappop(priority_queue)
+
+            if current_distance > distances[current_node]:
+                continue
+
+            if current_node == end_node:
+                break
+
+            for neighbor, weight in graph.get(current_node, {}).items():
+                distance = current_distance + weight
+
+                if distance < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = distance
+                    previous_nodes[neighbor] = current_node
+                    heapq.heappush(priority_queue, (distance, neighbor))
+
+        path = []
+        current = end_node
+        if current not in previous_nodes:
+            return float('inf'), []
+
+        while current is not None:
+            path.insert(0, current)
+            current = previous_nodes[current]
+
+        if distances.get(end_node, float('inf')) == float('inf'):
+            return float('inf'), []
+
+        if start_node == end_node:
+            return 0, [start_node]
+
+        if path and path[0] == start_node:
+            return distances[end_node], path
+        else:
+            return float('inf'), []
+''')
+
+_INEFFICIENT_CODE = textwrap.dedent('''
+    # Inefficient version using a list instead of a priority queue
+    def find_shortest_path(graph, start_node, end_node):
+        all_nodes = set(graph.keys())
+        for node in graph:
+            all_nodes.update(graph[node].keys())
+
+        distances = {node: float('inf') for node in all_nodes}
+        if start_node not in distances:
+            return float('inf'), []
+        distances[start_node] = 0
+
+        previous_nodes = {node: None for node in all_nodes}
+        nodes_to_visit = list(all_nodes)
+
+        while nodes_to_visit:
+            # Find node with smallest distance
+            current_node = min(nodes_to_visit, key=lambda node: distances[node])
+            nodes_to_visit.remove(current_node)
+
+            if distances[current_node] == float('inf') or current_node == end_node:
+                break
+
+            for neighbor, weight in graph.get(current_node, {}).items():
+                distance = distances[current_node] + weight
+                if distance < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = distance
+                    previous_nodes[neighbor] = current_node
+
+        path = []
+        current = end_node
+        if current not in previous_nodes:
+            return float('inf'), []
+        while current is not None:
+            path.insert(0, current)
+            current = previous_nodes[current]
+
+        if distances.get(end_node, float('inf')) == float('inf'):
+            return float('inf'), []
+        if start_node == end_node:
+            return 0, [start_node]
+        if path and path[0] == start_node:
+            return distances[end_node], path
+        else:
+            return float('inf'), []
+''')
+
+_BUGGY_CODE = textwrap.dedent('''
+    import heapq
+
+    # Buggy version: Fails the start_node == end_node test
+    def find_shortest_path(graph, start_node, end_node):
+        if start_node == end_node:
+            # Incorrectly returns an empty path
+            return 0, [] 
+
+        all_nodes = set(graph.keys())
+        for node in graph:
+            all_nodes.update(graph[node].keys())
+
+        distances = {node: float('inf') for node in all_nodes}
+        if start_node not in distances:
+            return float('inf'), []
+        distances[start_node] = 0
+
+        previous_nodes = {node: None for node in all_nodes}
+        priority_queue = [(0, start_node)]
+
+        while priority_queue:
+            current_distance, current_node = heapq.heappop(priority_queue)
+
+            if current_distance > distances[current_node]:
+                continue
+
+            if current_node == end_node:
+                break
+
+            for neighbor, weight in graph.get(current_node, {}).items():
+                distance = current_distance + weight
+
+                if distance < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = distance
+                    previous_nodes[neighbor] = current_node
+                    heapq.heappush(priority_queue, (distance, neighbor))
+
+        path = []
+        current = end_node
+        if current not in previous_nodes:
+            return float('inf'), []
+
+        while current is not None:
+            path.insert(0, current)
+            current = previous_nodes[current]
+
+        if distances.get(end_node, float('inf')) == float('inf'):
+            return float('inf'), []
+
+        if path and path[0] == start_node:
+            return distances[end_node], path
+        else:
+            return float('inf'), []
+''')
+
+_BELLMAN_FORD_CODE = textwrap.dedent('''
+    # Bellman-Ford algorithm, capable of handling negative weights.
+    def find_shortest_path(graph, start_node, end_node):
+        all_nodes = set(graph.keys())
+        for node in graph:
+            all_nodes.update(graph[node].keys())
+
+        distances = {node: float('inf') for node in all_nodes}
+        if start_node not in distances:
+            return float('inf'), []
+        distances[start_node] = 0
+
+        previous_nodes = {node: None for node in all_nodes}
+
+        for _ in range(len(all_nodes) - 1):
+            for node in all_nodes:
+                for neighbor, weight in graph.get(node, {}).items():
+                    if distances[node] != float('inf') and distances[node] + weight < distances[neighbor]:
+                        distances[neighbor] = distances[node] + weight
+                        previous_nodes[neighbor] = node
+
+        # Check for negative weight cycles (optional for this problem spec)
+        # but good practice.
+        for node in all_nodes:
+            for neighbor, weight in graph.get(node, {}).items():
+                if distances[node] != float('inf') and distances[node] + weight < distances[neighbor]:
+                    # Negative cycle detected
+                    return float('-inf'), []
+
+        path = []
+        current = end_node
+        if current not in previous_nodes and start_node != end_node:
+             # Handle unreachable nodes when start/end are different
+            if distances[end_node] == float('inf'):
+                 return float('inf'), []
+
+        while current is not None:
+            path.insert(0, current)
+            current = previous_nodes[current]
+
+        if distances.get(end_node, float('inf')) == float('inf'):
+            return float('inf'), []
+
+        if start_node == end_node:
+            return 0, [start_node]
+
+        if path and path[0] == start_node:
+            return distances[end_node], path
+        else:
+            return float('inf'), []
+''')
+
+_SSSP_CACHE_CODE = textwrap.dedent('''
+    # Bellman-Ford with the optional batch API: the shortest-path tree of
+    # every queried source is computed once and reused by later queries.
+    def build_index(graph):
+        all_nodes = set(graph.keys())
+        for node in graph:
+            all_nodes.update(graph[node].keys())
+        edges = [(node, neighbor, weight) for node in graph for neighbor, weight in graph[node].items()]
+        return {"nodes": all_nodes, "edges": edges, "trees": {}}
+
+    def _shortest_path_tree(index, start_node):
+        distances = {node: float('inf') for node in index["nodes"]}
+        distances[start_node] = 0
+        previous_nodes = {}
+        for _ in range(len(index["nodes"]) - 1):
+            changed = False
+            for node, neighbor, weight in index["edges"]:
+                if distances[node] + weight < distances[neighbor]:
+                    distances[neighbor] = distances[node] + weight
+                    previous_nodes[neighbor] = node
+                    changed = True
+            if not changed:
+                break
+
+        for node, neighbor, weight in index["edges"]:
+            if distances[node] + weight < distances[neighbor]:
+                return None  # Negative cycle reachable from start_node
+        return distances, previous_nodes
+
+    def query(index, start_node, end_node):
+        if start_node not in index["nodes"]:
+            return float('inf'), []
+        if start_node not in index["trees"]:
+            index["trees"][start_node] = _shortest_path_tree(index, start_node)
+        tree = index["trees"][start_node]
+        if tree is None:
+            return float('-inf'), []
+
+        distances, previous_nodes = tree
+        if distances.get(end_node, float('inf')) == float('inf'):
+            return float('inf'), []
+        if start_node == end_node:
+            return 0, [start_node]
+
+        path = [end_node]
+        while path[-1] != start_node:
+            path.append(previous_nodes[path[-1]])
+        path.reverse()
+        return distances[end_node], path
+
+    def find_shortest_path(graph, start_node, end_node):
+        return query(build_index(graph), start_node, end_node)
+''')
+
+# Hardcoded solution of each variation, used when no LLM client is configured
+SIMULATED_CODE = {
+    "dijkstra_optimal": _OPTIMAL_CODE,
+    "dijkstra_inefficient_list": _INEFFICIENT_CODE,
+    "dijkstra_buggy_edge_case": _BUGGY_CODE,
+    "bellman_ford_correct": _BELLMAN_FORD_CODE,
+    "bellman_ford_sssp_cache": _SSSP_CACHE_CODE,
+}
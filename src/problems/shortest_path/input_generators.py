@@ -2,6 +2,39 @@
 Input generators for the shortest path problem.
 """
 import random
+from typing import NamedTuple
+
+import numpy as np
+
+# Above this edge probability the vectorized generator draws a dense
+# Bernoulli mask row by row; below it, it samples edge endpoints directly.
+DENSE_THRESHOLD = 0.05
+# Number of adjacency-matrix cells drawn per chunk on the dense path.
+_DENSE_CHUNK_CELLS = 1 << 22
+# Expected out-degree of the sparse, power-law and DAG topologies.
+DEFAULT_AVG_DEGREE = 4
+# Benchmark graph families: "random" draws every edge with probability
+# edge_density; "sparse" fixes the average degree instead; "grid" is a
+# bidirectional 2D lattice (road-like); "power_law" has a heavy-tailed degree
+# distribution (scale-free); "dag" is a random directed acyclic graph.
+TOPOLOGIES = ("random", "sparse", "grid", "power_law", "dag")
+
+class CSRGraph(NamedTuple):
+    """
+    A directed, weighted graph in compressed sparse row form. The out-edges of
+    node i are indices[indptr[i]:indptr[i+1]] with matching weights.
+    """
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.indices)
 
 def generate_random_graph(num_nodes: int, edge_density: float) -> dict:
     """
@@ -26,10 +59,224 @@ def generate_random_graph(num_nodes: int, edge_density: float) -> dict:
     
     return graph
 
-def generate_shortest_path_inputs(num_nodes: int, edge_density: float):
+def _dense_edges(rng, num_nodes: int, edge_density: float):
+    """Draws every ordered pair with probability edge_density, a block of rows at a time."""
+    rows_per_chunk = max(1, _DENSE_CHUNK_CELLS // num_nodes)
+    sources, targets = [], []
+    for start in range(0, num_nodes, rows_per_chunk):
+        stop = min(start + rows_per_chunk, num_nodes)
+        mask = rng.random((stop - start, num_nodes)) < edge_density
+        # No self-loops
+        mask[np.arange(stop - start), np.arange(start, stop)] = False
+        rows, cols = np.nonzero(mask)
+        sources.append(rows + start)
+        targets.append(cols)
+    return np.concatenate(sources), np.concatenate(targets)
+
+def _sparse_edges(rng, num_nodes: int, edge_density: float):
+    """
+    Samples each node's out-degree from Binomial(n - 1, p), then draws that many
+    distinct-from-self targets. Duplicate targets are merged, which slightly
+    lowers the density; at sparse densities the effect is negligible.
+    """
+    degrees = rng.binomial(num_nodes - 1, edge_density, size=num_nodes)
+    sources = np.repeat(np.arange(num_nodes, dtype=np.int64), degrees)
+    targets = rng.integers(0, num_nodes - 1, size=len(sources), dtype=np.int64)
+    targets += targets >= sources  # skip over the source itself
+    return _unique_edges(num_nodes, sources, targets)
+
+def _unique_edges(num_nodes: int, sources, targets):
+    """Sorts edges by source, then target, and merges duplicates."""
+    keys = np.sort(sources * num_nodes + targets)
+    if len(keys):
+        distinct = np.empty(len(keys), dtype=bool)
+        distinct[0] = True
+        np.not_equal(keys[1:], keys[:-1], out=distinct[1:])
+        keys = keys[distinct]
+    return keys // num_nodes, keys % num_nodes
+
+def _csr_from_edges(rng, num_nodes: int, sources, targets, max_weight: int) -> CSRGraph:
+    """Builds a CSRGraph from edges sorted by source, with random weights 1..max_weight."""
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=num_nodes), out=indptr[1:])
+    weights = rng.integers(1, max_weight + 1, size=len(targets), dtype=np.int32)
+    return CSRGraph(indptr, np.asarray(targets).astype(np.int32), weights)
+
+def generate_random_graph_csr(num_nodes: int, edge_density: float = None, avg_degree: float = None,
+                              max_weight: int = 100, seed: int = None) -> CSRGraph:
+    """
+    Generates a random weighted, directed graph with NumPy, in CSR form.
+
+    Builds the edge set in bulk instead of looping over every node pair, so it
+    scales to 10^5-10^6 nodes at sparse densities.
+
+    Args:
+        num_nodes: The number of nodes in the graph.
+        edge_density: The probability (0.0 to 1.0) of an edge existing between
+                      any two nodes.
+        avg_degree: Alternative to edge_density: the expected out-degree of
+                    each node.
+        max_weight: Edge weights are drawn uniformly from 1..max_weight.
+        seed: Seed for the generator (or a numpy Generator to draw from); the
+              same seed gives the same graph.
+
+    Returns:
+        A CSRGraph with edges sorted by source, then target.
+    """
+    if (edge_density is None) == (avg_degree is None):
+        raise ValueError("Specify exactly one of edge_density or avg_degree.")
+    if avg_degree is not None:
+        edge_density = min(1.0, avg_degree / max(1, num_nodes - 1))
+
+    rng = np.random.default_rng(seed)
+    if num_nodes < 2 or edge_density <= 0:
+        sources = targets = np.empty(0, dtype=np.int64)
+    elif edge_density >= DENSE_THRESHOLD:
+        sources, targets = _dense_edges(rng, num_nodes, edge_density)
+    else:
+        sources, targets = _sparse_edges(rng, num_nodes, edge_density)
+
+    return _csr_from_edges(rng, num_nodes, sources, targets, max_weight)
+
+def generate_grid_graph_csr(num_nodes: int, max_weight: int = 100, seed: int = None) -> CSRGraph:
+    """
+    Generates a road-like 2D grid: nodes are laid out row by row on a
+    ceil(sqrt(n))-wide lattice and connected to their horizontal and vertical
+    neighbours in both directions.
+    """
+    rng = np.random.default_rng(seed)
+    width = max(1, int(np.ceil(np.sqrt(num_nodes))))
+    nodes = np.arange(num_nodes, dtype=np.int64)
+    right = nodes[(nodes % width != width - 1) & (nodes + 1 < num_nodes)]
+    down = nodes[nodes + width < num_nodes]
+    sources = np.concatenate([right, right + 1, down, down + width])
+    targets = np.concatenate([right + 1, right, down + width, down])
+    sources, targets = _unique_edges(num_nodes, sources, targets)
+    return _csr_from_edges(rng, num_nodes, sources, targets, max_weight)
+
+def generate_power_law_graph_csr(num_nodes: int, avg_degree: float = DEFAULT_AVG_DEGREE, exponent: float = 2.5,
+                                 max_weight: int = 100, seed: int = None) -> CSRGraph:
+    """
+    Generates a scale-free directed graph with the Chung-Lu model: both
+    endpoints of each of n * avg_degree edges are drawn with probability
+    proportional to a power-law weight, so a few hubs get most of the edges.
+
+    Args:
+        exponent: Exponent of the degree distribution (2 < exponent <= 3 is
+                  typical of real networks).
+    """
+    rng = np.random.default_rng(seed)
+    if num_nodes < 2:
+        return _csr_from_edges(rng, num_nodes, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), max_weight)
+    weight = np.arange(1, num_nodes + 1, dtype=np.float64) ** (-1.0 / (exponent - 1.0))
+    weight /= weight.sum()
+    num_edges = int(round(num_nodes * avg_degree))
+    sources = rng.choice(num_nodes, size=num_edges, p=weight)
+    targets = rng.choice(num_nodes, size=num_edges, p=weight)
+    keep = sources != targets
+    sources, targets = _unique_edges(num_nodes, sources[keep], targets[keep])
+    return _csr_from_edges(rng, num_nodes, sources, targets, max_weight)
+
+def generate_dag_csr(num_nodes: int, avg_degree: float = DEFAULT_AVG_DEGREE, max_weight: int = 100,
+                     seed: int = None) -> CSRGraph:
+    """
+    Generates a random directed acyclic graph: nodes get a random topological
+    order and each of n * avg_degree random node pairs becomes an edge from the
+    earlier to the later node.
+    """
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(num_nodes)
+    num_edges = int(round(num_nodes * avg_degree)) if num_nodes > 1 else 0
+    a = rng.integers(0, num_nodes, size=num_edges)
+    b = rng.integers(0, num_nodes, size=num_edges)
+    keep = a != b
+    a, b = a[keep], b[keep]
+    sources, targets = _unique_edges(num_nodes, order[np.minimum(a, b)], order[np.maximum(a, b)])
+    return _csr_from_edges(rng, num_nodes, sources, targets, max_weight)
+
+def generate_topology_csr(topology: str, num_nodes: int, edge_density: float = 0.5,
+                          avg_degree: float = DEFAULT_AVG_DEGREE, max_weight: int = 100, seed=None) -> CSRGraph:
+    """
+    Generates a graph of one of the TOPOLOGIES.
+
+    Args:
+        topology: The graph family, see TOPOLOGIES.
+        num_nodes: The number of nodes in the graph.
+        edge_density: Edge probability of the "random" topology.
+        avg_degree: Expected out-degree of the "sparse", "power_law" and "dag" topologies.
+        max_weight: Edge weights are drawn uniformly from 1..max_weight.
+        seed: Seed for the generator, or a numpy Generator to draw from.
+    """
+    if topology == "random":
+        return generate_random_graph_csr(num_nodes, edge_density, max_weight=max_weight, seed=seed)
+    if topology == "sparse":
+        return generate_random_graph_csr(num_nodes, avg_degree=avg_degree, max_weight=max_weight, seed=seed)
+    if topology == "grid":
+        return generate_grid_graph_csr(num_nodes, max_weight, seed)
+    if topology == "power_law":
+        return generate_power_law_graph_csr(num_nodes, avg_degree, max_weight=max_weight, seed=seed)
+    if topology == "dag":
+        return generate_dag_csr(num_nodes, avg_degree, max_weight, seed)
+    raise ValueError(f"Unknown topology {topology!r}; available: {', '.join(TOPOLOGIES)}")
+
+def expected_num_edges(topology: str, num_nodes: int, edge_density: float = 0.5,
+                       avg_degree: float = DEFAULT_AVG_DEGREE) -> float:
+    """Approximate number of edges of a generated graph, for extrapolating fitted models."""
+    if topology == "random":
+        return num_nodes * (num_nodes - 1) * edge_density
+    if topology == "grid":
+        return 4 * num_nodes
+    return num_nodes * avg_degree
+
+def csr_to_dict(csr: CSRGraph) -> dict:
+    """Converts a CSRGraph to the dict-of-dicts adjacency list used by solutions."""
+    indptr = csr.indptr.tolist()
+    indices = csr.indices.tolist()
+    weights = csr.weights.tolist()
+    return {
+        i: dict(zip(indices[indptr[i]:indptr[i + 1]], weights[indptr[i]:indptr[i + 1]]))
+        for i in range(csr.num_nodes)
+    }
+
+def generate_random_graph_fast(num_nodes: int, edge_density: float = None, avg_degree: float = None,
+                               max_weight: int = 100, seed: int = None, output: str = "dict"):
+    """
+    Vectorized counterpart of generate_random_graph.
+
+    Args:
+        output: "dict" for the dict-of-dicts adjacency list, or "csr" for a CSRGraph.
+        See generate_random_graph_csr for the other arguments.
+    """
+    csr = generate_random_graph_csr(num_nodes, edge_density, avg_degree, max_weight, seed)
+    if output == "csr":
+        return csr
+    if output == "dict":
+        return csr_to_dict(csr)
+    raise ValueError(f"Unknown output format: {output!r}")
+
+def generate_shortest_path_inputs(num_nodes: int, edge_density: float, seed=None, topology: str = "random",
+                                  avg_degree: float = DEFAULT_AVG_DEGREE):
     """
     Generates a graph and a random start/end node pair for that graph.
+
+    Args:
+        num_nodes: The number of nodes in the graph.
+        edge_density: The probability of an edge between any two nodes.
+        seed: Optional seed (anything numpy.random.default_rng accepts). When
+              given, the vectorized generator is used and the inputs are fully
+              determined by the seed; otherwise the global `random` state is
+              used (and, for other topologies than "random", fresh entropy).
+        topology: The graph family, see TOPOLOGIES.
+        avg_degree: Expected out-degree of the "sparse", "power_law" and "dag" topologies.
     """
+    if seed is not None or topology != "random":
+        rng = np.random.default_rng(seed)
+        graph = csr_to_dict(generate_topology_csr(topology, num_nodes, edge_density, avg_degree, seed=rng))
+        if not graph:
+            return graph, None, None
+        start_node, end_node = rng.integers(num_nodes, size=2).tolist()
+        return graph, start_node, end_node
+
     graph = generate_random_graph(num_nodes, edge_density)
     
     # Ensure there are nodes to choose from
@@ -42,3 +289,18 @@ def generate_shortest_path_inputs(num_nodes: int, edge_density: float):
     
     return graph, start_node, end_node
 
+
+def generate_query_batch(num_nodes: int, num_queries: int, seed=None) -> list[tuple[int, int]]:
+    """
+    Generates uniformly random (start_node, end_node) queries for one graph.
+
+    Args:
+        num_nodes: The number of nodes in the graph.
+        num_queries: The number of queries.
+        seed: Optional seed (anything numpy.random.default_rng accepts).
+    """
+    if num_nodes == 0:
+        return []
+    rng = np.random.default_rng(seed)
+    pairs = rng.integers(num_nodes, size=(num_queries, 2)).tolist()
+    return [(start_node, end_node) for start_node, end_node in pairs]
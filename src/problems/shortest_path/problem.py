@@ -0,0 +1,174 @@
+"""
+Registration of the shortest path problem, see `src.problems.registry`.
+"""
+import numpy as np
+
+from src.benchmarking.complexity import COMPLEXITY_MODELS
+from src.problems.registry import Problem
+from src.problems.shortest_path.candidates import SIMULATED_CODE, VARIATIONS
+from src.problems.shortest_path.input_generators import (
+    DEFAULT_AVG_DEGREE,
+    TOPOLOGIES,
+    CSRGraph,
+    csr_to_dict,
+    expected_num_edges,
+    generate_query_batch,
+    generate_shortest_path_inputs,
+    generate_topology_csr,
+)
+from src.problems.shortest_path.reference import find_shortest_path
+
+
+DEFAULT_INPUT_OPTIONS = {"edge_density": 0.5, "avg_degree": DEFAULT_AVG_DEGREE}
+
+
+def stored_input(store, num_nodes: int, edge_density: float, seed: tuple, topology: str = "random",
+                 avg_degree: float = DEFAULT_AVG_DEGREE):
+    """
+    Returns a graph and query from a `CorpusStore`, generating and storing it on first use.
+
+    Produces the same graph and start/end pair as
+    generate_shortest_path_inputs(num_nodes, edge_density, seed, topology, avg_degree).
+
+    Returns:
+        A tuple (csr, start_node, end_node) where csr is memory-mapped.
+    """
+    params = {
+        "generator": f"{topology}_graph",
+        "num_nodes": num_nodes,
+        "seed": list(seed),
+    }
+    # Only the parameters a topology uses are part of its key
+    if topology == "random":
+        params["edge_density"] = edge_density
+    elif topology != "grid":
+        params["avg_degree"] = avg_degree
+
+    def generate():
+        rng = np.random.default_rng(seed)
+        csr = generate_topology_csr(topology, num_nodes, edge_density, avg_degree, seed=rng)
+        start_node, end_node = rng.integers(num_nodes, size=2).tolist() if num_nodes else (None, None)
+        return csr._asdict(), {"num_edges": csr.num_edges, "start_node": start_node, "end_node": end_node}
+
+    arrays, meta = store.get(params, generate)
+    return CSRGraph(**arrays), meta["start_node"], meta["end_node"]
+
+
+def generate_input(num_nodes: int, seed: tuple, topology: str, store=None, edge_density: float = 0.5,
+                   avg_degree: float = DEFAULT_AVG_DEGREE, **_) -> tuple:
+    """Generates a (graph, start_node, end_node) benchmark input, from the store if one is given."""
+    if store is None:
+        return generate_shortest_path_inputs(num_nodes, edge_density, seed, topology, avg_degree)
+    csr, start_node, end_node = stored_input(store, num_nodes, edge_density, seed, topology, avg_degree)
+    return csr_to_dict(csr), start_node, end_node
+
+
+def path_cost(graph: dict, path: list):
+    """Sum of the edge weights along path, or None if an edge does not exist."""
+    cost = 0
+    for node, neighbor in zip(path, path[1:]):
+        if neighbor not in graph.get(node, {}):
+            return None
+        cost += graph[node][neighbor]
+    return cost
+
+
+def check_answer(args: tuple, answer, expected) -> str:
+    """
+    Validates one answer: the cost must equal the reference cost, and the path
+    must lead from the start to the end node along existing edges whose
+    weights sum to that cost.
+
+    Returns:
+        None if the answer is correct, otherwise a description of the problem.
+    """
+    graph, start_node, end_node = args
+    expected_cost = expected[0]
+    if not (isinstance(answer, (tuple, list)) and len(answer) == 2):
+        return f"returned {answer!r} instead of a (cost, path) tuple"
+    cost, path = answer
+    if cost != expected_cost:
+        return f"cost {cost!r}, expected {expected_cost!r}"
+    if expected_cost == float('inf'):
+        return None if path == [] else f"path {path!r} for an unreachable end node, expected []"
+    if not path or path[0] != start_node or path[-1] != end_node:
+        return f"path {path!r} does not lead from {start_node!r} to {end_node!r}"
+    walked = path_cost(graph, list(path))
+    if walked is None:
+        return f"path {path!r} uses an edge that does not exist"
+    if walked != cost:
+        return f"path {path!r} weighs {walked}, not the returned cost {cost!r}"
+    return None
+
+
+def fuzz_input(rng, num_nodes: int) -> tuple:
+    """
+    Draws a small fuzzing input: a graph of a random topology, density and
+    weight range, and a query. Small weight ranges make equal-cost paths
+    common; queries include start == end and unreachable end nodes.
+    """
+    topology = TOPOLOGIES[int(rng.integers(len(TOPOLOGIES)))]
+    csr = generate_topology_csr(topology, num_nodes, edge_density=float(rng.uniform(0.05, 0.6)),
+                                avg_degree=float(rng.uniform(1, 4)),
+                                max_weight=int(rng.choice([1, 3, 10, 100])), seed=rng)
+    start_node, end_node = rng.integers(csr.num_nodes, size=2).tolist()
+    if rng.random() < 0.05:
+        end_node = start_node
+    return csr_to_dict(csr), start_node, end_node
+
+
+def _induced_subgraph(graph: dict, keep: set) -> dict:
+    return {node: {n: w for n, w in adj.items() if n in keep} for node, adj in graph.items() if node in keep}
+
+
+def shrink(args: tuple):
+    """
+    Yields smaller variants of an input: graphs with chunks of halving size of
+    the nodes other than the queried ones deleted (as in delta debugging),
+    then graphs with a single edge deleted.
+    """
+    graph, start_node, end_node = args
+    nodes = [node for node in graph if node not in (start_node, end_node)]
+    chunk = max(1, len(nodes) // 2)
+    while nodes:
+        for i in range(0, len(nodes), chunk):
+            keep = set(nodes[:i] + nodes[i + chunk:]) | {start_node, end_node}
+            yield _induced_subgraph(graph, keep), start_node, end_node
+        if chunk == 1:
+            break
+        chunk //= 2
+
+    for node, neighbor in [(node, neighbor) for node, adj in graph.items() for neighbor in adj]:
+        trial = {n: dict(adj) for n, adj in graph.items()}
+        del trial[node][neighbor]
+        yield trial, start_node, end_node
+
+
+def num_edges(args: tuple) -> int:
+    """Number of edges of an input's graph."""
+    return sum(len(adj) for adj in args[0].values())
+
+
+def expected_edges(num_nodes: int, topology: str, edge_density: float = 0.5, avg_degree: float = DEFAULT_AVG_DEGREE,
+                   **_) -> float:
+    """Expected number of edges of a generated benchmark graph."""
+    return expected_num_edges(topology, num_nodes, edge_density, avg_degree)
+
+
+PROBLEM = Problem(
+    name="shortest_path",
+    entry_point="find_shortest_path",
+    generate_input=generate_input,
+    oracle=find_shortest_path,
+    check_answer=check_answer,
+    fuzz_input=fuzz_input,
+    shrink=shrink,
+    input_families=TOPOLOGIES,
+    work_size=num_edges,
+    expected_work_size=expected_edges,
+    complexity_models=COMPLEXITY_MODELS,
+    variations=VARIATIONS,
+    simulated_code=SIMULATED_CODE,
+    query_batch=generate_query_batch,
+    default_input_options=DEFAULT_INPUT_OPTIONS,
+)
@@ -0,0 +1,42 @@
+"""
+Reference solution used as the oracle of differential fuzzing.
+
+A plain binary-heap Dijkstra, kept deliberately simple so that it can be
+trusted. It is only correct for non-negative edge weights, which is all the
+input generators produce.
+"""
+import heapq
+
+
+def find_shortest_path(graph: dict, start_node, end_node):
+    """
+    Finds a shortest path from start_node to end_node.
+
+    Returns:
+        A tuple (cost, path), or (float('inf'), []) if end_node is unreachable.
+    """
+    distances = {start_node: 0}
+    previous_nodes = {}
+    queue = [(0, 0, start_node)]
+    counter = 1  # tie-breaker, so nodes themselves are never compared
+    while queue:
+        distance, _, node = heapq.heappop(queue)
+        if distance > distances[node]:
+            continue
+        if node == end_node:
+            break
+        for neighbor, weight in graph.get(node, {}).items():
+            candidate = distance + weight
+            if candidate < distances.get(neighbor, float('inf')):
+                distances[neighbor] = candidate
+                previous_nodes[neighbor] = node
+                heapq.heappush(queue, (candidate, counter, neighbor))
+                counter += 1
+
+    if end_node not in distances:
+        return float('inf'), []
+    path = [end_node]
+    while path[-1] != start_node:
+        path.append(previous_nodes[path[-1]])
+    path.reverse()
+    return distances[end_node], path
@@ -0,0 +1,70 @@
+"""
+Candidate algorithm variations for the sorting problem.
+"""
+import textwrap
+
+# Algorithm variations requested from the LLM, one prompt each
+VARIATIONS = {
+    "builtin_sorted": "Python's built-in sorted (Timsort).",
+    "merge_sort": "A top-down merge sort.",
+    "insertion_sort": "Insertion sort, which is quadratic but fast on nearly sorted input.",
+    "quicksort_buggy_duplicates": "A minimal quicksort that partitions around the first element.",
+}
+
+_BUILTIN_CODE = textwrap.dedent('''
+    def sort_list(values):
+        return sorted(values)
+''')
+
+_MERGE_SORT_CODE = textwrap.dedent('''
+    def sort_list(values):
+        if len(values) <= 1:
+            return list(values)
+        middle = len(values) // 2
+        left = sort_list(values[:middle])
+        right = sort_list(values[middle:])
+        merged = []
+        i = j = 0
+        while i < len(left) and j < len(right):
+            if left[i] <= right[j]:
+                merged.append(left[i])
+                i += 1
+            else:
+                merged.append(right[j])
+                j += 1
+        merged.extend(left[i:])
+        merged.extend(right[j:])
+        return merged
+''')
+
+_INSERTION_SORT_CODE = textwrap.dedent('''
+    def sort_list(values):
+        result = list(values)
+        for i in range(1, len(result)):
+            value = result[i]
+            j = i - 1
+            while j >= 0 and result[j] > value:
+                result[j + 1] = result[j]
+                j -= 1
+            result[j + 1] = value
+        return result
+''')
+
+# Drops the duplicates of the pivot: neither partition keeps elements equal to it
+_QUICKSORT_BUGGY_CODE = textwrap.dedent('''
+    def sort_list(values):
+        if len(values) <= 1:
+            return list(values)
+        pivot = values[0]
+        smaller = [v for v in values[1:] if v < pivot]
+        larger = [v for v in values[1:] if v > pivot]
+        return sort_list(smaller) + [pivot] + sort_list(larger)
+''')
+
+# Hardcoded solution of each variation, used when no LLM client is configured
+SIMULATED_CODE = {
+    "builtin_sorted": _BUILTIN_CODE,
+    "merge_sort": _MERGE_SORT_CODE,
+    "insertion_sort": _INSERTION_SORT_CODE,
+    "quicksort_buggy_duplicates": _QUICKSORT_BUGGY_CODE,
+}
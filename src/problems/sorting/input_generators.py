@@ -0,0 +1,26 @@
+import numpy as np
+
+# Benchmark input families: uniformly random values, already sorted, reversed
+# and random values drawn from only a few distinct keys
+DISTRIBUTIONS = ("random", "sorted", "reversed", "few_unique")
+
+def generate_list(size: int, distribution: str = "random", seed=None) -> list[int]:
+    """
+    Generates a list of integers.
+
+    Args:
+        size: The length of the list.
+        distribution: The value distribution, see DISTRIBUTIONS.
+        seed: Optional seed (anything numpy.random.default_rng accepts).
+    """
+    rng = np.random.default_rng(seed)
+    if distribution == "few_unique":
+        return rng.integers(0, 4, size=size).tolist()
+    values = rng.integers(-10 * size, 10 * size, size=size, endpoint=True)
+    if distribution == "random":
+        return values.tolist()
+    if distribution == "sorted":
+        return np.sort(values).tolist()
+    if distribution == "reversed":
+        return np.sort(values)[::-1].tolist()
+    raise ValueError(f"Unknown distribution {distribution!r}; available: {', '.join(DISTRIBUTIONS)}")
@@ -0,0 +1,79 @@
+"""
+Registration of the sorting problem, see `src.problems.registry`.
+"""
+import math
+
+from src.problems.registry import Problem
+from src.problems.sorting.candidates import SIMULATED_CODE, VARIATIONS
+from src.problems.sorting.input_generators import DISTRIBUTIONS, generate_list
+from src.problems.sorting.reference import sort_list
+
+COMPLEXITY_MODELS = {
+    "n": lambda n, m: n,
+    "n log n": lambda n, m: n * math.log2(max(n, 2)),
+    "n^2": lambda n, m: n ** 2,
+}
+
+
+def generate_input(size: int, seed: tuple, distribution: str, store=None, **_) -> tuple:
+    """Generates a (values,) benchmark input; lists are cheap to generate, so the store is not used."""
+    return (generate_list(size, distribution, seed),)
+
+
+def check_answer(args: tuple, answer, expected) -> str:
+    """
+    Validates one answer: it must be a list equal to the sorted input.
+
+    Returns:
+        None if the answer is correct, otherwise a description of the problem.
+    """
+    if not isinstance(answer, list):
+        return f"returned {type(answer).__name__} instead of a list"
+    if len(answer) != len(expected):
+        return f"returned {len(answer)} values instead of {len(expected)}"
+    if sorted(answer) != expected:
+        return "returned other values than the input's"
+    if answer != expected:
+        return "values are not in ascending order"
+    return None
+
+
+def fuzz_input(rng, size: int) -> tuple:
+    """
+    Draws a small fuzzing input of a random distribution. Values come from a
+    small range, so duplicates are common.
+    """
+    distribution = DISTRIBUTIONS[int(rng.integers(len(DISTRIBUTIONS)))]
+    values = generate_list(size - 1, distribution, rng)
+    return ([v % 7 - 3 for v in values] if distribution == "random" else values,)
+
+
+def shrink(args: tuple):
+    """Yields the list with chunks of halving size deleted, then with single values moved towards 0."""
+    values = args[0]
+    chunk = max(1, len(values) // 2)
+    while values:
+        for i in range(0, len(values), chunk):
+            yield (values[:i] + values[i + chunk:],)
+        if chunk == 1:
+            break
+        chunk //= 2
+    for i, value in enumerate(values):
+        if value != 0:
+            yield (values[:i] + [value // 2 if value > 0 else -(-value // 2)] + values[i + 1:],)
+
+
+PROBLEM = Problem(
+    name="sorting",
+    entry_point="sort_list",
+    generate_input=generate_input,
+    oracle=sort_list,
+    check_answer=check_answer,
+    fuzz_input=fuzz_input,
+    shrink=shrink,
+    input_families=DISTRIBUTIONS,
+    complexity_models=COMPLEXITY_MODELS,
+    size_start=64,
+    variations=VARIATIONS,
+    simulated_code=SIMULATED_CODE,
+)
@@ -0,0 +1,8 @@
+"""
+Reference solution used as the oracle of differential fuzzing.
+"""
+
+
+def sort_list(values: list) -> list:
+    """Returns the values in ascending order."""
+    return sorted(values)
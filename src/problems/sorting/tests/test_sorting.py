@@ -0,0 +1,60 @@
+import pytest
+from importlib import import_module
+import sys
+import os
+
+# The solution module under test. The orchestrator selects a candidate by
+# setting the AUTOALGO_SOLUTION_MODULE environment variable; run by hand, the
+# suite tests the reference solution.
+SOLUTION_MODULE_ENV_VAR = "AUTOALGO_SOLUTION_MODULE"
+SOLUTION_MODULE_PATH = "src.problems.sorting.reference"
+
+# Add the project root to the Python path to allow for absolute imports
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+@pytest.fixture
+def sort_list_func():
+    """
+    Dynamically imports the sort_list function from the module named by the
+    AUTOALGO_SOLUTION_MODULE environment variable (falling back to
+    SOLUTION_MODULE_PATH).
+    """
+    module_path = os.environ.get(SOLUTION_MODULE_ENV_VAR, SOLUTION_MODULE_PATH)
+    try:
+        solution_module = import_module(module_path)
+        return solution_module.sort_list
+    except ImportError:
+        pytest.skip(f"Could not import solution from {module_path}.")
+    except AttributeError:
+        pytest.fail(f"The solution module at {module_path} does not have a `sort_list` function.")
+
+def test_simple_list(sort_list_func):
+    """Tests a short unsorted list."""
+    assert sort_list_func([5, 2, 9, 1]) == [1, 2, 5, 9]
+
+def test_empty_and_single(sort_list_func):
+    """Tests the trivial inputs."""
+    assert sort_list_func([]) == []
+    assert sort_list_func([7]) == [7]
+
+def test_duplicates(sort_list_func):
+    """Tests that repeated values are all kept."""
+    assert sort_list_func([3, 1, 3, 2, 1, 3]) == [1, 1, 2, 3, 3, 3]
+
+def test_negative_values(sort_list_func):
+    """Tests negative values and zero."""
+    assert sort_list_func([0, -5, 4, -1]) == [-5, -1, 0, 4]
+
+def test_sorted_and_reversed(sort_list_func):
+    """Tests already sorted and reversed input."""
+    values = list(range(50))
+    assert sort_list_func(values) == values
+    assert sort_list_func(values[::-1]) == values
+
+def test_input_unchanged(sort_list_func):
+    """Tests that the input list is not modified."""
+    values = [4, 1, 3]
+    sort_list_func(values)
+    assert values == [4, 1, 3]
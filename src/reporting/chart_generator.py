@@ -7,6 +7,18 @@ import pandas as pd
 def load_json(path:Path):
     return json.loads(path.read_text(encoding="utf8"))
 
+def _plot_extrapolated(candidates, key, measured_key):
+    # dashed continuation from the last measured point through the extrapolated sizes
+    for c in candidates:
+        extrapolated = c.get(key, {})
+        measured = c.get(measured_key, {})
+        if not extrapolated or not measured:
+            continue
+        last = max(measured, key=int)
+        points = sorted([(int(last), measured[last])] + [(int(k), v) for k, v in extrapolated.items()])
+        plt.plot([p[0] for p in points], [p[1] for p in points], linestyle='--', marker='x',
+                 label=f"{c['id']} (extrapolated)")
+
 def runtime_chart(candidates, out_png:Path):
     # candidates: list with runtime_ms dicts
     # build DataFrame where rows are sizes, cols are candidate ids
@@ -23,6 +35,10 @@ def runtime_chart(candidates, out_png:Path):
     plt.figure()
     for col in df.columns:
         plt.plot(df.index.astype(int), df[col], marker='o', label=col)
+    _plot_extrapolated(candidates, "runtime_ms_extrapolated", "runtime_ms")
+    # Log-log axes: growth rates show up as slopes across the geometric size sweep
+    plt.xscale("log")
+    plt.yscale("log")
     plt.xlabel("Input size (n)")
     plt.ylabel("Runtime (ms)")
     plt.title("Runtime vs Input Size")
@@ -46,6 +62,9 @@ def memory_chart(candidates, out_png:Path):
     plt.figure()
     for col in df.columns:
         plt.plot(df.index.astype(int), df[col], marker='o', label=col)
+    _plot_extrapolated(candidates, "mem_kb_extrapolated", "mem_kb")
+    plt.xscale("log")
+    plt.yscale("log")
     plt.xlabel("Input size (n)")
     plt.ylabel("Peak memory (KB)")
     plt.title("Memory vs Input Size")
@@ -2,23 +2,43 @@
 import json
 import csv
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List
 
 def save_json(data: Dict[str,Any], path:Path):
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(data, indent=2), encoding="utf8")
 
+def _dumps_nested(value, level: int) -> str:
+    return json.dumps(value, indent=2).replace("\n", "\n" + "  " * level)
+
+def save_json_stream(data: Dict[str,Any], items: Iterable[Dict], path: Path, key: str = "candidates"):
+    # like save_json(data | {key: list(items)}), but items are serialized one at a time
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf8") as f:
+        f.write("{\n")
+        for k, v in data.items():
+            f.write(f"  {json.dumps(k)}: {_dumps_nested(v, 1)},\n")
+        f.write(f"  {json.dumps(key)}: [")
+        written = 0
+        for item in items:
+            f.write(("," if written else "") + "\n    " + _dumps_nested(item, 2))
+            written += 1
+        f.write("\n  ]\n}" if written else "]\n}")
+
 def candidates_to_csv(candidates: List[Dict], csv_path: Path):
     csv_path.parent.mkdir(parents=True, exist_ok=True)
     fieldnames = [
         "id","name","correctness","avg_runtime_ms","avg_mem_kb",
-        "norm_correctness","norm_runtime","norm_memory","final_score"
+        "runtime_exponent","norm_correctness","norm_runtime","norm_memory","norm_complexity",
+        "final_score","runtime_tie_group","extrapolated_points","cached","generation","parent_id","failed_stage","pruned"
     ]
     with open(csv_path, "w", newline='', encoding="utf8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         for c in candidates:
             row = {k: c.get(k, "") for k in fieldnames}
+            # pruned candidates record their quick-tier slowdown against the leader
+            row["pruned"] = round(c["pruned"]["slowdown"], 2) if c.get("pruned") else ""
             writer.writerow(row)
 
 if __name__ == "__main__":
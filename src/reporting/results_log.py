@@ -0,0 +1,149 @@
+"""
+Streaming results log.
+
+Every evaluated candidate is appended to experiments/<id>/results.jsonl as one
+JSON line as soon as its evaluation finishes, so other tools can tail the file
+for live progress. During the run the orchestrator only keeps each candidate's
+`summarize`d view, the few fields scoring, ranking and the optimization loop
+read. The final report is then built in two passes: the summaries are scored,
+and the full records are streamed back from the log, in score order, into
+results.json and the HTML report. Memory therefore no longer grows with the
+raw measurements (timing samples, profiles, test output) of every candidate.
+"""
+import json
+from pathlib import Path
+
+# Fields added by `scoring.compute_scores` and `scoring.rank_by_topology`
+SCORE_KEYS = (
+    "correctness", "avg_runtime_ms", "avg_mem_kb", "extrapolated_points", "runtime_exponent",
+    "norm_correctness", "norm_runtime", "norm_memory", "norm_complexity", "final_score",
+    "runtime_tie_group", "topology_ranks", "topology_runtime_ms",
+)
+
+# Fields of a candidate (or of its results) kept as they are in its summary
+_SUMMARY_KEYS = (
+    "id", "name", "correctness", "runtime_ms", "runtime_ms_extrapolated", "mem_kb", "mem_kb_extrapolated",
+    "rss_kb", "complexity", "quick", "pruned", "failed_stage", "cached", "generation", "parent_id",
+)
+
+
+def _slim_stats(runtime_stats: dict) -> dict:
+    return {k: {"median": s["median"], "ci_low": s["ci_low"], "ci_high": s["ci_high"]}
+            for k, s in (runtime_stats or {}).items()}
+
+
+def summarize(candidate: dict) -> dict:
+    """
+    The part of a candidate's results that scoring and ranking need: runtimes,
+    memory, fits, median confidence intervals, amortized batch runtimes,
+    per-topology runtimes and profiling hot spots, without raw samples,
+    allocations, test output or full profiles.
+    """
+    summary = {k: candidate[k] for k in _SUMMARY_KEYS if k in candidate}
+    if "runtime_stats" in candidate:
+        summary["runtime_stats"] = _slim_stats(candidate["runtime_stats"])
+    if candidate.get("batch"):
+        batch = candidate["batch"]
+        summary["batch"] = {
+            "sizes": {k: {"amortized_ms": v["amortized_ms"]} for k, v in batch.get("sizes", {}).items()},
+            "amortized_ms_extrapolated": batch.get("amortized_ms_extrapolated", {}),
+            "mismatches": batch.get("mismatches", []),
+        }
+    if candidate.get("topologies"):
+        summary["topologies"] = {
+            topology: {
+                "runtime_ms": sweep.get("runtime_ms", {}),
+                "runtime_ms_extrapolated": sweep.get("runtime_ms_extrapolated", {}),
+                "runtime_stats": _slim_stats(sweep.get("runtime_stats")),
+            }
+            for topology, sweep in candidate["topologies"].items()
+        }
+    if candidate.get("profile"):
+        summary["profile"] = {"hot_spots": candidate["profile"].get("hot_spots", [])}
+    return summary
+
+
+def with_scores(record: dict, scored: dict) -> dict:
+    """A full record from the log with the score fields of its scored summary."""
+    return {**record, **{k: scored[k] for k in SCORE_KEYS if k in scored}}
+
+
+class ResultsLog:
+    """
+    Append-only JSON Lines file of candidate records, one per line, keyed by
+    their "id". Records are written and flushed one at a time and read back
+    by seeking to their line, so neither side holds the whole log in memory.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path: The .jsonl file, e.g. experiments/<id>/results.jsonl.
+        """
+        self.path = Path(path)
+        self._offsets = None
+
+    def reset(self):
+        """Starts an empty log, e.g. at the beginning of a run."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text("", encoding="utf8")
+        self._offsets = {}
+
+    def append(self, record: dict):
+        """Appends one record and flushes it, so readers see it immediately."""
+        line = json.dumps(record) + "\n"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "ab") as f:
+            offset = f.tell()
+            f.write(line.encode("utf8"))
+        if self._offsets is not None:
+            self._offsets[record["id"]] = offset
+
+    def _index(self) -> dict:
+        """Byte offset of every record's line; a later record replaces an earlier one with the same id."""
+        if self._offsets is None:
+            self._offsets = {}
+            offset = 0
+            with open(self.path, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        self._offsets[json.loads(line)["id"]] = offset
+                    offset += len(line)
+        return self._offsets
+
+    def __iter__(self):
+        """Streams every record in the order it was logged."""
+        if not self.path.exists():
+            return
+        with open(self.path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def read(self, ids):
+        """Streams the records with the given ids, in that order."""
+        offsets = self._index()
+        with open(self.path, "rb") as f:
+            for record_id in ids:
+                f.seek(offsets[record_id])
+                yield json.loads(f.readline())
+
+
+class ScoredRecords:
+    """
+    Re-iterable view of the full records of scored candidates, in score order
+    and with their score fields, streamed from a `ResultsLog` on every
+    iteration (e.g. once per table of the HTML report).
+    """
+
+    def __init__(self, log: ResultsLog, scored_candidates: list[dict]):
+        self.log = log
+        self.scored_candidates = scored_candidates
+
+    def __iter__(self):
+        records = self.log.read(c["id"] for c in self.scored_candidates)
+        for record, scored in zip(records, self.scored_candidates):
+            yield with_scores(record, scored)
+
+    def __len__(self):
+        return len(self.scored_candidates)
@@ -8,6 +8,41 @@ def avg_runtime_ms(runtime_dict: Dict[str, float]) -> float:
     vals = list(runtime_dict.values())
     return sum(vals) / len(vals) if vals else float("inf")
 
+def runtime_by_size(candidate: Dict[str, Any], runtime_statistic: str = "mean") -> Dict[str, float]:
+    # measured runtimes by size, with extrapolated values filling sizes that were skipped
+    if runtime_statistic == "median" and candidate.get("runtime_stats"):
+        measured = {k: s["median"] for k, s in candidate["runtime_stats"].items()}
+    else:
+        measured = candidate.get("runtime_ms", {})
+    return {**candidate.get("runtime_ms_extrapolated", {}), **measured}
+
+def batch_runtime_by_size(candidate: Dict[str, Any]) -> Dict[str, float]:
+    # amortized per-query runtime (preprocessing plus queries) of the batch benchmarks, with
+    # extrapolated values for skipped sizes; empty if not run or the batch answers were wrong
+    batch = candidate.get("batch") or {}
+    if batch.get("mismatches"):
+        return {}
+    measured = {k: v["amortized_ms"] for k, v in batch.get("sizes", {}).items()}
+    return {**batch.get("amortized_ms_extrapolated", {}), **measured}
+
+def mem_by_size(candidate: Dict[str, Any], memory_metric: str = "traced") -> Dict[str, float]:
+    # "traced": tracemalloc heap peaks, with extrapolated values for skipped sizes;
+    # "rss": peak RSS growth measured in a fresh interpreter
+    if memory_metric == "rss":
+        return dict(candidate.get("rss_kb", {}))
+    return {**candidate.get("mem_kb_extrapolated", {}), **candidate.get("mem_kb", {})}
+
+def avg_over_sizes(values: Dict[str, float], sizes) -> float:
+    # average over the reference sizes; a size with neither a measured nor an
+    # extrapolated value counts as infinitely slow, so stopping early never helps
+    vals = [values.get(k, float("inf")) for k in sizes]
+    return sum(vals) / len(vals) if vals else float("inf")
+
+def runtime_exponent(candidate: Dict[str, Any]) -> float:
+    # fitted log-log growth exponent of runtime across sizes (lower is better)
+    fit = (candidate.get("complexity") or {}).get("runtime")
+    return fit["exponent"] if fit else float("inf")
+
 def avg_mem_kb(mem_dict: Dict[str, float]) -> float:
     vals = list(mem_dict.values())
     return sum(vals) / len(vals) if vals else float("inf")
@@ -38,22 +73,91 @@ def normalize_list(values: List[float], higher_is_better: bool = True) -> List[f
                 results.append((mx - v) / (mx - mn))
     return results
 
-def compute_scores(candidates: List[Dict[str, Any]], weights=None) -> List[Dict[str, Any]]:
+def runtimes_indistinguishable(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+    """True if two candidates' median confidence intervals overlap at every shared size."""
+    stats_a = a.get("runtime_stats") or {}
+    stats_b = b.get("runtime_stats") or {}
+    shared = set(stats_a) & set(stats_b)
+    if not shared:
+        return False
+    return all(
+        stats_a[k]["ci_low"] <= stats_b[k]["ci_high"] and stats_b[k]["ci_low"] <= stats_a[k]["ci_high"]
+        for k in shared
+    )
+
+def tie_runtimes(candidates: List[Dict[str, Any]], runtime_list: List[float]):
+    """
+    Groups candidates whose runtimes are statistically indistinguishable.
+
+    Walking from fastest to slowest, a candidate joins the current group if it
+    is indistinguishable from the group's fastest member; otherwise it starts a
+    new group. Every member gets the group leader's runtime.
+    Returns: (tied runtime list, group index per candidate or None)
+    """
+    tied = list(runtime_list)
+    groups = [None] * len(candidates)
+    leader, group = None, -1
+    for i in sorted(range(len(candidates)), key=lambda i: runtime_list[i]):
+        if runtime_list[i] == float('inf'):
+            continue
+        if leader is None or not runtimes_indistinguishable(candidates[leader], candidates[i]):
+            leader, group = i, group + 1
+        tied[i] = runtime_list[leader]
+        groups[i] = group
+    return tied, groups
+
+def compute_scores(candidates: List[Dict[str, Any]], weights=None,
+                   runtime_statistic: str = "mean", ties: bool = False,
+                   memory_metric: str = "traced", workload: str = "single") -> List[Dict[str, Any]]:
     """
     candidates: list of dicts with keys:
       - id, name
       - correctness: float (0.0-1.0)
       - runtime_ms: dict of runtimes by size
+      - runtime_stats (optional): dict of timing summaries by size, with
+        median, ci_low and ci_high
       - mem_kb: dict of memory by size
+      - complexity (optional): fitted runtime/memory models, see
+        src/benchmarking/complexity.py
+      - runtime_ms_extrapolated / mem_kb_extrapolated (optional): values for
+        sizes skipped by a time budget, predicted from the fitted curve
+    Averages are taken over every size measured for any candidate, so a
+    candidate stopped early is compared on its extrapolated values rather than
+    only on the small sizes it finished; a size it has no value for makes its
+    average infinite (worst).
+    weights: correctness, runtime and memory weights, plus an optional
+      complexity weight applied to the fitted runtime exponent.
+    runtime_statistic: "mean" averages runtime_ms; "median" averages the
+      per-size medians from runtime_stats.
+    ties: give candidates whose median CIs overlap at every size the same
+      runtime score (recorded as runtime_tie_group).
+    memory_metric: "traced" scores the tracemalloc heap peaks (mem_kb);
+      "rss" the peak RSS growth measured in a fresh interpreter (rss_kb),
+      which also counts native allocations.
+    workload: "single" scores the single-query runtimes; "batch" scores the
+      amortized per-query runtime of the batch benchmarks (candidate["batch"],
+      see src/benchmarking/batch.py), so preprocessing that pays off over many
+      queries is rewarded. Ties only apply to the single-query workload.
     Returns: same list with added keys: avg_runtime_ms, avg_mem_kb, norm_* and final_score
     """
     if weights is None:
         weights = {"correctness": 0.6, "runtime": 0.3, "memory": 0.1}
 
-    # compute averages
-    for c in candidates:
-        c["avg_runtime_ms"] = avg_runtime_ms(c.get("runtime_ms", {}))
-        c["avg_mem_kb"] = avg_mem_kb(c.get("mem_kb", {}))
+    # compute averages over the sizes measured for any candidate
+    if workload == "batch":
+        runtimes = [batch_runtime_by_size(c) for c in candidates]
+        runtime_sizes = set().union(*(r.keys() for r in runtimes))
+        ties = False
+    else:
+        runtimes = [runtime_by_size(c, runtime_statistic) for c in candidates]
+        runtime_sizes = set().union(*(c.get("runtime_ms", {}).keys() for c in candidates))
+    mem_key = "rss_kb" if memory_metric == "rss" else "mem_kb"
+    mem_sizes = set().union(*(c.get(mem_key, {}).keys() for c in candidates))
+    for c, runtime in zip(candidates, runtimes):
+        c["avg_runtime_ms"] = avg_over_sizes(runtime, runtime_sizes)
+        c["avg_mem_kb"] = avg_over_sizes(mem_by_size(c, memory_metric), mem_sizes)
+        c["extrapolated_points"] = len(runtime_sizes & set(c.get("runtime_ms_extrapolated", {})))
+        c["runtime_exponent"] = runtime_exponent(c)
         # safety defaults
         c["correctness"] = float(c.get("correctness", 0.0))
 
@@ -61,26 +165,73 @@ def compute_scores(candidates: List[Dict[str, Any]], weights=None) -> List[Dict[
     correctness_list = [c["correctness"] for c in candidates]
     runtime_list = [c["avg_runtime_ms"] for c in candidates]
     mem_list = [c["avg_mem_kb"] for c in candidates]
+    exponent_list = [c["runtime_exponent"] for c in candidates]
+    if ties:
+        runtime_list, groups = tie_runtimes(candidates, runtime_list)
+        for c, group in zip(candidates, groups):
+            c["runtime_tie_group"] = group
 
     # normalize
     n_corr = normalize_list(correctness_list, higher_is_better=True)
     n_time = normalize_list(runtime_list, higher_is_better=False)
     n_mem  = normalize_list(mem_list, higher_is_better=False)
+    n_cplx = normalize_list(exponent_list, higher_is_better=False)
 
     # compute weighted score
     for i, c in enumerate(candidates):
         c["norm_correctness"] = round(n_corr[i], 4)
         c["norm_runtime"] = round(n_time[i], 4)
         c["norm_memory"] = round(n_mem[i], 4)
+        c["norm_complexity"] = round(n_cplx[i], 4)
         score = (weights["correctness"] * n_corr[i] +
                  weights["runtime"]     * n_time[i] +
-                 weights["memory"]      * n_mem[i])
+                 weights["memory"]      * n_mem[i] +
+                 weights.get("complexity", 0.0) * n_cplx[i])
         c["final_score"] = round(score, 4)
 
     # sort candidates by score descending for convenience
     candidates.sort(key=lambda x: x["final_score"], reverse=True)
     return candidates
 
+def rank_by_topology(candidates: List[Dict[str, Any]], runtime_statistic: str = "mean",
+                     ties: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Ranks the correct candidates by runtime separately on every benchmark topology.
+
+    candidates: dicts as for compute_scores; only those with a "topologies"
+      entry (per-topology sweep results, see EvaluatorAgent) are ranked.
+    Runtimes are averaged per topology over every size measured for any
+    candidate, as in compute_scores. With ties, candidates whose median CIs
+    overlap share a rank (competition ranking: 1, 1, 3).
+    Each ranked candidate gets "topology_ranks" and "topology_runtime_ms"
+    ({topology: value}).
+    Returns: {topology: [{"id", "avg_runtime_ms", "rank"}, ...] fastest first}
+    """
+    ranked = [c for c in candidates if c.get("topologies") and float(c.get("correctness", 0.0)) == 1.0]
+    topologies = []
+    for c in ranked:
+        topologies += [t for t in c["topologies"] if t not in topologies]
+
+    rankings = {}
+    for topology in topologies:
+        sweeps = [c["topologies"].get(topology, {}) for c in ranked]
+        sizes = set().union(*(s.get("runtime_ms", {}).keys() for s in sweeps))
+        runtimes = [avg_over_sizes(runtime_by_size(s, runtime_statistic), sizes) for s in sweeps]
+        tied = tie_runtimes(sweeps, runtimes)[0] if ties else runtimes
+        order = sorted(range(len(ranked)), key=lambda i: (tied[i], runtimes[i]))
+        entries = []
+        for position, i in enumerate(order):
+            if runtimes[i] == float('inf'):
+                continue
+            rank = position + 1
+            if entries and tied[i] == tied[order[position - 1]]:
+                rank = entries[-1]["rank"]
+            entries.append({"id": ranked[i]["id"], "avg_runtime_ms": runtimes[i], "rank": rank})
+            ranked[i].setdefault("topology_ranks", {})[topology] = rank
+            ranked[i].setdefault("topology_runtime_ms", {})[topology] = runtimes[i]
+        rankings[topology] = entries
+    return rankings
+
 if __name__ == "__main__":
     # tiny local test
     sample = [
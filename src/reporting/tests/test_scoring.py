@@ -0,0 +1,29 @@
+import sys
+import os
+
+# Add the project root to the Python path to allow for absolute imports
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.reporting.scoring import compute_scores
+
+FAST = {"id": "fast", "name": "fast", "correctness": 1.0,
+        "runtime_ms": {"32": 1.0, "64": 2.0, "128": 4.0, "256": 8.0},
+        "mem_kb": {"32": 1.0, "64": 2.0, "128": 4.0, "256": 8.0}}
+
+def test_truncated_candidate_without_fit_ranks_last():
+    """Tests that a candidate stopped by the time budget after its smallest size is not scored on it alone."""
+    slow = {"id": "slow", "name": "slow", "correctness": 1.0, "runtime_ms": {"32": 5.0}, "mem_kb": {"32": 1.0}}
+    scored = compute_scores([slow, dict(FAST)])
+    assert [c["id"] for c in scored] == ["fast", "slow"]
+    assert scored[1]["avg_runtime_ms"] == float("inf")
+
+def test_truncated_candidate_is_scored_on_extrapolated_sizes():
+    """Tests that sizes skipped by the time budget count with their extrapolated runtimes."""
+    slow = {"id": "slow", "name": "slow", "correctness": 1.0,
+            "runtime_ms": {"32": 0.5, "64": 4.0}, "runtime_ms_extrapolated": {"128": 32.0, "256": 256.0},
+            "mem_kb": {"32": 1.0, "64": 2.0}, "mem_kb_extrapolated": {"128": 4.0, "256": 8.0}}
+    scored = compute_scores([slow, dict(FAST)])
+    assert [c["id"] for c in scored] == ["fast", "slow"]
+    assert scored[1]["extrapolated_points"] == 2
@@ -0,0 +1,211 @@
+"""
+Pool of long-lived sandbox worker processes for running untrusted candidate code.
+
+Workers are started up front and reused across calls, so interpreter startup
+and heavy imports are paid once per worker rather than once per candidate.
+Each worker runs under CPU-time and address-space rlimits (where the platform
+supports them), every call has a wall-clock timeout, and workers are recycled
+after a fixed number of tasks, after a task raises, or once their resident
+memory exceeds a ceiling.
+"""
+import multiprocessing
+import queue
+import traceback
+
+try:
+    import resource
+except ImportError:  # Windows: rlimits are not available
+    resource = None
+
+
+class SandboxError(RuntimeError):
+    """Raised when a task fails inside a sandbox worker or the worker dies."""
+
+
+class SandboxTimeout(SandboxError):
+    """Raised when a task exceeds its wall-clock timeout."""
+
+
+def _apply_memory_limit(memory_limit_mb):
+    if resource is None or not memory_limit_mb:
+        return
+    limit = int(memory_limit_mb * 1024 * 1024)
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _arm_cpu_limit(cpu_time_limit_s):
+    """Allows the next task cpu_time_limit_s seconds of CPU on top of what was already used."""
+    if resource is None or not cpu_time_limit_s:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = int(usage.ru_utime + usage.ru_stime + cpu_time_limit_s) + 1
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _worker_main(conn, cpu_time_limit_s, memory_limit_mb, initializer):
+    """Entry point of a sandbox worker: applies limits, then serves tasks until told to stop."""
+    _apply_memory_limit(memory_limit_mb)
+    if initializer is not None:
+        initializer()
+
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        func, args, kwargs = task
+        _arm_cpu_limit(cpu_time_limit_s)
+        try:
+            result = func(*args, **kwargs)
+            conn.send(("ok", result, _peak_rss_mb()))
+        except BaseException as e:
+            conn.send(("error", f"{type(e).__name__}: {e}\n{traceback.format_exc()}", _peak_rss_mb()))
+    conn.close()
+
+
+class _Worker:
+    """A single sandbox process and the parent end of its pipe."""
+
+    def __init__(self, ctx, args):
+        parent_conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn, *args), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        self.tasks_done = 0
+
+    def stop(self):
+        if self.process.is_alive():
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+            self.process.join(timeout=5)
+        self.kill()
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class SandboxPool:
+    """
+    A fixed-size pool of pre-forked sandbox workers.
+
+    `run` is thread-safe: callers on different threads each borrow an idle
+    worker, so a ThreadPoolExecutor of the same size keeps every worker busy.
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        max_tasks_per_worker: int = 20,
+        max_rss_mb: float = 1024,
+        memory_limit_mb: float = 4096,
+        cpu_time_limit_s: float = 300,
+        timeout_s: float = 600,
+        initializer=None,
+    ):
+        """
+        Args:
+            size: Number of worker processes.
+            max_tasks_per_worker: Recycle a worker after this many tasks.
+            max_rss_mb: Recycle a worker once its peak resident memory exceeds this.
+            memory_limit_mb: Address-space rlimit applied to each worker.
+            cpu_time_limit_s: CPU-time rlimit granted to each task.
+            timeout_s: Default wall-clock timeout for each task.
+            initializer: Optional picklable callable run once in every new worker,
+                         e.g. to pre-import heavy modules.
+        """
+        self.size = max(1, size)
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_rss_mb = max_rss_mb
+        self.timeout_s = timeout_s
+        self._ctx = multiprocessing.get_context()
+        self._worker_args = (cpu_time_limit_s, memory_limit_mb, initializer)
+        self._idle = queue.Queue()
+        self._workers = set()
+        for _ in range(self.size):
+            self._idle.put(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._ctx, self._worker_args)
+        self._workers.add(worker)
+        return worker
+
+    def _retire(self, worker: _Worker, kill: bool = False):
+        self._workers.discard(worker)
+        if kill:
+            worker.kill()
+        else:
+            worker.stop()
+
+    def run(self, func, *args, timeout: float = None, **kwargs):
+        """
+        Runs func(*args, **kwargs) in a sandbox worker and returns its result.
+
+        Args:
+            func: A picklable (module-level) callable.
+            timeout: Wall-clock timeout in seconds; defaults to the pool's timeout_s.
+
+        Raises:
+            SandboxTimeout: If the call did not finish in time. The worker is killed.
+            SandboxError: If the call raised or the worker died, e.g. by exceeding
+                          its CPU-time or memory limit.
+        """
+        timeout = self.timeout_s if timeout is None else timeout
+        worker = self._idle.get()
+        replacement = worker
+        try:
+            try:
+                worker.conn.send((func, args, kwargs))
+                if not worker.conn.poll(timeout):
+                    self._retire(worker, kill=True)
+                    replacement = self._spawn()
+                    raise SandboxTimeout(f"Sandboxed call ran for more than {timeout} seconds.")
+                status, payload, peak_rss_mb = worker.conn.recv()
+            except (EOFError, OSError) as e:
+                self._retire(worker, kill=True)
+                exitcode = worker.process.exitcode
+                replacement = self._spawn()
+                raise SandboxError(f"Sandbox worker exited unexpectedly (exit code {exitcode}): {e}") from e
+
+            worker.tasks_done += 1
+            if (status != "ok"
+                    or worker.tasks_done >= self.max_tasks_per_worker
+                    or (self.max_rss_mb and peak_rss_mb > self.max_rss_mb)):
+                self._retire(worker)
+                replacement = self._spawn()
+            if status != "ok":
+                raise SandboxError(payload)
+            return payload
+        finally:
+            self._idle.put(replacement)
+
+    def close(self):
+        """Stops all workers."""
+        for worker in list(self._workers):
+            self._retire(worker)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,144 @@
+"""
+Correctness runners that execute a problem's pytest suite in-process.
+
+Spawning `py -m pytest` per candidate pays interpreter startup and pytest
+import on every call. The runners here keep pytest loaded in a long-lived
+process and report structured, per-test results instead of a pass/fail flag
+scraped from stdout.
+"""
+import contextlib
+import importlib
+import io
+import os
+import sys
+
+from src.sandbox import SandboxPool, SandboxError
+
+# Environment variable the test suites read to locate the solution under test.
+SOLUTION_MODULE_ENV_VAR = "AUTOALGO_SOLUTION_MODULE"
+
+
+class _ResultCollector:
+    """pytest plugin that records the outcome of every test."""
+
+    def __init__(self):
+        self.tests = []
+
+    def pytest_runtest_logreport(self, report):
+        # A test is reported once: at "call", or at "setup" if it never got that far.
+        if report.when == "call" or (report.when == "setup" and report.outcome != "passed"):
+            self.tests.append({
+                "name": report.nodeid.split("::")[-1],
+                "outcome": report.outcome,
+                "duration_s": report.duration,
+                "message": report.longreprtext if report.failed else "",
+            })
+
+
+def run_test_suite(test_path: str, solution_module_path: str) -> dict:
+    """
+    Runs a pytest suite against a solution module in the current process.
+
+    Args:
+        test_path: The file path to the pytest test suite.
+        solution_module_path: The import path for the solution to be tested.
+
+    Returns:
+        A dictionary with the number of tests run and passed, the pass rate,
+        the per-test results and the captured pytest output.
+    """
+    import pytest
+
+    os.environ[SOLUTION_MODULE_ENV_VAR] = solution_module_path
+    # Solution files are written after this process started; make sure the
+    # import system sees them and does not reuse a previous candidate's module.
+    importlib.invalidate_caches()
+    sys.modules.pop(solution_module_path, None)
+
+    collector = _ResultCollector()
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            exit_code = pytest.main(
+                [test_path, "-q", "-p", "no:cacheprovider"],
+                plugins=[collector],
+            )
+    finally:
+        sys.modules.pop(solution_module_path, None)
+
+    num_tests = len(collector.tests)
+    num_passed = sum(1 for t in collector.tests if t["outcome"] == "passed")
+    return {
+        "passed": num_tests > 0 and num_passed == num_tests,
+        "num_tests": num_tests,
+        "num_passed": num_passed,
+        "pass_rate": num_passed / num_tests if num_tests else 0.0,
+        "tests": collector.tests,
+        "details": output.getvalue(),
+        "exit_code": int(exit_code),
+    }
+
+
+def _failed_run(message: str) -> dict:
+    return {
+        "passed": False,
+        "num_tests": 0,
+        "num_passed": 0,
+        "pass_rate": 0.0,
+        "tests": [],
+        "details": message,
+        "exit_code": -1,
+    }
+
+
+class InProcessTestRunner:
+    """
+    Runs the suite directly in the calling process. Intended for processes
+    that are already isolated workers, such as the orchestrator's pool.
+    """
+
+    def run(self, test_path: str, solution_module_path: str, timeout: float = None) -> dict:
+        return run_test_suite(test_path, solution_module_path)
+
+    def close(self):
+        pass
+
+
+def preload_pytest():
+    """Sandbox worker initializer that pays the pytest import once, up front."""
+    import pytest  # noqa: F401
+
+
+class WarmTestRunner:
+    """
+    Runs the suite in a single long-lived sandbox worker.
+
+    The worker imports pytest once and then serves one candidate after another,
+    so the startup cost is paid once per session. If a run exceeds its timeout
+    or the worker dies, the worker is replaced and the run is reported as failed.
+    """
+
+    def __init__(self, **sandbox_options):
+        """
+        Args:
+            sandbox_options: Keyword arguments forwarded to `SandboxPool`.
+        """
+        self._pool = SandboxPool(size=1, initializer=preload_pytest, **sandbox_options)
+
+    def run(self, test_path: str, solution_module_path: str, timeout: float = None) -> dict:
+        """
+        Runs the suite in the worker and returns the structured results.
+
+        Args:
+            test_path: The file path to the pytest test suite.
+            solution_module_path: The import path for the solution to be tested.
+            timeout: Optional timeout in seconds.
+        """
+        try:
+            return self._pool.run(run_test_suite, test_path, solution_module_path, timeout=timeout)
+        except SandboxError as e:
+            return _failed_run(str(e))
+
+    def close(self):
+        """Stops the worker process."""
+        self._pool.close()
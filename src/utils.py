@@ -1,14 +1,19 @@
 
+import json
+import os
 import subprocess
 import sys
+import tempfile
 
-def run_shell_command(command: str, timeout: int = None) -> dict:
+def run_shell_command(command: str, timeout: int = None, env: dict = None) -> dict:
     """
     Executes a shell command and returns its output.
 
     Args:
         command: The command to execute.
         timeout: Optional timeout in seconds.
+        env: Optional extra environment variables, added on top of the
+             current process environment.
 
     Returns:
         A dictionary containing stdout, stderr, and the return code.
@@ -25,7 +30,8 @@ def run_shell_command(command: str, timeout: int = None) -> dict:
             capture_output=True, 
             text=True, 
             check=False,
-            timeout=timeout
+            timeout=timeout,
+            env={**os.environ, **env} if env else None
         )
         return {
             "stdout": result.stdout,
@@ -44,3 +50,20 @@ def run_shell_command(command: str, timeout: int = None) -> dict:
             "stderr": str(e),
             "returncode": 1
         }
+
+def write_json_atomic(path, data, indent: int = None):
+    """
+    Writes data as JSON to path so that readers never see a partial file: the
+    JSON goes to a temporary file in the same directory which then replaces path.
+    """
+    directory = os.path.dirname(os.fspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf8") as f:
+            json.dump(data, f, indent=indent)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise